@@ -0,0 +1,74 @@
+# gui/benchmarks/bench_decode_pool.py
+"""
+Paralel decode havuzu ölçekleme benchmark'ı
+1080p ve üstü frame'leri 1..N worker ile (thread ve process modunda)
+decode edip sıralı teslim edilen frame/s değerini raporlar
+
+Kullanım: python benchmarks/bench_decode_pool.py [max_workers]
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_jpeg_decode_scale import make_test_jpeg
+from communication.decode_pool import OrderedDecodePool, decode_in_process
+from communication.jpeg_decoders import OpenCVDecoder
+
+SOURCE_SIZES = [(1920, 1080), (2592, 1944)]
+FRAMES = 120
+
+
+def run(jpeg: bytes, workers: int, mode: str) -> tuple:
+    """(frame/s, geç atılan frame) döndürür"""
+    done = threading.Event()
+    decoder = OpenCVDecoder()
+
+    def on_result(seq, context, frame):
+        if seq == FRAMES - 1:
+            done.set()
+
+    def on_late(seq, context):
+        if seq == FRAMES - 1:
+            done.set()
+
+    pool = OrderedDecodePool(on_result, workers=workers, mode=mode, on_late=on_late)
+    if mode == 'process':
+        # Worker süreçlerini ısındır (başlatma süresi ölçüme girmesin)
+        for seq in range(workers):
+            pool._executor.submit(decode_in_process, decoder.name, jpeg, 1).result()
+
+    t0 = time.perf_counter()
+    for seq in range(FRAMES):
+        if mode == 'process':
+            pool.submit(seq, None, decode_in_process, decoder.name, jpeg, 1)
+        else:
+            pool.submit(seq, None, decoder.decode, jpeg, 1)
+    done.wait(timeout=60)
+    elapsed = time.perf_counter() - t0
+    late = pool.late_drops
+    pool.close()
+    return FRAMES / elapsed, late
+
+
+def main():
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 4)
+    print(f"Decode havuzu ölçekleme ({FRAMES} frame, sıralı teslim)")
+
+    for width, height in SOURCE_SIZES:
+        jpeg = make_test_jpeg(width, height)
+        print(f"[{width}x{height}] {len(jpeg) / 1024:.0f} KB")
+        for mode in ('thread', 'process'):
+            base = None
+            for workers in range(1, max_workers + 1):
+                fps, late = run(jpeg, workers, mode)
+                base = base or fps
+                print(f"  {mode:<7} {workers:>2} worker: {fps:7.1f} frame/s "
+                      f"(x{fps / base:4.2f}, geç atılan {late})")
+
+
+if __name__ == "__main__":
+    main()
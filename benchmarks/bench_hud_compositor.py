@@ -0,0 +1,75 @@
+# gui/benchmarks/bench_hud_compositor.py
+"""
+HUD birleştirme benchmark'ı
+Her frame'de HUD'u PIL ile çizmek (eski yaklaşım) ile önbellekli
+premultiplied katmanların ROI üzerinde numpy ile karıştırılmasını
+(HUDCompositor) frame başına süre olarak karşılaştırır
+
+Kullanım: python benchmarks/bench_hud_compositor.py
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.hud_compositor import HUDCompositor, load_hud_font
+
+FRAME_SIZES = [(640, 480), (1280, 720), (1920, 1080)]
+REPEAT = 50
+PHASE_NAME = "SKYSHIELD - AŞAMA 1"
+
+
+def draw_with_pil(frame: np.ndarray, font, i: int) -> np.ndarray:
+    """Eski yaklaşım: her frame'de tüm HUD'u PIL ile çiz"""
+    height, width = frame.shape[:2]
+    image = Image.fromarray(frame)
+    draw = ImageDraw.Draw(image, 'RGBA')
+    cx, cy = width // 2, height // 2
+    draw.line((cx - 30, cy, cx + 30, cy), fill=(0, 255, 136, 220), width=2)
+    draw.line((cx, cy - 30, cx, cy + 30), fill=(0, 255, 136, 220), width=2)
+    for k in (1, 2):
+        draw.line((width * k // 3, 0, width * k // 3, height), fill=(255, 255, 255, 60))
+        draw.line((0, height * k // 3, width, height * k // 3), fill=(255, 255, 255, 60))
+    draw.rectangle((0, 0, width, 26), fill=(0, 0, 0, 150))
+    draw.text((width // 2 - 80, 5), PHASE_NAME, font=font, fill=(255, 255, 0, 255))
+    draw.text((10, height - 28), f"PAN {i // 10:+.1f}°  TILT +0.0°", font=font, fill=(255, 255, 0, 255))
+    return np.asarray(image)
+
+
+def main():
+    font = load_hud_font(16)
+    print(f"HUD benchmark'ı ({REPEAT} frame, ms/frame; telemetri her 10 frame'de değişir)")
+
+    for width, height in FRAME_SIZES:
+        frame = np.random.randint(0, 256, (height, width, 3), dtype=np.uint8)
+        print(f"[{width}x{height}]")
+
+        start = time.perf_counter()
+        for i in range(REPEAT):
+            draw_with_pil(frame.copy(), font, i)
+        pil_ms = (time.perf_counter() - start) * 1000 / REPEAT
+
+        hud = HUDCompositor(PHASE_NAME)
+        start = time.perf_counter()
+        for i in range(REPEAT):
+            hud.set_text('telemetry', f"PAN {i // 10:+.1f}°  TILT +0.0°", (10, height - 28))
+            hud.composite(frame.copy())
+        hud_ms = (time.perf_counter() - start) * 1000 / REPEAT
+
+        copy_start = time.perf_counter()
+        for _ in range(REPEAT):
+            frame.copy()
+        copy_ms = (time.perf_counter() - copy_start) * 1000 / REPEAT
+
+        print(f"  PIL (her frame)  : {pil_ms:7.2f} ms")
+        print(f"  HUDCompositor    : {hud_ms:7.2f} ms  ({pil_ms / hud_ms:4.1f}x, kopya {copy_ms:.2f} ms dahil)")
+        print(f"  yeniden çizim    : {hud.text_renders} metin, {hud.static_renders} statik")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# gui/benchmarks/bench_jpeg_decode_scale.py
+"""
+Küçültülmüş JPEG decode benchmark'ı
+Her kaynak çözünürlük için IMREAD_COLOR ve IMREAD_REDUCED_COLOR_2/4/8 ile
+(ve Pillow draft modu ile) frame başına decode süresini ms olarak raporlar
+
+Kullanım: python benchmarks/bench_jpeg_decode_scale.py
+"""
+
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+from PIL import Image
+import io
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from communication.jpeg_scaling import jpeg_dimensions, pick_reduction
+
+SOURCE_SIZES = [(1280, 720), (1920, 1080), (2592, 1944)]
+DISPLAY_SIZE = (735, 490)
+REPEAT = 30
+
+CV2_FLAGS = [
+    (1, cv2.IMREAD_COLOR),
+    (2, cv2.IMREAD_REDUCED_COLOR_2),
+    (4, cv2.IMREAD_REDUCED_COLOR_4),
+    (8, cv2.IMREAD_REDUCED_COLOR_8),
+]
+
+
+def make_test_jpeg(width: int, height: int, quality: int = 85) -> bytes:
+    """Gradyan + gürültüden oluşan, kamera görüntüsüne benzer test JPEG'i"""
+    x = np.linspace(0, 255, width, dtype=np.float32)
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    base = (x + y) / 2
+    image = np.dstack([base, np.flipud(base), np.fliplr(base)])
+    image += np.random.normal(0, 12, image.shape)
+    image = np.clip(image, 0, 255).astype(np.uint8)
+    ok, encoded = cv2.imencode('.jpg', image, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    return encoded.tobytes()
+
+
+def time_it(func) -> float:
+    """Ortalama süre (ms)"""
+    func()  # ısınma
+    t0 = time.perf_counter()
+    for _ in range(REPEAT):
+        func()
+    return (time.perf_counter() - t0) / REPEAT * 1000
+
+
+def pillow_draft_decode(jpeg: bytes, scale: int):
+    """Pillow draft modu: libjpeg ölçekleme ile decode"""
+    img = Image.open(io.BytesIO(jpeg))
+    if scale > 1:
+        img.draft('RGB', (img.width // scale, img.height // scale))
+    return np.asarray(img.convert('RGB'))
+
+
+def main():
+    print(f"JPEG decode ölçek benchmark'ı ({REPEAT} tekrar, ms/frame)")
+    for width, height in SOURCE_SIZES:
+        jpeg = make_test_jpeg(width, height)
+        arr = np.frombuffer(jpeg, np.uint8)
+        chosen = pick_reduction(jpeg_dimensions(jpeg), DISPLAY_SIZE)
+        print(f"[{width}x{height}] {len(jpeg) / 1024:.0f} KB - "
+              f"{DISPLAY_SIZE[0]}x{DISPLAY_SIZE[1]} görüntü için seçilen ölçek: 1/{chosen}")
+        for scale, flag in CV2_FLAGS:
+            cv_ms = time_it(lambda: cv2.imdecode(arr, flag))
+            pil_ms = time_it(lambda: pillow_draft_decode(jpeg, scale))
+            out = cv2.imdecode(arr, flag)
+            mark = " <-" if scale == chosen else ""
+            print(f"  1/{scale}: {out.shape[1]:>4}x{out.shape[0]:<4} "
+                  f"cv2 {cv_ms:7.2f} ms  pillow draft {pil_ms:7.2f} ms{mark}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# gui/benchmarks/bench_jpeg_decoders.py
+"""
+JPEG decoder backend benchmark'ı
+Kullanılabilen her backend (opencv, pillow, turbojpeg) için farklı kaynak
+çözünürlüklerinde ve DCT ölçeklerinde frame başına decode süresini raporlar,
+client'ın 'auto' modda seçeceği backend'i gösterir
+
+Kullanım: python benchmarks/bench_jpeg_decoders.py
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_jpeg_decode_scale import make_test_jpeg
+from communication.jpeg_decoders import available_decoders, benchmark_decoders, select_fastest_decoder
+
+SOURCE_SIZES = [(640, 480), (1280, 720), (1920, 1080)]
+SCALES = [1, 2, 4]
+REPEAT = 30
+
+
+def main():
+    decoders = available_decoders()
+    print(f"JPEG decoder benchmark'ı ({REPEAT} tekrar, ms/frame)")
+    print(f"Backend'ler: {', '.join(decoders)}")
+
+    for width, height in SOURCE_SIZES:
+        jpeg = make_test_jpeg(width, height)
+        print(f"[{width}x{height}] {len(jpeg) / 1024:.0f} KB")
+        for scale in SCALES:
+            results = benchmark_decoders(jpeg, scale, REPEAT, list(decoders.values()))
+            line = "  ".join(f"{name} {ms:7.2f} ms" for name, ms in results.items())
+            print(f"  1/{scale}: {line}")
+
+        best, _ = select_fastest_decoder(jpeg)
+        print(f"  auto seçimi: {best.name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# gui/benchmarks/bench_mjpeg_parser.py
+"""
+MJPEG ayrıştırıcı mikro benchmark'ı
+Sentetik akış üzerinde MB/s ve frame/s raporlar, eski (quadratic)
+buffer += chunk yaklaşımı ile karşılaştırır
+
+Kullanım: python benchmarks/bench_mjpeg_parser.py [frame_boyutu_kb] [frame_sayısı]
+"""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from communication.mjpeg_parser import MJPEGStreamParser
+from benchmarks.synthetic_mjpeg import make_fake_jpeg, build_stream, chunked
+
+
+def legacy_extract(stream: bytes, chunk_size: int = 4096) -> int:
+    """Eski _stream_loop mantığı: buffer büyütülür ve baştan taranır"""
+    buffer = b""
+    boundary = b'--frame'
+    count = 0
+    for chunk in chunked(stream, chunk_size):
+        buffer += chunk
+        while len(buffer) > 1024:
+            start_idx = buffer.find(boundary)
+            if start_idx == -1:
+                break
+            next_idx = buffer.find(boundary, start_idx + len(boundary))
+            if next_idx == -1:
+                break
+            frame_data = buffer[start_idx:next_idx]
+            jpeg_start = frame_data.find(b'\xff\xd8')
+            jpeg_end = frame_data.find(b'\xff\xd9')
+            if jpeg_start != -1 and jpeg_end != -1 and jpeg_end > jpeg_start:
+                count += 1
+            buffer = buffer[next_idx:]
+    return count
+
+
+def parser_extract(stream: bytes, chunk_size: int = 4096) -> int:
+    """MJPEGStreamParser ile çıkarım"""
+    parser = MJPEGStreamParser()
+    count = 0
+    for chunk in chunked(stream, chunk_size):
+        count += len(parser.feed(chunk))
+    return count
+
+
+def run(name, func, stream: bytes, repeat: int = 3):
+    """En iyi süreyi ölç ve raporla"""
+    best = float('inf')
+    frames = 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        frames = func(stream)
+        best = min(best, time.perf_counter() - t0)
+    mb_s = len(stream) / best / 1e6
+    fps = frames / best
+    print(f"  {name:<28} {mb_s:9.1f} MB/s {fps:10.0f} frame/s ({frames} frame)")
+
+
+def main():
+    frame_kb = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    frame_total = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+
+    jpegs = [make_fake_jpeg(frame_kb * 1024) for _ in range(frame_total)]
+
+    print(f"MJPEG parser benchmark: {frame_total} frame x {frame_kb} KB")
+    for with_length in (True, False):
+        stream = build_stream(jpegs, with_length=with_length)
+        label = "Content-Length var" if with_length else "Content-Length yok"
+        print(f"[{label}] akış boyutu: {len(stream) / 1e6:.1f} MB")
+        run("legacy buffer += chunk", legacy_extract, stream)
+        run("MJPEGStreamParser", parser_extract, stream)
+
+
+if __name__ == "__main__":
+    main()
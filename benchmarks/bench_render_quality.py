@@ -0,0 +1,52 @@
+# gui/benchmarks/bench_render_quality.py
+"""
+Kamera görüntüsü render kalite seviyeleri benchmark'ı
+Eski yol (PIL fromarray + LANCZOS resize) ile render worker'ın kalite
+seviyelerini (nearest, bilinear, area, lanczos) frame başına süre olarak karşılaştırır
+
+Kullanım: python benchmarks/bench_render_quality.py
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+from PIL import Image
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.frame_renderer import RENDER_QUALITIES, render_rgb
+
+SOURCE_SIZES = [(640, 480), (1280, 720), (1920, 1080)]
+DISPLAY_SIZE = (735, 490)
+REPEAT = 50
+
+
+def time_ms(fn, repeat: int = REPEAT) -> float:
+    fn()  # ısınma
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main():
+    width, height = DISPLAY_SIZE
+    out = np.empty((height, width, 3), dtype=np.uint8)
+    print(f"Render benchmark'ı (hedef {width}x{height}, {REPEAT} tekrar, ms/frame)")
+
+    for src_width, src_height in SOURCE_SIZES:
+        bgr = np.random.randint(0, 256, (src_height, src_width, 3), dtype=np.uint8)
+        rgb = bgr[:, :, ::-1].copy()
+        print(f"[{src_width}x{src_height}]")
+
+        legacy = time_ms(lambda: Image.fromarray(rgb).resize(DISPLAY_SIZE, Image.Resampling.LANCZOS))
+        print(f"  PIL LANCZOS (eski yol): {legacy:7.2f} ms")
+        for quality in RENDER_QUALITIES:
+            ms = time_ms(lambda: render_rgb(bgr, 'BGR', DISPLAY_SIZE, quality, out=out))
+            print(f"  {quality:<8} (BGR->RGB): {ms:7.2f} ms  ({legacy / ms:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
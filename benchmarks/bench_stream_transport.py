@@ -0,0 +1,86 @@
+# gui/benchmarks/bench_stream_transport.py
+"""
+MJPEG taşıma katmanı benchmark'ı: requests.iter_content vs socket recv_into
+Yerel sunucudan farklı frame boyutlarında akış alınır, MB/s ve frame/s raporlanır
+
+Kullanım: python benchmarks/bench_stream_transport.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from communication.mjpeg_parser import MJPEGStreamParser
+from communication.raw_socket_stream import RawSocketStreamConnection
+from benchmarks.synthetic_mjpeg import make_fake_jpeg, build_stream, serve_stream
+
+try:
+    import requests
+except ImportError:
+    requests = None
+
+FRAME_SIZES_KB = [25, 100, 400, 1000]
+STREAM_MB = 200
+
+
+def receive_requests(port: int) -> int:
+    """Mevcut yol: requests + iter_content(4096) + parser.feed"""
+    parser = MJPEGStreamParser(capacity=8 * 1024 * 1024)
+    frames = 0
+    response = requests.get(f"http://127.0.0.1:{port}", stream=True, timeout=10)
+    try:
+        for chunk in response.iter_content(chunk_size=4096):
+            frames += len(parser.feed(chunk))
+    finally:
+        response.close()
+    return frames
+
+
+def receive_raw_socket(port: int) -> int:
+    """Alternatif yol: socket.recv_into ile parser buffer'ına okuma"""
+    parser = MJPEGStreamParser(capacity=8 * 1024 * 1024)
+    frames = 0
+    conn = RawSocketStreamConnection("127.0.0.1", port, timeout=10).open()
+    try:
+        while True:
+            parts = conn.read_parts(parser)
+            if parts is None:
+                break
+            frames += len(parts)
+    finally:
+        conn.close()
+    return frames
+
+
+def measure(name, func, stream: bytes, repeat: int):
+    """Tek bir bağlantı üzerinden tüm akışı al ve süreyi ölç"""
+    server, port = serve_stream(stream, repeat=repeat)
+    try:
+        t0 = time.perf_counter()
+        frames = func(port)
+        elapsed = time.perf_counter() - t0
+    finally:
+        server.shutdown()
+        server.server_close()
+    total = len(stream) * repeat
+    print(f"  {name:<22} {total / elapsed / 1e6:9.1f} MB/s {frames / elapsed:9.0f} frame/s")
+
+
+def main():
+    if requests is None:
+        print("requests yüklü değil - sadece raw socket yolu ölçülecek")
+
+    for size_kb in FRAME_SIZES_KB:
+        jpegs = [make_fake_jpeg(size_kb * 1024) for _ in range(20)]
+        stream = build_stream(jpegs)
+        repeat = max(1, int(STREAM_MB * 1e6 / len(stream)))
+        print(f"[{size_kb} KB frame] {repeat * len(jpegs)} frame, ~{STREAM_MB} MB")
+        if requests is not None:
+            measure("requests iter_content", receive_requests, stream, repeat)
+        measure("socket recv_into", receive_raw_socket, stream, repeat)
+
+
+if __name__ == "__main__":
+    main()
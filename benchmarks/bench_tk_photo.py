@@ -0,0 +1,96 @@
+# gui/benchmarks/bench_tk_photo.py
+"""
+Tk görüntü güncelleme benchmark'ı
+Eski yol (her frame'de yeni ImageTk.PhotoImage + label.configure) ile
+kalıcı PhotoImage'a paste() (TkPhotoSurface) yolunu karşılaştırır:
+sürdürülebilir FPS ve frame başına Tk thread süresi (piksel yükleme ve
+boyama dahil) raporlanır
+
+Kullanım: python benchmarks/bench_tk_photo.py   (ekran / DISPLAY gerekir)
+Ekransız makinede: xvfb-run python benchmarks/bench_tk_photo.py
+"""
+
+import os
+import sys
+import time
+import tkinter as tk
+
+import numpy as np
+from PIL import Image, ImageTk
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.photo_surface import TkPhotoSurface
+
+DISPLAY_SIZES = [(640, 480), (735, 490), (1280, 720)]
+FRAMES = 200
+FRAME_POOL = 8  # Farklı içerikli frame sayısı (Tk aynı görüntüyü atlamasın)
+
+
+def make_frames(width: int, height: int):
+    return [np.random.randint(0, 256, (height, width, 3), dtype=np.uint8) for _ in range(FRAME_POOL)]
+
+
+def run_new_photo(root: tk.Tk, label: tk.Label, frames) -> dict:
+    """Eski yol: her frame'de yeni PhotoImage"""
+    upload = 0.0
+    start = time.perf_counter()
+    for i in range(FRAMES):
+        t0 = time.perf_counter()
+        photo = ImageTk.PhotoImage(Image.fromarray(frames[i % FRAME_POOL]))
+        label.configure(image=photo)
+        label.image = photo
+        upload += time.perf_counter() - t0
+        root.update()
+    total = time.perf_counter() - start
+    return {'fps': FRAMES / total, 'tk_ms': total * 1000 / FRAMES, 'upload_ms': upload * 1000 / FRAMES}
+
+
+def run_paste(root: tk.Tk, label: tk.Label, frames) -> dict:
+    """Yeni yol: kalıcı PhotoImage + paste()"""
+    surface = TkPhotoSurface()
+    current = None
+    upload = 0.0
+    start = time.perf_counter()
+    for i in range(FRAMES):
+        t0 = time.perf_counter()
+        photo, _ = surface.update(frames[i % FRAME_POOL])
+        if photo is not current:
+            label.configure(image=photo)
+            label.image = photo
+            current = photo
+        upload += time.perf_counter() - t0
+        root.update()
+    total = time.perf_counter() - start
+    return {'fps': FRAMES / total, 'tk_ms': total * 1000 / FRAMES, 'upload_ms': upload * 1000 / FRAMES}
+
+
+def main():
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"Tk başlatılamadı (ekran yok?): {e}")
+        return
+
+    label = tk.Label(root, bg="#000000")
+    label.pack()
+    print(f"Tk PhotoImage benchmark'ı ({FRAMES} frame)")
+
+    for width, height in DISPLAY_SIZES:
+        frames = make_frames(width, height)
+        print(f"[{width}x{height}]")
+        results = []
+        for name, runner in (("yeni PhotoImage", run_new_photo), ("paste()       ", run_paste)):
+            result = runner(root, label, frames)
+            results.append(result)
+            print(f"  {name}: {result['fps']:6.1f} FPS  Tk thread {result['tk_ms']:6.2f} ms/frame"
+                  f"  (yükleme {result['upload_ms']:5.2f} ms)")
+        before, after = results
+        print(f"  paste() farkı : {after['fps'] / before['fps']:.2f}x FPS, "
+              f"Tk thread {before['tk_ms'] - after['tk_ms']:+.2f} ms/frame kazanç")
+
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# gui/benchmarks/synthetic_mjpeg.py
+"""
+Benchmark'lar için sentetik MJPEG akışı üretici
+Gerçek JPEG gerekmeyen ölçümlerde SOI/EOI ile sarılmış rastgele veri kullanılır
+"""
+
+import os
+from typing import List
+
+BOUNDARY = b'--frame'
+
+
+def make_fake_jpeg(size: int) -> bytes:
+    """SOI/EOI işaretli, içinde boundary geçmeyen sahte JPEG verisi"""
+    body = os.urandom(max(size - 4, 0)).replace(b'-', b'_')
+    return b'\xff\xd8' + body + b'\xff\xd9'
+
+
+def build_stream(frames: List[bytes], with_length: bool = True,
+                 boundary: bytes = BOUNDARY) -> bytes:
+    """Frame listesinden multipart/x-mixed-replace gövdesi oluştur"""
+    parts = []
+    for jpeg in frames:
+        header = b'Content-Type: image/jpeg\r\n'
+        if with_length:
+            header += b'Content-Length: %d\r\n' % len(jpeg)
+        parts.append(boundary + b'\r\n' + header + b'\r\n' + jpeg + b'\r\n')
+    return b''.join(parts)
+
+
+def chunked(data: bytes, chunk_size: int = 4096):
+    """Veriyi ağdan geliyormuş gibi sabit boyutlu parçalara böl"""
+    view = memoryview(data)
+    for i in range(0, len(data), chunk_size):
+        yield view[i:i + chunk_size]
+
+
+def serve_stream(stream: bytes, repeat: int = 1, boundary: bytes = BOUNDARY):
+    """
+    Sentetik akışı yerel bir HTTP sunucusundan yayınla
+    (sunucu, port) döndürür - sunucu ayrı thread'de tek bağlantıya hizmet eder
+    """
+    import socketserver
+    import threading
+
+    content_type = b'multipart/x-mixed-replace; boundary=' + boundary.lstrip(b'-')
+
+    class _Handler(socketserver.BaseRequestHandler):
+        def handle(self):
+            # İstek başlığını oku ve yok say
+            data = b''
+            while b'\r\n\r\n' not in data:
+                chunk = self.request.recv(4096)
+                if not chunk:
+                    return
+                data += chunk
+            self.request.sendall(b'HTTP/1.0 200 OK\r\nContent-Type: ' + content_type + b'\r\n\r\n')
+            try:
+                for _ in range(repeat):
+                    self.request.sendall(stream)
+            except OSError:
+                pass
+
+    server = socketserver.ThreadingTCPServer(('127.0.0.1', 0), _Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, server.server_address[1]
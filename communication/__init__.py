@@ -6,10 +6,12 @@ Raspberry Pi ile WebSocket ve Stream iletişimi
 
 from .websocket_client import WebSocketCommunicationClient
 from .camera_stream_client import CameraStreamClient
+from .async_camera_stream_client import AsyncCameraStreamClient
 from .communication_manager import CommunicationManager
 
 __all__ = [
     'WebSocketCommunicationClient',
     'CameraStreamClient', 
+    'AsyncCameraStreamClient',
     'CommunicationManager'
 ]
\ No newline at end of file
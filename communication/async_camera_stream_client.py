@@ -0,0 +1,259 @@
+# gui/communication/async_camera_stream_client.py
+"""
+asyncio tabanlı kamera stream client'ı
+Ağ okuması asyncio.open_connection ile verilen event loop'ta yapılır;
+WebSocket client'ının loop'u verilirse iki bağlantı tek scheduler ve
+tek iptal yolunu paylaşır, ayrı bir alım thread'i açılmaz.
+Paylaşılan loop kapanırken bekleyen task'ları iptal eder (bkz. WebSocketClient);
+alım task'ı bu iptalde durumu kapatıp bağlantı kopması bildirir
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from .camera_stream_client import CLOSED_REASON, CameraStreamClient
+from .frame_mailbox import LatestFrameMailbox
+from .raw_socket_stream import build_get_request, parse_response_head
+
+_READ_SIZE = 64 * 1024
+
+
+class AsyncCameraStreamClient(CameraStreamClient):
+    """
+    CameraStreamClient ile aynı API - alım tarafı bir asyncio task'ı
+    Decode worker thread'i korunur (decode loop'u bloklamasın diye)
+    """
+
+    def __init__(self, raspberry_ip: str = "localhost", stream_port: int = 9001,
+                 loop: Optional[asyncio.AbstractEventLoop] = None, **kwargs):
+        super().__init__(raspberry_ip, stream_port, **kwargs)
+
+        # Paylaşılan event loop (None ise start_stream'de kendi loop'u açılır)
+        self.loop = loop
+        self._owns_loop = False
+        self._loop_thread: Optional[threading.Thread] = None
+        # Alım task'ı loop thread'inde oluşturulur; task bitince (finally dahil) event set edilir
+        self._receive_task: Optional[asyncio.Task] = None
+        self._stream_done: Optional[threading.Event] = None
+        # Task başlayıp sahiplenene kadar açık bağlantı
+        self._pending_connection = None
+
+    def attach_loop(self, loop: Optional[asyncio.AbstractEventLoop]):
+        """Stream'i başka bir client'ın (ör. WebSocket) event loop'una bağla"""
+        if self.streaming:
+            print("[CAMERA STREAM] ⚠️ Stream aktifken loop değiştirilemez")
+            return
+        self.loop = loop
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Çalışan bir event loop döndür - yoksa kendi loop thread'ini aç"""
+        if self.loop is not None and self.loop.is_running():
+            return self.loop
+
+        self.loop = asyncio.new_event_loop()
+        self._owns_loop = True
+        self._loop_thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self._loop_thread.start()
+        return self.loop
+
+    def start_stream(self) -> bool:
+        """Kamera stream'ini event loop üzerinde başlat"""
+        if self.streaming:
+            print("[CAMERA STREAM] Stream zaten aktif")
+            return True
+
+        print("[CAMERA STREAM] Stream başlatılıyor (asyncio)...")
+
+        self._start_requested_at = time.perf_counter()
+        self.time_to_first_received = None
+        self.time_to_first_frame = None
+
+        loop = self._ensure_loop()
+        try:
+            future = asyncio.run_coroutine_threadsafe(self._open_async(), loop)
+            connection = future.result(timeout=self.connect_timeout + self.stall_timeout)
+        except Exception as e:
+            print(f"[CAMERA STREAM] ❌ Stream başlatma hatası: {e}")
+            if self.error_callback:
+                self.error_callback(f"Stream başlatma hatası: {e}")
+            self._notify_connection(False, {'event': 'start_failed'})
+            return False
+
+        self._begin_streaming()
+        self._pending_connection = connection
+        self._stream_done = threading.Event()
+        loop.call_soon_threadsafe(self._spawn_stream_task, connection, self._mailbox, self._stream_done)
+
+        print("[CAMERA STREAM] ✅ Stream başlatıldı")
+        self._notify_connection(True, {'event': 'started'})
+        return True
+
+    def stop_stream(self):
+        """Stream task'ını loop üzerinde iptal et ve decode worker'ı durdur"""
+        self.streaming = False
+
+        loop = self.loop
+        done, self._stream_done = self._stream_done, None
+        if done is not None and loop is not None and loop.is_running():
+            # İptal loop thread'inde yapılır (task oluşturma çağrısından sonra sıraya girer);
+            # task finally'sinde bağlantıyı kapatıp mailbox'ı bitirene kadar beklenir
+            loop.call_soon_threadsafe(self._cancel_stream_task)
+            if not self._in_loop_thread(loop):
+                done.wait(timeout=3)
+
+        # Task hiç başlamadan iptal edildiyse bağlantı hâlâ bizde
+        connection, self._pending_connection = self._pending_connection, None
+        if connection is not None:
+            self._close_writer(connection[1], loop)
+
+        super().stop_stream()
+
+        # Kendi açtığımız loop'u kapat (paylaşılan loop'a dokunma)
+        if self._owns_loop and loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            if self._loop_thread:
+                self._loop_thread.join(timeout=2)
+            loop.close()
+            self.loop = None
+            self._owns_loop = False
+
+    def _spawn_stream_task(self, connection, mailbox: LatestFrameMailbox, done: threading.Event):
+        """Loop thread'i: alım task'ını oluştur - task bitince (iptal dahil) done set edilir"""
+        task = asyncio.get_running_loop().create_task(self._stream_task(connection, mailbox))
+        task.add_done_callback(lambda _task: done.set())
+        self._receive_task = task
+
+    def _cancel_stream_task(self):
+        """Loop thread'i: alım task'ını iptal et"""
+        task, self._receive_task = self._receive_task, None
+        if task is not None and not task.done():
+            task.cancel()
+
+    @staticmethod
+    def _in_loop_thread(loop: asyncio.AbstractEventLoop) -> bool:
+        """Çağrı loop'un kendi thread'inden mi (orada beklemek loop'u kilitler)"""
+        try:
+            return asyncio.get_running_loop() is loop
+        except RuntimeError:
+            return False
+
+    @staticmethod
+    def _close_writer(writer: asyncio.StreamWriter, loop: Optional[asyncio.AbstractEventLoop]):
+        """Loop dışından writer'ı kapat (loop çalışıyorsa onun thread'inde)"""
+        try:
+            if loop is not None and loop.is_running():
+                loop.call_soon_threadsafe(writer.close)
+            elif loop is None or not loop.is_closed():
+                writer.close()
+        except Exception:
+            pass
+
+    async def _open_async(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter, Dict[str, str]]:
+        """Bağlan, GET gönder ve yanıt başlığını oku"""
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.raspberry_ip, self.stream_port),
+            timeout=self.connect_timeout
+        )
+        try:
+            writer.write(build_get_request(self.raspberry_ip, self.stream_port))
+            await writer.drain()
+
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout=self.connect_timeout)
+            status_code, headers = parse_response_head(head[:-4])
+            if status_code != 200:
+                raise ConnectionError(f"HTTP {status_code}")
+        except BaseException:
+            writer.close()
+            raise
+
+        return reader, writer, headers
+
+    async def _stream_task(self, connection, mailbox: LatestFrameMailbox):
+        """Alım task'ı - takılmada/kopmada jitter'lı bekleme ile yeniden bağlanır"""
+        self._pending_connection = None
+        try:
+            while self.streaming:
+                reader, writer, headers = connection
+                reason = await self._receive_async(reader, headers, mailbox)
+                writer.close()
+                connection = None
+                if not self.streaming:
+                    break
+
+                stalled_at = self._record_interruption(reason)
+                connection = await self._reconnect_async(stalled_at)
+                if connection is None:
+                    break
+
+        except asyncio.CancelledError:
+            pass
+        finally:
+            if connection is not None:
+                connection[1].close()
+            self._finish_receive(mailbox)
+            if self.streaming:
+                # stop_stream değil loop kapanması (ör. WebSocket loop'u bitti):
+                # stream durumu kapatılır, yeniden start_stream kendi loop'unu açar
+                self.streaming = False
+
+    async def _receive_async(self, reader: asyncio.StreamReader, headers: Dict[str, Any],
+                             mailbox: LatestFrameMailbox) -> str:
+        """Tek bir bağlantıdan frame al - bağlantının bitme sebebini döndürür"""
+        try:
+            print("[CAMERA STREAM] MJPEG stream bağlantısı kuruldu (asyncio)")
+            parser = self._create_parser(headers.get('content-type'))
+
+            while self.streaming:
+                # stall_timeout: son bayttan beri geçen süre (frame süresi değil)
+                data = await asyncio.wait_for(reader.read(_READ_SIZE), timeout=self.stall_timeout)
+                if not data:
+                    return CLOSED_REASON
+                if not self._dispatch_parts(parser.feed(data), mailbox):
+                    return "frame gelmiyor"
+
+            return "durduruldu"
+
+        except asyncio.TimeoutError:
+            print("[CAMERA STREAM] ❌ Stream timeout")
+            return "timeout"
+        except (ConnectionError, OSError):
+            print("[CAMERA STREAM] ❌ Bağlantı hatası")
+            return "bağlantı hatası"
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"[CAMERA STREAM] ❌ Stream loop hatası: {e}")
+            return f"hata: {e}"
+
+    async def _reconnect_async(self, stalled_at: float):
+        """Jitter'lı üstel bekleme ile yeniden bağlan - durdurulursa None"""
+        delay = self.reconnect_delay_min
+        attempts = 0
+
+        while self.streaming:
+            await asyncio.sleep(self._jittered(delay))
+            if not self.streaming:
+                return None
+
+            attempts += 1
+            try:
+                connection = await self._open_async()
+                self._record_reconnect(stalled_at, attempts)
+                return connection
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[CAMERA STREAM] Yeniden bağlanma denemesi {attempts} başarısız: {e}")
+
+            delay = min(delay * 2, self.reconnect_delay_max)
+
+        return None
+
+    def get_stream_info(self) -> dict:
+        """Stream bilgilerini döndür"""
+        info = super().get_stream_info()
+        info['transport'] = 'asyncio'
+        info['shared_loop'] = self.loop is not None and not self._owns_loop
+        return info
@@ -0,0 +1,115 @@
+# gui/communication/buffer_pool.py
+"""
+Frame buffer havuzu
+(shape, dtype) anahtarına göre önceden ayrılmış numpy buffer'larını tekrar
+kullanır; her frame'de büyük blokların ayrılıp serbest bırakılmasını önler.
+Buffer'lar referans sayacı ile takip edilir, son kullanıcı bıraktığında havuza döner
+"""
+
+import threading
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+_Key = Tuple[Tuple[int, ...], str]
+
+
+class PooledBuffer:
+    """Havuzdan alınmış array - release() sayısı retain() + 1'e ulaşınca havuza döner"""
+
+    __slots__ = ('array', '_pool', '_key', '_refs')
+
+    def __init__(self, pool: 'FrameBufferPool', key: _Key, array: np.ndarray):
+        self.array = array
+        self._pool = pool
+        self._key = key
+        self._refs = 1
+
+    def retain(self) -> 'PooledBuffer':
+        """Ek referans al"""
+        with self._pool._lock:
+            self._refs += 1
+        return self
+
+    def release(self):
+        """Referansı bırak - sonuncusuysa buffer havuza döner"""
+        with self._pool._lock:
+            self._refs -= 1
+            if self._refs > 0:
+                return
+        self._pool._give_back(self)
+
+
+class FrameBufferPool:
+    """
+    (shape, dtype) anahtarlı buffer havuzu
+    - acquire(): boşta buffer varsa onu (hit), yoksa yenisini (miss) verir
+    - Anahtar başına en fazla max_free_per_key boş buffer tutulur
+    """
+
+    def __init__(self, max_free_per_key: int = 4):
+        self.max_free_per_key = max_free_per_key
+        self._free: Dict[_Key, List[np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+        # İstatistikler
+        self.hits = 0
+        self.misses = 0
+        self.returned = 0
+        self.discarded = 0
+        self.outstanding = 0
+
+    def acquire(self, shape: Tuple[int, ...], dtype=np.uint8) -> PooledBuffer:
+        """Verilen boyutta bir buffer al (içeriği tanımsız)"""
+        key = (tuple(shape), np.dtype(dtype).str)
+        with self._lock:
+            free = self._free.get(key)
+            array = free.pop() if free else None
+            if array is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            self.outstanding += 1
+
+        if array is None:
+            array = np.empty(shape, dtype=dtype)
+        return PooledBuffer(self, key, array)
+
+    def _give_back(self, buffer: PooledBuffer):
+        """Son referansı bırakılan buffer'ı boş listeye ekle"""
+        with self._lock:
+            self.outstanding -= 1
+            free = self._free.setdefault(buffer._key, [])
+            if len(free) < self.max_free_per_key:
+                free.append(buffer.array)
+                self.returned += 1
+            else:
+                self.discarded += 1
+        buffer.array = None
+
+    def clear(self):
+        """Boştaki tüm buffer'ları bırak (ör. çözünürlük değişince)"""
+        with self._lock:
+            self._free.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        """acquire() çağrılarının havuzdan karşılanma oranı"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get_stats(self) -> Dict[str, object]:
+        """Havuz istatistikleri"""
+        with self._lock:
+            free_buffers = sum(len(free) for free in self._free.values())
+            free_bytes = sum(a.nbytes for free in self._free.values() for a in free)
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hit_rate, 3),
+            'outstanding': self.outstanding,
+            'free_buffers': free_buffers,
+            'free_bytes': free_bytes,
+            'returned': self.returned,
+            'discarded': self.discarded
+        }
@@ -1,12 +1,40 @@
 # gui/communication/camera_stream_client.py - FIXED VERSION
 import requests
-import cv2
 import numpy as np
 import threading
 import time
-from typing import Optional, Callable
+from typing import Optional, Callable, Dict, Any, Tuple
 from PIL import Image, ImageTk
 import io
+import socket
+import random
+from urllib3.exceptions import ReadTimeoutError
+
+from .mjpeg_parser import MJPEGStreamParser, boundary_from_content_type
+from .raw_socket_stream import RawSocketStreamConnection
+from .frame_mailbox import LatestFrameMailbox
+from .latency_tracker import FrameLatencyTracker, parse_capture_timestamp
+from .jpeg_scaling import jpeg_dimensions, pick_reduction
+from .jpeg_decoders import JPEGDecoder, create_decoder, select_fastest_decoder
+from .decode_pool import OrderedDecodePool, decode_in_process
+from .pixel_formats import convert_pixels, validate_pixel_format
+from .buffer_pool import FrameBufferPool
+from .frame import FRAME_FORMAT, Frame
+from .frame_bus import FrameBus, FrameSubscription
+from .shared_frame_ring import DEFAULT_RING_NAME, SharedFrameRingWriter
+from .rendered_frame_cache import RenderedFrameCache
+
+DEFAULT_BOUNDARY = b'--frame'
+AUTO_DECODER = 'auto'
+# Sunucunun bağlantıyı düzgün kapatması - takılma (stall) sayılmaz
+CLOSED_REASON = "bağlantı kapandı"
+DEFAULT_DECODER = 'opencv'  # 'auto' modda benchmark bitene kadar
+
+def _is_read_timeout(error: BaseException) -> bool:
+    """Sarılmış (requests ConnectionError -> urllib3 ReadTimeoutError) okuma timeout'u mu"""
+    cause = error.args[0] if error.args else None
+    return isinstance(cause, (ReadTimeoutError, socket.timeout))
+
 
 class CameraStreamClient:
     """
@@ -14,191 +42,648 @@ class CameraStreamClient:
     MJPEG formatında görüntü akışını işler
     """
     
-    def __init__(self, raspberry_ip: str = "localhost", stream_port: int = 9001):
+    def __init__(self, raspberry_ip: str = "localhost", stream_port: int = 9001,
+                 use_raw_socket: bool = False,
+                 stall_timeout: float = 0.5,
+                 frame_timeout: float = 3.0,
+                 reconnect_delay_min: float = 0.05,
+                 reconnect_delay_max: float = 2.0,
+                 receive_buffer_size: int = 2 * 1024 * 1024,
+                 timestamp_header: str = 'x-timestamp',
+                 decoder: str = AUTO_DECODER,
+                 decode_workers: int = 1,
+                 decode_pool_mode: str = 'thread'):
         self.raspberry_ip = raspberry_ip
         self.stream_port = stream_port
         self.stream_url = f"http://{raspberry_ip}:{stream_port}"
         
+        # Taşıma katmanı: False -> requests, True -> socket + recv_into
+        self.use_raw_socket = use_raw_socket
+        
         # Stream durumu
         self.streaming = False
         self.connected = False
         
-        # Threading
+        # Threading: alım (ağ) ve decode ayrı thread'lerde
         self.stream_thread: Optional[threading.Thread] = None
+        self.decode_thread: Optional[threading.Thread] = None
+        self._mailbox = LatestFrameMailbox()
+        self._stop_event = threading.Event()
         
         # Callback fonksiyonları
-        self.frame_callback: Optional[Callable] = None
+        # Frame aboneleri: her biri kendi formatı, boyutu ve hız sınırı ile
+        self.frame_bus = FrameBus()
         self.connection_callback: Optional[Callable] = None
         self.error_callback: Optional[Callable] = None
         
-        # Son frame
-        self.last_frame = None
+        # Son frame decoder'ın native formatında (ve tam çözünürlüklü snapshot için sıkıştırılmış hali)
+        self.current_frame: Optional[Frame] = None
+        self.last_frame_format = 'RGB'
+        self.last_jpeg: Optional[bytes] = None
         self.frame_count = 0
         self.fps_counter = 0
         self.last_fps_time = time.time()
         
+        # Multipart ayrıştırma bilgileri
+        self.boundary: Optional[bytes] = None
+        self.length_frames = 0   # Content-Length hızlı yolu ile alınan frame
+        self.scan_frames = 0     # Boundary taraması ile alınan frame
+        self.last_frame_path: Optional[str] = None
+        
+        # Frame sıra numarası ve sayaçlar
+        # Her alınan parça monoton bir sıra numarası alır; kayıplar ayrı sayılır
+        self._next_seq = 0
+        self.last_frame_seq: Optional[int] = None
+        self.frames_received = 0    # Ağdan ayrıştırılan parça
+        self.frames_decoded = 0     # Başarıyla decode edilen
+        self.decode_failures = 0    # Decode edilemeyen (bozuk JPEG)
+        self.stale_drops = 0        # Decode yetişemediği için üzerine yazılan
+        self.frames_delivered = 0   # Frame callback'ine teslim edilen
+        self.parse_drops = 0        # Ayrıştırıcının attığı bozuk/aşırı büyük parça
+        self.sequence_gaps = 0      # Teslim edilen sıra numaraları arasındaki boşluk toplamı
+        
+        # Sabit kapasiteli alım buffer'ı - stream başına en fazla bu kadar bellek
+        self.receive_buffer_size = receive_buffer_size
+        self.resync_reasons: Dict[str, int] = {}
+        self.resync_bytes_discarded = 0
+        self.last_resync_reason: Optional[str] = None
+        
+        # Uçtan uca gecikme: Pi'nin parça başlığındaki yakalama zamanı (opsiyonel)
+        self.timestamp_header = timestamp_header.lower()
+        self.latency = FrameLatencyTracker()
+        
+        # Tüketici çözünürlükleri: decode en büyük ihtiyaca göre küçültülür
+        # Kayıtlı tüketici yoksa veya biri None isterse tam çözünürlük
+        self._consumer_sizes: Dict[str, Optional[Tuple[int, int]]] = {}
+        self._consumer_lock = threading.Lock()
+        self.decode_target: Optional[Tuple[int, int]] = None
+        self.decode_scale = 1
+        
+        # JPEG decoder backend'i: 'auto' ise ilk frame üzerinde self-benchmark ile seçilir
+        self.decoder_backend = decoder
+        # 'auto': ilk frame'ler OpenCV ile decode edilir, benchmark arka planda çalışır
+        self.decoder: JPEGDecoder = create_decoder(DEFAULT_DECODER if decoder == AUTO_DECODER else decoder)
+        self.decoder_benchmark: Dict[str, float] = {}
+        self._decoder_benchmark_started = False
+        
+        # Paralel decode: decode_workers > 1 ise sıralı teslimli worker havuzu
+        # ('thread': cv2 GIL'i bırakır, 'process': ayrı süreçler)
+        self.decode_workers = max(1, decode_workers)
+        self.decode_pool_mode = decode_pool_mode
+        self._decode_pool: Optional[OrderedDecodePool] = None
+        self.late_drops = 0         # Havuzda sırası geçtiği için atılan
+        
+        # Tüketici formatına dönüşüm buffer'ları (shape, dtype) anahtarlı havuzdan alınır
+        self.buffer_pool = FrameBufferPool()
+        
+        # GUI için render edilmiş frame'ler (seq, genişlik, yükseklik, format) başına bir kez üretilir
+        self.tk_image_cache = RenderedFrameCache()
+        
+        # Süreçler arası paylaşım: decode edilmiş frame'ler shared memory halkasına (opsiyonel)
+        self._shared_ring: Optional[SharedFrameRingWriter] = None
+        self._shared_ring_format = 'BGR'
+        self._shared_ring_size: Optional[Tuple[int, int]] = None
+        self._shared_ring_lock = threading.Lock()  # Yazma ile kapatma arasında
+        
+        # Watchdog: stall_timeout (~500 ms) boyunca hiç bayt gelmezse (socket read timeout)
+        # veya bayt geldiği halde frame_timeout boyunca tek frame çıkmazsa yeniden bağlan.
+        # Yavaş bağlantıda büyük bir frame'in stall_timeout'tan uzun sürmesi takılma değildir;
+        # baytlar akarken sadece frame_timeout sınırı uygulanır
+        self.stall_timeout = stall_timeout
+        self.frame_timeout = max(frame_timeout, stall_timeout)
+        self.reconnect_delay_min = reconnect_delay_min
+        self.reconnect_delay_max = reconnect_delay_max
+        self.stall_count = 0
+        self.server_close_count = 0
+        self.reconnect_count = 0
+        self.last_stall_duration: Optional[float] = None
+        self.last_reconnect_duration: Optional[float] = None
+        self._last_part_time = 0.0
+        self._last_byte_time = 0.0
+        
+        # Bağlantı (connect, read) timeout'ları ve başlangıç gecikmesi
+        # Read timeout = stall_timeout: bu süre hiç bayt gelmemesi takılmadır
+        self.connect_timeout = 5
+        self.request_timeout = (self.connect_timeout, stall_timeout)
+        self._start_requested_at: Optional[float] = None
+        self.time_to_first_received: Optional[float] = None
+        self.time_to_first_frame: Optional[float] = None
+        
         print(f"[CAMERA STREAM] Client oluşturuldu: {self.stream_url}")
     
     def start_stream(self) -> bool:
-        """Kamera stream'ini başlat"""
+        """Kamera stream'ini başlat - tek HTTP bağlantısı"""
         if self.streaming:
             print("[CAMERA STREAM] Stream zaten aktif")
             return True
         
         print("[CAMERA STREAM] Stream başlatılıyor...")
         
+        # Başlangıç gecikmesi ölçümü
+        self._start_requested_at = time.perf_counter()
+        self.time_to_first_received = None
+        self.time_to_first_frame = None
+        
+        response = None
         try:
-            # İlk bağlantı testi
-            response = requests.get(self.stream_url, timeout=5, stream=True)
+            # Bağlantı testi ve stream aynı GET ile yapılır
+            response = self._open_stream()
             if response.status_code == 200:
-                self.streaming = True
-                self.connected = True
+                self._begin_streaming()
                 
-                # Stream thread'ini başlat
-                self.stream_thread = threading.Thread(target=self._stream_loop, daemon=True)
+                # Açık bağlantıyı stream thread'ine devret
+                self.stream_thread = threading.Thread(target=self._stream_loop, args=(response, self._mailbox), daemon=True)
                 self.stream_thread.start()
                 
                 print("[CAMERA STREAM] ✅ Stream başlatıldı")
-                if self.connection_callback:
-                    self.connection_callback(True)
+                self._notify_connection(True, {'event': 'started'})
                 return True
             else:
                 print(f"[CAMERA STREAM] ❌ Stream başlatılamadı: {response.status_code}")
-                if self.connection_callback:
-                    self.connection_callback(False)
+                response.close()
+                self._notify_connection(False, {'event': 'start_failed'})
                 return False
                 
         except Exception as e:
             print(f"[CAMERA STREAM] ❌ Stream başlatma hatası: {e}")
+            if response is not None:
+                response.close()
             if self.error_callback:
                 self.error_callback(f"Stream başlatma hatası: {e}")
-            if self.connection_callback:
-                self.connection_callback(False)
+            self._notify_connection(False, {'event': 'start_failed'})
             return False
     
+    def _begin_streaming(self):
+        """Stream durumunu aç ve decode worker'ı başlat"""
+        self.streaming = True
+        self.connected = True
+        self._stop_event.clear()
+        
+        # Decode worker - alım tarafından gelen en yeni JPEG'i işler
+        # Havuz modunda bu thread sadece işleri worker'lara dağıtır
+        self._mailbox = LatestFrameMailbox()
+        self._decode_pool = None
+        if self.decode_workers > 1:
+            self._decode_pool = OrderedDecodePool(
+                self._on_pool_result,
+                workers=self.decode_workers,
+                mode=self.decode_pool_mode,
+                on_late=self._on_pool_late
+            )
+            print(f"[CAMERA STREAM] Decode havuzu: {self.decode_workers} {self.decode_pool_mode} worker")
+        self.decode_thread = threading.Thread(target=self._decode_loop, args=(self._mailbox, self._decode_pool), daemon=True)
+        self.decode_thread.start()
+    
     def stop_stream(self):
         """Kamera stream'ini durdur"""
         print("[CAMERA STREAM] Stream durduruluyor...")
         self.streaming = False
         self.connected = False
+        self._stop_event.set()
         
-        # Thread'i bekle
+        # Decode worker'ı uyandır ve thread'leri bekle (okunmamış frame bırakılır)
+        leftover = self._mailbox.close()
+        if leftover is not None:
+            leftover.release()
         if self.stream_thread and self.stream_thread.is_alive():
             self.stream_thread.join(timeout=3)
+        if self.decode_thread and self.decode_thread.is_alive():
+            self.decode_thread.join(timeout=3)
         
-        if self.connection_callback:
-            self.connection_callback(False)
+        self._notify_connection(False, {'event': 'stopped'})
         
         print("[CAMERA STREAM] Stream durduruldu")
     
-    def _stream_loop(self):
-        """Ana stream döngüsü - FIXED VERSION"""
-        try:
-            response = requests.get(self.stream_url, stream=True, timeout=10)
-            
-            if response.status_code != 200:
-                raise Exception(f"HTTP {response.status_code}")
-            
-            print("[CAMERA STREAM] MJPEG stream bağlantısı kuruldu")
-            
-            # Buffer ve değişkenler
-            buffer = b""
-            boundary = None
-            
+    def _open_stream(self):
+        """Seçilen taşıma katmanı ile stream bağlantısını aç"""
+        if self.use_raw_socket:
+            return RawSocketStreamConnection(
+                self.raspberry_ip, self.stream_port, timeout=self.request_timeout
+            ).open()
+        return requests.get(self.stream_url, timeout=self.request_timeout, stream=True)
+    
+    def _iter_reads(self, response, parser: MJPEGStreamParser):
+        """Her okumada tamamlanan multipart parçalarını (boş olabilir) üret"""
+        if self.use_raw_socket:
+            # recv_into ile doğrudan parser buffer'ına oku
+            while self.streaming:
+                parts = response.read_parts(parser)
+                if parts is None:
+                    break
+                yield parts
+        else:
             for chunk in response.iter_content(chunk_size=4096):  # Daha büyük chunk
+                if not self.streaming:
+                    break
+                yield parser.feed(chunk)
+    
+    def _stream_loop(self, response, mailbox: LatestFrameMailbox):
+        """Alım döngüsü - bağlantı koparsa veya takılırsa (stall) yeniden bağlanır"""
+        try:
+            while self.streaming:
+                reason = self._receive(response, mailbox)
+                response.close()
+                response = None
                 if not self.streaming:
                     break
                 
-                buffer += chunk
-                
-                # Boundary'yi bul (ilk kez)
-                if boundary is None:
-                    # Boundary genelde --frame şeklinde
-                    boundary_idx = buffer.find(b'--frame')
-                    if boundary_idx != -1:
-                        boundary = b'--frame'
-                        print(f"[CAMERA STREAM] Boundary bulundu: {boundary}")
-                
-                # Frame'leri ayıkla
-                while boundary and len(buffer) > 1024:
-                    # Yeni frame başlangıcını bul
-                    start_idx = buffer.find(boundary)
-                    if start_idx == -1:
-                        break
-                    
-                    # Bir sonraki boundary'yi bul
-                    next_idx = buffer.find(boundary, start_idx + len(boundary))
-                    
-                    if next_idx == -1:
-                        # Henüz tam frame yok, daha fazla veri bekle
-                        break
-                    
-                    # Tam frame'i çıkar
-                    frame_data = buffer[start_idx:next_idx]
-                    
-                    # JPEG verilerini ayıkla
-                    jpeg_start = frame_data.find(b'\xff\xd8')
-                    jpeg_end = frame_data.find(b'\xff\xd9')
-                    
-                    if jpeg_start != -1 and jpeg_end != -1 and jpeg_end > jpeg_start:
-                        jpeg_data = frame_data[jpeg_start:jpeg_end + 2]
-                        
-                        # Frame'i decode et
-                        frame = self._decode_jpeg_frame(jpeg_data)
-                        if frame is not None:
-                            self.last_frame = frame
-                            self.frame_count += 1
-                            
-                            # FPS hesapla
-                            self._calculate_fps()
-                            
-                            # Callback'i tetikle
-                            if self.frame_callback:
-                                self.frame_callback(frame)
-                            
-                            # Debug log - her 30 frame'de bir
-                            if self.frame_count % 30 == 0:
-                                print(f"[CAMERA STREAM] Frame {self.frame_count} alındı")
-                    
-                    # İşlenen kısmı buffer'dan çıkar
-                    buffer = buffer[next_idx:]
-                
-                # Buffer'ı sınırla (memory leak önleme)
-                if len(buffer) > 1024 * 1024:  # 1MB'dan büyükse
-                    buffer = buffer[-1024*512:]  # Son 512KB'ı tut
+                stalled_at = self._record_interruption(reason)
+                response = self._reconnect(stalled_at)
+                if response is None:
+                    break
         
-        except requests.exceptions.Timeout:
-            print("[CAMERA STREAM] ❌ Stream timeout")
-        except requests.exceptions.ConnectionError:
-            print("[CAMERA STREAM] ❌ Bağlantı hatası")
-        except Exception as e:
-            print(f"[CAMERA STREAM] ❌ Stream loop hatası: {e}")
         finally:
-            self.connected = False
+            if response is not None:
+                response.close()
+            self._finish_receive(mailbox)
+    
+    def _record_interruption(self, reason: str) -> float:
+        """
+        Watchdog: bağlantının bitişini kaydet ve bildir - tespit zamanını döndürür
+        Sunucunun düzgün kapatması takılmadan ayrı sayılır ('closed' olayı)
+        """
+        stalled_at = time.perf_counter()
+        self.connected = False
+        if reason == CLOSED_REASON:
+            self.server_close_count += 1
+            print("[CAMERA STREAM] ⚠️ Sunucu bağlantıyı kapattı - yeniden bağlanılıyor")
+            self._notify_connection(False, {'event': 'closed', 'reason': reason})
+            return stalled_at
+        
+        self.last_stall_duration = stalled_at - self._last_part_time
+        self.stall_count += 1
+        print(f"[CAMERA STREAM] ⚠️ Stream takıldı ({reason}), "
+              f"{self.last_stall_duration * 1000:.0f} ms frame yok - yeniden bağlanılıyor")
+        self._notify_connection(False, {
+            'event': 'stalled',
+            'reason': reason,
+            'stall_duration': self.last_stall_duration
+        })
+        return stalled_at
+    
+    def _record_reconnect(self, stalled_at: float, attempts: int):
+        """Başarılı yeniden bağlanmayı kaydet ve bildir"""
+        self.last_reconnect_duration = time.perf_counter() - stalled_at
+        self.reconnect_count += 1
+        self.connected = True
+        print(f"[CAMERA STREAM] ✅ Yeniden bağlandı: "
+              f"{self.last_reconnect_duration * 1000:.0f} ms, {attempts} deneme")
+        self._notify_connection(True, {
+            'event': 'reconnected',
+            'stall_duration': self.last_stall_duration,
+            'reconnect_duration': self.last_reconnect_duration,
+            'attempts': attempts
+        })
+    
+    def _finish_receive(self, mailbox: LatestFrameMailbox):
+        """Alım tarafı sonlandı - decode worker'ı kapat ve gerekirse bildir"""
+        leftover = mailbox.close()
+        if leftover is not None:
+            # Decode thread'i almadan kapandı
+            leftover.release()
+        self.connected = False
+        if self.streaming:
+            # stop_stream çağrılmadan çıkıldı
             if self.error_callback:
                 self.error_callback("Stream bağlantısı kesildi")
-            if self.connection_callback:
-                self.connection_callback(False)
+            self._notify_connection(False, {'event': 'disconnected'})
+    
+    def _create_parser(self, content_type: Optional[str]) -> MJPEGStreamParser:
+        """Content-Type'tan boundary'yi belirle ve yeni ayrıştırıcı oluştur"""
+        self.boundary = boundary_from_content_type(content_type)
+        if self.boundary is None:
+            self.boundary = DEFAULT_BOUNDARY
+            print(f"[CAMERA STREAM] ⚠️ Boundary bildirilmedi ({content_type}), varsayılan: {self.boundary}")
+        else:
+            print(f"[CAMERA STREAM] Boundary bulundu: {self.boundary}")
+        
+        # Artımlı multipart ayrıştırıcı - buffer tekrar taranmaz
+        parser = MJPEGStreamParser(
+            boundary=self.boundary,
+            capacity=self.receive_buffer_size,
+            on_resync=self._on_parser_resync
+        )
+        self._last_part_time = self._last_byte_time = time.perf_counter()
+        return parser
     
-    def _decode_jpeg_frame(self, jpeg_data: bytes) -> Optional[np.ndarray]:
-        """JPEG verisini OpenCV frame'ine çevir"""
+    def _dispatch_parts(self, parts, mailbox: LatestFrameMailbox) -> bool:
+        """
+        Bir okumada çıkan parçaları numaralandırıp decode kutusuna bırak
+        Her okuma bayt geldiği anlamına gelir; bayt geldiği halde frame_timeout
+        boyunca frame çıkmadıysa (bozuk akış) False döner
+        """
+        now = time.perf_counter()
+        self._last_byte_time = now
+        if not parts:
+            return now - self._last_part_time <= self.frame_timeout
+        
+        self._last_part_time = now
+        receive_ts = time.time()
+        for part in parts:
+            seq = self._next_seq
+            self._next_seq += 1
+            self.frames_received += 1
+            self._count_parse_path(part.via_length)
+            capture_ts = parse_capture_timestamp(part.headers.get(self.timestamp_header))
+            self.latency.on_received(seq, capture_ts, receive_ts)
+            frame = Frame(seq, part.payload, self._decode_frame,
+                          buffer_pool=self.buffer_pool, source=self.stream_url,
+                          capture_ts=capture_ts, receive_ts=receive_ts)
+            # Decode'u bekleme - en yeni frame kazanır, okunmadan üzerine yazılan bırakılır
+            evicted = mailbox.put(frame)
+            if evicted is not None:
+                self.stale_drops += 1
+                evicted.release()
+        return True
+    
+    def _receive(self, response, mailbox: LatestFrameMailbox) -> str:
+        """Tek bir bağlantıdan frame al - bağlantının bitme sebebini döndürür"""
         try:
-            # Numpy array'e çevir
-            nparr = np.frombuffer(jpeg_data, np.uint8)
+            print("[CAMERA STREAM] MJPEG stream bağlantısı kuruldu")
             
-            # OpenCV ile decode et
-            frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+            # Boundary'yi Content-Type başlığından oku
+            parser = self._create_parser(response.headers.get('content-type'))
             
-            if frame is not None:
-                # BGR'den RGB'ye çevir (GUI için)
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                return frame_rgb
+            for parts in self._iter_reads(response, parser):
+                if not self._dispatch_parts(parts, mailbox):
+                    # Veri geliyor ama frame çıkmıyor
+                    return "frame gelmiyor"
             
-            return None
+            return CLOSED_REASON
+        
+        except (requests.exceptions.Timeout, socket.timeout):
+            print("[CAMERA STREAM] ❌ Stream timeout")
+            return "timeout"
+        except (requests.exceptions.ConnectionError, ConnectionError) as e:
+            if _is_read_timeout(e):
+                # requests, iter_content okuma timeout'unu ConnectionError içinde verir
+                print("[CAMERA STREAM] ❌ Stream timeout")
+                return "timeout"
+            print("[CAMERA STREAM] ❌ Bağlantı hatası")
+            return "bağlantı hatası"
+        except Exception as e:
+            print(f"[CAMERA STREAM] ❌ Stream loop hatası: {e}")
+            return f"hata: {e}"
+    
+    def _on_parser_resync(self, reason: str, discarded: int):
+        """Ayrıştırıcı bozuk/taşan parçayı atıp bir sonraki boundary'ye geçti"""
+        self.parse_drops += 1
+        self.resync_reasons[reason] = self.resync_reasons.get(reason, 0) + 1
+        self.resync_bytes_discarded += discarded
+        self.last_resync_reason = reason
+        print(f"[CAMERA STREAM] ⚠️ Resync ({reason}), {discarded} bayt atıldı")
+    
+    def _reconnect(self, stalled_at: float):
+        """Jitter'lı üstel bekleme ile yeniden bağlan - stop_stream'de None döner"""
+        delay = self.reconnect_delay_min
+        attempts = 0
+        
+        while self.streaming:
+            # Birden fazla client aynı anda yüklenmesin diye jitter
+            if self._stop_event.wait(self._jittered(delay)):
+                return None
+            
+            attempts += 1
+            try:
+                response = self._open_stream()
+                if response.status_code == 200:
+                    self._record_reconnect(stalled_at, attempts)
+                    return response
+                response.close()
+            except Exception as e:
+                print(f"[CAMERA STREAM] Yeniden bağlanma denemesi {attempts} başarısız: {e}")
+            
+            delay = min(delay * 2, self.reconnect_delay_max)
+        
+        return None
+    
+    def _jittered(self, delay: float) -> float:
+        """Bekleme süresine ±%50 jitter ekle"""
+        return delay * random.uniform(0.5, 1.5)
+    
+    def _notify_connection(self, connected: bool, details: Dict[str, Any]):
+        """Bağlantı callback'ini tetikle"""
+        if self.connection_callback:
+            try:
+                self.connection_callback(connected, details)
+            except Exception as e:
+                print(f"[CAMERA STREAM] Bağlantı callback hatası: {e}")
+    
+    def _decode_loop(self, mailbox: LatestFrameMailbox, pool: Optional[OrderedDecodePool] = None):
+        """
+        Decode döngüsü - JPEG decode, renk dönüşümü ve callback bu thread'de
+        Havuz varsa decode worker'larda yapılır ve tüm frame'ler (decode
+        gerekmeyenler dahil) sırayla havuzun teslim thread'inden yayınlanır
+        """
+        try:
+            while True:
+                item = mailbox.get(timeout=0.5)
+                if item is None:
+                    if mailbox.closed or not self.streaming:
+                        break
+                    continue
+                
+                try:
+                    if pool is None:
+                        self._handle_frame(item)
+                    elif not self._submit_to_pool(pool, item):
+                        item.release()
+                except Exception as e:
+                    print(f"[CAMERA STREAM] Frame işleme hatası: {e}")
+        finally:
+            if pool is not None:
+                for frame, _ in pool.close():
+                    frame.release()
+    
+    def _submit_to_pool(self, pool: OrderedDecodePool, frame: Frame) -> bool:
+        """
+        Ölçek ve backend'i burada seç, decode'u havuza gönder
+        Piksel isteyen yoksa frame decode edilmeden sıraya girer (format None)
+        """
+        if not self._wants_pixels():
+            return pool.submit_ready(frame.seq, (frame, None))
+        jpeg_data = frame.jpeg
+        scale = self._select_decode_scale(jpeg_data)
+        decoder = self._get_decoder(jpeg_data, scale)
+        if pool.mode == 'process':
+            return pool.submit(frame.seq, (frame, decoder.native_format), decode_in_process, decoder.name, jpeg_data, scale)
+        return pool.submit(frame.seq, (frame, decoder.native_format), decoder.decode, jpeg_data, scale)
+    
+    def _on_pool_result(self, seq: int, context: Tuple[Frame, Optional[str]], pixels: Optional[np.ndarray]):
+        """Havuz teslim thread'i: sıradaki frame hazır"""
+        frame, pixel_format = context
+        if pixel_format is not None:
+            frame.set_pixels(pixels, pixel_format)
+            self._record_decode(frame, pixels, pixel_format)
+        self._publish_frame(frame)
+        frame.release()
+    
+    def _on_pool_late(self, seq: int, context: Tuple[Frame, Optional[str]]):
+        """Havuz: frame sırası geçtiği için atıldı"""
+        self.late_drops += 1
+        context[0].release()
+    
+    def _count_parse_path(self, via_length: bool):
+        """Frame'in hangi ayrıştırma yolundan geldiğini say"""
+        if via_length:
+            self.length_frames += 1
+            self.last_frame_path = 'content_length'
+        else:
+            self.scan_frames += 1
+            self.last_frame_path = 'boundary_scan'
+    
+    def _handle_frame(self, frame: Frame):
+        """
+        Ayrıştırılan frame'i yayınla
+        Piksel isteyen tüketici yoksa decode edilmez - ilk piksel erişiminde yapılır
+        """
+        if self._wants_pixels():
+            frame.pixels()
+        self._publish_frame(frame)
+        frame.release()
+    
+    def _wants_pixels(self) -> bool:
+        """Frame'i decode edilmiş olarak isteyen tüketici (veya shared memory halkası) var mı"""
+        if self._shared_ring is not None:
+            return True
+        return self.frame_bus.wants_pixels()
+    
+    def _decode_frame(self, frame: Frame) -> Tuple[Optional[np.ndarray], str]:
+        """Frame'in ilk piksel erişimi - decode et ve sayaçları güncelle"""
+        pixels, pixel_format = self._decode_jpeg_frame(frame.jpeg)
+        self._record_decode(frame, pixels, pixel_format)
+        return pixels, pixel_format
+    
+    def _record_decode(self, frame: Frame, pixels: Optional[np.ndarray], pixel_format: str):
+        """Decode sonucunu say ve frame'in decode zamanını işaretle"""
+        if pixels is None:
+            self.decode_failures += 1
+            return
+        self.frames_decoded += 1
+        self.last_frame_format = pixel_format
+        frame.decode_ts = time.time()
+        self.latency.on_decoded(frame.seq, frame.decode_ts)
+    
+    def _publish_frame(self, frame: Frame):
+        """Frame'i son frame olarak kaydet, sayaçları güncelle ve tüketicilere ilet"""
+        if frame.decoded and frame.pixels() is None:
+            # Bozuk JPEG - decode_failures zaten sayıldı
+            return
+        
+        seq = frame.seq
+        self.last_jpeg = frame.jpeg
+        previous, self.current_frame = self.current_frame, frame.retain()
+        if previous is not None:
+            previous.release()
+        self.tk_image_cache.on_new_frame(seq)
+        self.frame_count += 1
+        
+        # Teslim edilmeyen (atlanan/bozuk) frame'ler sıra numarasında boşluk bırakır
+        if self.last_frame_seq is not None and seq > self.last_frame_seq + 1:
+            self.sequence_gaps += seq - self.last_frame_seq - 1
+        self.last_frame_seq = seq
+        
+        # İlk alınan frame (decode tembel olduğundan burada henüz decode edilmemiş olabilir)
+        if self.time_to_first_received is None and self._start_requested_at is not None:
+            self.time_to_first_received = time.perf_counter() - self._start_requested_at
+        
+        # FPS hesapla
+        self._calculate_fps()
+        
+        # Abonelere istedikleri format/boyut/hızda ilet
+        if self.frame_bus.publish(frame):
+            self.frames_delivered += 1
+        
+        # Debug log - her 30 frame'de bir
+        if self.frame_count % 30 == 0:
+            print(f"[CAMERA STREAM] Frame {self.frame_count} alındı")
+    
+    def set_consumer_size(self, name: str, size: Optional[Tuple[int, int]]):
+        """
+        Bir tüketicinin (görüntüleme, kayıt...) ihtiyaç duyduğu çözünürlüğü bildir
+        None: tam çözünürlük gerekiyor
+        """
+        with self._consumer_lock:
+            self._consumer_sizes[name] = size
+            self._update_decode_target()
+    
+    def remove_consumer_size(self, name: str):
+        """Tüketicinin çözünürlük talebini kaldır"""
+        with self._consumer_lock:
+            self._consumer_sizes.pop(name, None)
+            self._update_decode_target()
+    
+    def _update_decode_target(self):
+        """Tüketici taleplerinden decode hedef boyutunu hesapla"""
+        sizes = list(self._consumer_sizes.values())
+        if not sizes or any(size is None for size in sizes):
+            self.decode_target = None
+        else:
+            self.decode_target = (max(w for w, _ in sizes), max(h for _, h in sizes))
+        print(f"[CAMERA STREAM] Decode hedef boyutu: {self.decode_target or 'tam çözünürlük'}")
+    
+    def _select_decode_scale(self, jpeg_data: bytes) -> int:
+        """Hedef boyuta göre DCT küçültme oranını (1/2/4/8) seç"""
+        target = self.decode_target
+        if target is None:
+            self.decode_scale = 1
+            return 1
+        
+        dims = jpeg_dimensions(jpeg_data)
+        self.decode_scale = pick_reduction(dims, target) if dims else 1
+        return self.decode_scale
+    
+    def set_decoder(self, name: str):
+        """
+        JPEG decoder backend'ini zorla ('opencv', 'pillow', 'turbojpeg')
+        'auto': OpenCV'ye dönülür, bir sonraki frame üzerinde arka planda self-benchmark tekrarlanır
+        """
+        decoder = create_decoder(DEFAULT_DECODER if name == AUTO_DECODER else name)
+        self.decoder_backend = name
+        self.decoder = decoder
+        self._decoder_benchmark_started = False
+        print(f"[CAMERA STREAM] JPEG decoder: {name}")
+    
+    def _get_decoder(self, jpeg_data: bytes, scale: int) -> JPEGDecoder:
+        """
+        Aktif backend
+        'auto' modda ilk çağrı beklemez: self-benchmark bu frame'in kopyası
+        üzerinde arka planda başlar, bitince en hızlı backend'e geçilir
+        """
+        if self.decoder_backend == AUTO_DECODER and not self._decoder_benchmark_started:
+            self._decoder_benchmark_started = True
+            threading.Thread(
+                target=self._run_decoder_benchmark, args=(bytes(jpeg_data), scale),
+                name="DecoderBenchmark", daemon=True
+            ).start()
+        return self.decoder
+    
+    def _run_decoder_benchmark(self, jpeg_data: bytes, scale: int):
+        """Arka plan thread'i: backend'leri ölç ve en hızlısına geç"""
+        try:
+            decoder, results = select_fastest_decoder(jpeg_data, scale)
+        except Exception as e:
+            print(f"[CAMERA STREAM] Decoder benchmark hatası: {e}")
+            return
+        # Bu arada backend elle seçildiyse dokunma
+        if self.decoder_backend == AUTO_DECODER:
+            self.decoder_benchmark = results
+            self.decoder = decoder
+    
+    def _decode_jpeg_frame(self, jpeg_data: bytes,
+                           full_resolution: bool = False) -> Tuple[Optional[np.ndarray], str]:
+        """
+        JPEG verisini decode et (mümkünse küçültülmüş decode)
+        Renk dönüşümü yapılmaz: (frame, decoder'ın native formatı) döner
+        """
+        try:
+            scale = 1 if full_resolution else self._select_decode_scale(jpeg_data)
+            decoder = self._get_decoder(jpeg_data, scale)
+            return decoder.decode(jpeg_data, scale), decoder.native_format
             
         except Exception as e:
             print(f"[CAMERA STREAM] JPEG decode hatası: {e}")
-            return None
+            return None, self.last_frame_format
     
     def _calculate_fps(self):
         """FPS hesapla"""
@@ -210,34 +695,83 @@ class CameraStreamClient:
             if hasattr(self, 'fps_callback') and self.fps_callback:
                 self.fps_callback(self.fps_counter)
     
+    @property
+    def last_frame(self) -> Optional[np.ndarray]:
+        """Son frame'in pikselleri (native formatta) - decode edilmemişse şimdi edilir"""
+        frame = self.current_frame
+        return frame.pixels() if frame is not None else None
+    
     def get_current_frame_as_pil(self) -> Optional[Image.Image]:
-        """Mevcut frame'i PIL Image olarak döndür"""
-        if self.last_frame is not None:
+        """Mevcut frame'i PIL Image olarak döndür (decode ve RGB dönüşümü istenince yapılır)"""
+        frame = self.current_frame
+        if frame is not None:
             try:
-                return Image.fromarray(self.last_frame)
+                return self._frame_to_pil(frame, 'RGB')
             except Exception as e:
                 print(f"[CAMERA STREAM] PIL dönüştürme hatası: {e}")
         return None
     
-    def get_current_frame_as_tkinter(self, width: int = None, height: int = None) -> Optional[ImageTk.PhotoImage]:
-        """Mevcut frame'i Tkinter PhotoImage olarak döndür"""
-        pil_image = self.get_current_frame_as_pil()
-        if pil_image:
-            try:
-                # Boyutlandır
-                if width and height:
-                    pil_image = pil_image.resize((width, height), Image.Resampling.LANCZOS)
-                
-                return ImageTk.PhotoImage(pil_image)
-            except Exception as e:
-                print(f"[CAMERA STREAM] Tkinter dönüştürme hatası: {e}")
+    def _frame_to_pil(self, frame: Frame, pixel_format: str) -> Optional[Image.Image]:
+        """Frame'i istenen formatta PIL Image'a çevir"""
+        # Native array havuza dönmez - dönüşüm buffer'ı yerine ondan kopya üret
+        pixels = frame.pixels()
+        if pixels is None:
+            return None
+        return Image.fromarray(convert_pixels(pixels, frame.native_format, pixel_format))
+    
+    def get_current_frame_as_tkinter(self, width: int = None, height: int = None,
+                                     pixel_format: str = 'RGB') -> Optional[ImageTk.PhotoImage]:
+        """
+        Mevcut frame'i Tkinter PhotoImage olarak döndür
+        Aynı frame aynı boyut/formatta tekrar istenirse önbellekteki görüntü döner
+        (Tk thread'inden çağrılmalı)
+        """
+        frame = self.current_frame
+        if frame is None:
+            return None
+        if not (width and height):
+            width = height = None
+        
+        try:
+            pixel_format = validate_pixel_format(pixel_format)
+            cached = self.tk_image_cache.get(frame.seq, width, height, pixel_format)
+            if cached is not None:
+                return cached
+            
+            pil_image = self._frame_to_pil(frame, pixel_format)
+            if pil_image is None:
+                return None
+            
+            # Boyutlandır
+            if width and height:
+                pil_image = pil_image.resize((width, height), Image.Resampling.LANCZOS)
+            
+            photo = ImageTk.PhotoImage(pil_image)
+            self.tk_image_cache.put(frame.seq, width, height, pixel_format, photo)
+            return photo
+        except Exception as e:
+            print(f"[CAMERA STREAM] Tkinter dönüştürme hatası: {e}")
         return None
     
-    def save_current_frame(self, filename: str) -> bool:
-        """Mevcut frame'i dosyaya kaydet"""
-        pil_image = self.get_current_frame_as_pil()
+    def save_current_frame(self, filename: str,
+                           overlay: Optional[Callable[[np.ndarray], None]] = None) -> bool:
+        """
+        Mevcut frame'i dosyaya kaydet (her zaman tam çözünürlük)
+        overlay verilirse kaydetmeden önce (H, W, 3) RGB kopya üzerinde yerinde çağrılır (ör. HUD)
+        """
+        pil_image = None
+        if self.decode_scale != 1 and self.last_jpeg is not None:
+            frame, pixel_format = self._decode_jpeg_frame(self.last_jpeg, full_resolution=True)
+            if frame is not None:
+                pil_image = Image.fromarray(convert_pixels(frame, pixel_format, 'RGB'))
+        if pil_image is None:
+            pil_image = self.get_current_frame_as_pil()
         if pil_image:
             try:
+                if overlay is not None:
+                    pixels = np.array(pil_image)
+                    overlay(pixels)
+                    pil_image = Image.fromarray(pixels)
                 pil_image.save(filename)
                 print(f"[CAMERA STREAM] Frame kaydedildi: {filename}")
                 return True
@@ -245,12 +779,83 @@ class CameraStreamClient:
                 print(f"[CAMERA STREAM] Frame kaydetme hatası: {e}")
         return False
     
-    def register_frame_callback(self, callback: Callable[[np.ndarray], None]):
-        """Frame callback'i kaydet"""
-        self.frame_callback = callback
+    def register_frame_callback(self, callback: Callable[[np.ndarray], None], pixel_format: str = 'RGB',
+                                size: Optional[Tuple[int, int]] = None,
+                                max_rate: Optional[float] = None,
+                                name: Optional[str] = None,
+                                passive: bool = False) -> FrameSubscription:
+        """
+        Frame aboneliği ekle - birden fazla abone olabilir
+        pixel_format: 'RGB', 'BGR', 'GRAY' veya 'FRAME'
+        'FRAME': callback decode edilmemiş Frame nesnesi alır (pikseller ilk erişimde decode edilir)
+        size: (genişlik, yükseklik) - verilirse frame bu boyutta iletilir ve decode ölçeği buna göre seçilir;
+              verilmezse abone tam çözünürlük ister (başka abonenin boyutuna göre küçültülmez)
+        passive: True ise abone decode çözünürlüğünü etkilemez (ör. istatistik toplayan veya
+                 frame'i çözünürlüğünü kendisi bildiren bir tüketiciye aktaran aboneler)
+        max_rate: saniyede en fazla kaç frame iletileceği
+        Aynı callback tekrar kaydedilirse ayarları güncellenir
+        Verilen array callback döndükten sonra havuza dönebilir; saklanacaksa kopyalanmalı
+        (FRAME tüketicileri bunun yerine frame.retain() / frame.release() kullanabilir)
+        """
+        self.unregister_frame_callback(callback)
+        subscription = self.frame_bus.subscribe(callback, name, pixel_format, size, max_rate, passive)
+        if not passive:
+            # size None: tam çözünürlük - hiçbir şey gösterilen/kaydedilenden küçük decode edilmez
+            self.set_consumer_size(f"subscriber:{subscription.name}", subscription.size)
+        return subscription
+    
+    def unregister_frame_callback(self, target):
+        """Frame aboneliğini (veya callback'ini) kaldır"""
+        subscription = self.frame_bus.unsubscribe(target)
+        if subscription is not None and not subscription.passive:
+            self.remove_consumer_size(f"subscriber:{subscription.name}")
     
-    def register_connection_callback(self, callback: Callable[[bool], None]):
-        """Bağlantı durumu callback'i kaydet"""
+    def enable_shared_memory(self, name: str = DEFAULT_RING_NAME, slots: int = 4,
+                             slot_capacity: int = 1920 * 1080 * 3,
+                             pixel_format: str = 'BGR',
+                             size: Optional[Tuple[int, int]] = None) -> SharedFrameRingWriter:
+        """
+        Decode edilen frame'leri shared memory halkasına da yaz
+        Diğer süreçler SharedFrameRingReader(name) ile kopyasız okur
+        size: (genişlik, yükseklik) - verilmezse halkaya tam çözünürlük yazılır
+        """
+        self.disable_shared_memory()
+        self._shared_ring_format = validate_pixel_format(pixel_format)
+        self._shared_ring_size = (int(size[0]), int(size[1])) if size else None
+        with self._shared_ring_lock:
+            self._shared_ring = SharedFrameRingWriter(name, slots, slot_capacity)
+        # Halka decode boyutunu kendi boyutuyla belirler (None: tam çözünürlük)
+        self.set_consumer_size('shared_memory', self._shared_ring_size)
+        self.register_frame_callback(self._write_shared_frame, FRAME_FORMAT, name='shared_memory', passive=True)
+        return self._shared_ring
+    
+    def disable_shared_memory(self):
+        """Shared memory halkasını kapat ve sil"""
+        if self._shared_ring is None:
+            return
+        # Önce abonelik kaldırılır, sonra devam eden yazma bitince halka kapatılır
+        self.unregister_frame_callback(self._write_shared_frame)
+        self.remove_consumer_size('shared_memory')
+        with self._shared_ring_lock:
+            ring, self._shared_ring = self._shared_ring, None
+            if ring is not None:
+                ring.close(unlink=True)
+    
+    def _write_shared_frame(self, frame: Frame):
+        """Frame tüketicisi: frame'i halkaya kopyala"""
+        if self._shared_ring is None:
+            return
+        pixels = frame.pixels(self._shared_ring_format, self._shared_ring_size)
+        if pixels is None:
+            return
+        with self._shared_ring_lock:
+            ring = self._shared_ring
+            if ring is not None:
+                ring.write(frame.seq, pixels, self._shared_ring_format,
+                           frame.capture_ts or frame.receive_ts)
+    
+    def register_connection_callback(self, callback: Callable[[bool, Dict[str, Any]], None]):
+        """Bağlantı durumu callback'i kaydet - (bağlı mı, olay detayları)"""
         self.connection_callback = callback
     
     def register_error_callback(self, callback: Callable[[str], None]):
@@ -261,15 +866,82 @@ class CameraStreamClient:
         """FPS callback'i kaydet"""
         self.fps_callback = callback
     
+    def mark_frame_displayed(self, seq: Optional[int] = None):
+        """GUI frame'i ekrana bastığında çağırır (seq verilmezse son teslim edilen)"""
+        if seq is None:
+            seq = self.last_frame_seq
+        if seq is not None:
+            self.latency.on_displayed(seq, time.time())
+        
+        # İlk frame gecikmesi: start_stream çağrısından ilk frame ekranda görünene kadar
+        if self.time_to_first_frame is None and self._start_requested_at is not None:
+            self.time_to_first_frame = time.perf_counter() - self._start_requested_at
+            print(f"[CAMERA STREAM] İlk frame ekranda: {self.time_to_first_frame * 1000:.0f} ms")
+    
+    def get_frame_counters(self) -> Dict[str, int]:
+        """Frame sayaçlarını döndür (alım -> decode -> teslim)"""
+        return {
+            'received': self.frames_received,
+            'decoded': self.frames_decoded,
+            'decode_failed': self.decode_failures,
+            'dropped_stale': self.stale_drops,
+            'dropped_late': self.late_drops,
+            'delivered': self.frames_delivered,
+            'parse_dropped': self.parse_drops,
+            'sequence_gaps': self.sequence_gaps,
+            'last_seq': self.last_frame_seq
+        }
+    
     def get_stream_info(self) -> dict:
         """Stream bilgilerini döndür"""
         return {
             'streaming': self.streaming,
             'connected': self.connected,
             'stream_url': self.stream_url,
+            'transport': 'raw_socket' if self.use_raw_socket else 'requests',
             'frame_count': self.frame_count,
             'fps': getattr(self, 'fps_counter', 0),
-            'last_frame_shape': self.last_frame.shape if self.last_frame is not None else None
+            'time_to_first_received': self.time_to_first_received,
+            'time_to_first_frame': self.time_to_first_frame,
+            'decode_target': self.decode_target,
+            'decode_scale': self.decode_scale,
+            'decode_pool': self._decode_pool.get_stats() if self._decode_pool else None,
+            'decoder': {
+                'requested': self.decoder_backend,
+                'active': self.decoder.name,
+                'benchmark_ms': dict(self.decoder_benchmark)
+            },
+            'frames': self.get_frame_counters(),
+            'latency': self.latency.get_summary(),
+            'watchdog': {
+                'stall_timeout': self.stall_timeout,
+                'frame_timeout': self.frame_timeout,
+                'stalls': self.stall_count,
+                'server_closes': self.server_close_count,
+                'last_byte_age': round(time.perf_counter() - self._last_byte_time, 3) if self._last_byte_time else None,
+                'reconnects': self.reconnect_count,
+                'last_stall_duration': self.last_stall_duration,
+                'last_reconnect_duration': self.last_reconnect_duration
+            },
+            'boundary': self.boundary.decode('latin-1') if self.boundary else None,
+            'resync': {
+                'count': self.parse_drops,
+                'reasons': dict(self.resync_reasons),
+                'bytes_discarded': self.resync_bytes_discarded,
+                'last_reason': self.last_resync_reason,
+                'buffer_capacity': self.receive_buffer_size
+            },
+            'parse_path': {
+                'content_length': self.length_frames,
+                'boundary_scan': self.scan_frames,
+                'last': self.last_frame_path
+            },
+            'native_pixel_format': self.last_frame_format,
+            'subscribers': self.frame_bus.get_stats(),
+            'buffer_pool': self.buffer_pool.get_stats(),
+            'tk_image_cache': self.tk_image_cache.get_stats(),
+            'shared_memory': self._shared_ring.get_stats() if self._shared_ring else None,
+            'last_frame_shape': self.current_frame.shape if self.current_frame is not None else None
         }
 
 # Test fonksiyonu
@@ -295,8 +967,8 @@ if __name__ == "__main__":
             plt.draw()
             plt.pause(0.001)
     
-    def on_connection_changed(connected):
-        print(f"🔗 Stream bağlantısı: {'Aktif' if connected else 'Kesildi'}")
+    def on_connection_changed(connected, details):
+        print(f"🔗 Stream bağlantısı: {'Aktif' if connected else 'Kesildi'} {details}")
     
     def on_fps_update(fps):
         print(f"📊 FPS: {fps}")
@@ -320,15 +992,9 @@ if __name__ == "__main__":
         print("Ctrl+C ile durdurun...")
         
         try:
+            # Yeniden bağlanma client içindeki watchdog tarafından yapılır
             while True:
                 time.sleep(0.1)
-                
-                # Stream durumunu kontrol et
-                if not client.connected:
-                    print("Stream bağlantısı kesildi, yeniden bağlanıyor...")
-                    client.stop_stream()
-                    time.sleep(2)
-                    client.start_stream()
                     
         except KeyboardInterrupt:
             print("\n🛑 Durduruldu")
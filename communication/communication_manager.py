@@ -1,11 +1,13 @@
 # gui/communication/communication_manager.py
-from typing import Dict, Any, Callable, Optional
+from typing import Dict, Any, Callable, Optional, Tuple
 import time
 import threading
 from datetime import datetime, timedelta
 
 from .websocket_client import WebSocketCommunicationClient
 from .camera_stream_client import CameraStreamClient
+from .async_camera_stream_client import AsyncCameraStreamClient
+from .frame import FRAME_FORMAT, Frame
 
 class CommunicationManager:
     """
@@ -15,18 +17,25 @@ class CommunicationManager:
     
     def __init__(self, raspberry_ip: str = "localhost", 
                  stream_port: int = 9001,      # MJPEG stream
-                 ws_port: int = 9000):         # WebSocket
+                 ws_port: int = 9000,          # WebSocket
+                 camera_async: bool = False,   # Kamera WebSocket loop'unda çalışsın
+                 camera_decoder: str = 'auto'):  # JPEG decoder backend'i
         
         # WebSocket Client (komutlar + durum verileri)
         self.ws_client = WebSocketCommunicationClient(raspberry_ip, ws_port)
         
         # Camera Stream Client
-        self.camera_client = CameraStreamClient(raspberry_ip, stream_port)
+        self.camera_async = camera_async
+        if camera_async:
+            self.camera_client = AsyncCameraStreamClient(raspberry_ip, stream_port, decoder=camera_decoder)
+        else:
+            self.camera_client = CameraStreamClient(raspberry_ip, stream_port, decoder=camera_decoder)
         
         # Durum takibi
         self.connected = False
         self.ws_connected = False
         self.camera_connected = False
+        self.camera_link_event: Dict[str, Any] = {}
         
         # Son alınan veri
         self.last_system_data = {}
@@ -34,7 +43,6 @@ class CommunicationManager:
         
         # Callback fonksiyonları
         self.data_callback: Optional[Callable] = None
-        self.frame_callback: Optional[Callable] = None
         self.connection_callback: Optional[Callable] = None
         self.error_callback: Optional[Callable] = None
         
@@ -46,7 +54,13 @@ class CommunicationManager:
             'connection_attempts': 0,
             'last_command_time': None,
             'last_data_time': None,
-            'last_frame_time': None
+            'last_frame_time': None,
+            'camera_time_to_first_frame': None,
+            'camera_stalls': 0,
+            'camera_server_closes': 0,
+            'camera_reconnects': 0,
+            'camera_last_stall_duration': None,
+            'camera_last_reconnect_duration': None
         }
         
         self._setup_client_callbacks()
@@ -61,7 +75,9 @@ class CommunicationManager:
         self.ws_client.register_error_callback(self._on_error)
         
         # Camera Client callbacks
-        self.camera_client.register_frame_callback(self._on_frame_received)
+        # Kimse piksel istemeden decode yapılmasın - frame'ler tembel iletilir
+        # Sadece istatistik ve last_frame - decode çözünürlüğünü etkilemez
+        self.camera_client.register_frame_callback(self._on_frame_received, FRAME_FORMAT, name='comm_manager', passive=True)
         self.camera_client.register_connection_callback(self._on_camera_connection_changed)
         self.camera_client.register_error_callback(self._on_error)
     
@@ -69,12 +85,20 @@ class CommunicationManager:
         """Tüm iletişimi başlat"""
         print("[COMM MANAGER] İletişim başlatılıyor...")
         self.stats['connection_attempts'] += 1
+        self.stats['camera_time_to_first_frame'] = None
         
-        # WebSocket bağlantısını başlat
-        ws_success = self.ws_client.start_connection()
-        
-        # Kamera stream'ini başlat
-        camera_success = self.camera_client.start_stream()
+        if self.camera_async:
+            # Kamera WebSocket'in event loop'unu paylaşır - önce loop açılmalı
+            ws_success = self.ws_client.start_connection()
+            self.camera_client.attach_loop(self.ws_client.loop)
+            camera_success = self.camera_client.start_stream()
+        else:
+            # Kamera stream'ini önce başlat - WebSocket bağlantı beklemesi
+            # (max 3 sn) ilk frame gecikmesine eklenmesin
+            camera_success = self.camera_client.start_stream()
+            
+            # WebSocket bağlantısını başlat
+            ws_success = self.ws_client.start_connection()
         
         # Genel bağlantı durumunu güncelle
         self._update_overall_connection_status()
@@ -96,9 +120,9 @@ class CommunicationManager:
         """Tüm iletişimi durdur"""
         print("[COMM MANAGER] İletişim durduruluyor...")
         
-        # Client'ları durdur
-        self.ws_client.stop_connection()
+        # Client'ları durdur - kamera önce (paylaşılan loop kapanmadan task iptal edilsin)
         self.camera_client.stop_stream()
+        self.ws_client.stop_connection()
         
         # Durumu güncelle
         self.connected = False
@@ -126,12 +150,30 @@ class CommunicationManager:
         return success
     
     def get_current_frame_for_gui(self, width: int = None, height: int = None):
-        """GUI için mevcut frame'i al"""
+        """GUI için mevcut frame'i al (aynı frame ve boyut için önbellekteki PhotoImage döner)"""
         return self.camera_client.get_current_frame_as_tkinter(width, height)
     
-    def save_current_frame(self, filename: str) -> bool:
-        """Mevcut frame'i kaydet"""
-        return self.camera_client.save_current_frame(filename)
+    def set_camera_consumer_size(self, name: str, size: Optional[Tuple[int, int]]):
+        """Kamera görüntüsü tüketicisinin çözünürlüğünü bildir (küçültülmüş decode için)"""
+        self.camera_client.set_consumer_size(name, size)
+    
+    def remove_camera_consumer_size(self, name: str):
+        """Kamera görüntüsü tüketicisini decode boyutu hesabından çıkar"""
+        self.camera_client.remove_consumer_size(name)
+    
+    def get_current_frame_seq(self) -> Optional[int]:
+        """Son teslim edilen frame'in sıra numarası"""
+        return self.camera_client.last_frame_seq
+    
+    def report_frame_displayed(self, seq: Optional[int] = None):
+        """GUI'nin frame'i gösterdiğini kamera client'ına ilet (gecikme ölçümü)"""
+        self.camera_client.mark_frame_displayed(seq)
+        if self.stats['camera_time_to_first_frame'] is None:
+            self.stats['camera_time_to_first_frame'] = self.camera_client.time_to_first_frame
+    
+    def save_current_frame(self, filename: str, overlay: Optional[Callable] = None) -> bool:
+        """Mevcut frame'i kaydet (overlay: kaydetmeden önce RGB array'e uygulanır)"""
+        return self.camera_client.save_current_frame(filename, overlay)
     
     def _on_ws_data_received(self, data: Dict[str, Any]):
         """WebSocket'tan veri alındığında"""
@@ -149,16 +191,13 @@ class CommunicationManager:
             if self.error_callback:
                 self.error_callback(f"WebSocket veri hatası: {e}")
     
-    def _on_frame_received(self, frame):
-        """Camera client'tan frame alındığında"""
+    def _on_frame_received(self, frame: Frame):
+        """Camera client'tan frame alındığında (Frame alış zamanını taşır)"""
         try:
             self.last_frame = frame
             self.stats['frames_received'] += 1
-            self.stats['last_frame_time'] = datetime.now()
-            
-            # Frame callback'ini tetikle
-            if self.frame_callback:
-                self.frame_callback(frame)
+            self.stats['last_frame_time'] = (datetime.fromtimestamp(frame.receive_ts)
+                                             if frame.receive_ts else datetime.now())
         
         except Exception as e:
             print(f"[COMM MANAGER] Frame işleme hatası: {e}")
@@ -169,9 +208,22 @@ class CommunicationManager:
         self._update_overall_connection_status()
         print(f"[COMM MANAGER] WebSocket: {'Aktif' if connected else 'Kesildi'}")
     
-    def _on_camera_connection_changed(self, connected: bool):
-        """Kamera bağlantı durumu değiştiğinde"""
+    def _on_camera_connection_changed(self, connected: bool, details: Optional[Dict[str, Any]] = None):
+        """Kamera bağlantı durumu değiştiğinde (stall/reconnect detayları ile)"""
         self.camera_connected = connected
+        details = details or {}
+        self.camera_link_event = details
+        
+        event = details.get('event')
+        if event == 'stalled':
+            self.stats['camera_stalls'] += 1
+            self.stats['camera_last_stall_duration'] = details.get('stall_duration')
+        elif event == 'closed':
+            self.stats['camera_server_closes'] += 1
+        elif event == 'reconnected':
+            self.stats['camera_reconnects'] += 1
+            self.stats['camera_last_reconnect_duration'] = details.get('reconnect_duration')
+        
         self._update_overall_connection_status()
         print(f"[COMM MANAGER] Kamera stream'i: {'Aktif' if connected else 'Kesildi'}")
     
@@ -191,6 +243,7 @@ class CommunicationManager:
             'overall_connected': self.connected,
             'ws_connected': self.ws_connected,
             'camera_connected': self.camera_connected,
+            'camera_link_event': self.camera_link_event,
             'raspberry_ip': self.ws_client.raspberry_ip,
             'ws_port': self.ws_client.ws_port,
             'stream_port': self.camera_client.stream_port
@@ -206,9 +259,21 @@ class CommunicationManager:
         """Sistem verisi callback'i kaydet"""
         self.data_callback = callback
     
-    def register_frame_callback(self, callback: Callable[[Any], None]):
-        """Frame callback'i kaydet"""
-        self.frame_callback = callback
+    def register_frame_callback(self, callback: Callable[[Any], None], pixel_format: str = 'RGB',
+                                size: Optional[Tuple[int, int]] = None,
+                                max_rate: Optional[float] = None,
+                                name: Optional[str] = None, passive: bool = False):
+        """
+        Kamera frame aboneliği ekle (birden fazla abone olabilir)
+        'FRAME' verilirse decode edilmemiş Frame nesnesi iletilir
+        size verilmeyen (ve passive olmayan) abone tam çözünürlük ister
+        Abonelik nesnesi döner - kaldırmak için unregister_frame_callback
+        """
+        return self.camera_client.register_frame_callback(callback, pixel_format, size, max_rate, name, passive)
+    
+    def unregister_frame_callback(self, target):
+        """Frame aboneliğini kaldır"""
+        self.camera_client.unregister_frame_callback(target)
     
     def register_connection_callback(self, callback: Callable[[bool, Dict[str, Any]], None]):
         """Bağlantı durumu callback'i kaydet"""
@@ -230,6 +295,7 @@ class CommunicationManager:
             'stats': self.stats.copy(),
             'last_data': self.last_system_data.copy() if self.last_system_data else {},
             'camera_info': self.camera_client.get_stream_info(),
+            'camera_frames': self.camera_client.get_frame_counters(),
             'ws_info': self.ws_client.get_connection_status()
         }
     
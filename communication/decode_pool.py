@@ -0,0 +1,247 @@
+# gui/communication/decode_pool.py
+"""
+Sıralı teslimli paralel JPEG decode havuzu
+Frame'ler birden fazla worker'da aynı anda decode edilir, sonuçlar sıra
+numarasına göre teslim edilir. Önündeki frame'ler teslim edilmişken hâlâ
+bitmemiş (geç kalmış) frame'ler atılır - sıra asla bozulmaz
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .jpeg_decoders import JPEGDecoder, create_decoder
+
+POOL_MODES = ('thread', 'process')
+
+# submit_ready ile eklenen (decode gerektirmeyen) öğelerin sonucu
+_READY = object()
+
+# Hazır frame'in önündeki frame için en fazla bekletileceği süre: frame aralığının bu kadarı
+REORDER_FRACTION = 0.5
+# Frame aralığı henüz ölçülmediyse varsayılan (30 FPS)
+DEFAULT_FRAME_INTERVAL = 1.0 / 30
+
+# Process worker'larında backend başına tek decoder örneği
+_process_decoders: Dict[str, JPEGDecoder] = {}
+
+
+def decode_in_process(backend: str, jpeg_data: bytes, scale: int) -> Optional[np.ndarray]:
+    """Process havuzu için modül seviyesinde (pickle edilebilir) decode fonksiyonu"""
+    decoder = _process_decoders.get(backend)
+    if decoder is None:
+        decoder = create_decoder(backend)
+        _process_decoders[backend] = decoder
+    return decoder.decode(jpeg_data, scale)
+
+
+class OrderedDecodePool:
+    """
+    Paralel decode + sıralı teslim
+    - submit(): en fazla `workers` frame aynı anda işlenir, doluysa bekler
+      (bu sürede alım tarafındaki mailbox eski frame'lerin üzerine yazar)
+    - Teslim thread'i sonuçları gönderim sırasıyla on_result'a verir
+    - Sıradaki frame bitmeden arkasındakilerden biri bittiyse o hazır frame en
+      fazla reorder_timeout bekletilir; süre dolunca sıradaki frame geç kalmış
+      sayılır ve atlanır (context on_late'e verilir). Atlanan frame'in worker
+      slot'u decode'u bitene kadar dolu kalır
+    - reorder_timeout verilmezse ölçülen frame aralığının REORDER_FRACTION'ı kullanılır
+    - submit_ready(): decode gerektirmeyen öğe de aynı sırayla ve aynı
+      thread'den teslim edilir (frame None)
+    Thread modunda cv2/turbojpeg decode sırasında GIL'i bırakır; process
+    modunda sonuç array'i pickle ile geri kopyalanır
+    """
+
+    def __init__(self, on_result: Callable[[int, Any, Optional[np.ndarray]], None],
+                 workers: int = 2, mode: str = 'thread',
+                 reorder_timeout: Optional[float] = None,
+                 on_late: Optional[Callable[[int, Any], None]] = None):
+        if mode not in POOL_MODES:
+            raise ValueError(f"Bilinmeyen havuz modu: {mode} (desteklenen: {', '.join(POOL_MODES)})")
+
+        self.on_result = on_result  # (seq, context, frame veya None)
+        self.workers = max(1, workers)
+        self.mode = mode
+        self.reorder_timeout = reorder_timeout  # None: frame aralığına göre
+        self.on_late = on_late  # Geç kalıp atlanan frame'in (seq, context) ile çağrılır
+
+        if mode == 'process':
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='jpeg-decode')
+
+        self._slots = threading.Semaphore(self.workers)
+        self._cond = threading.Condition()
+        self._pending: Deque[Tuple[int, Any, Future]] = deque()
+        self._done_at: Dict[Future, float] = {}
+        self._closed = False
+
+        # Gönderimler arası süre (hareketli ortalama)
+        self.frame_interval = DEFAULT_FRAME_INTERVAL
+        self._last_enqueue: Optional[float] = None
+
+        # İstatistikler
+        self.submitted = 0
+        self.delivered = 0
+        self.late_drops = 0
+        self.failures = 0
+        self.passed_through = 0
+        self.peak_in_flight = 0
+
+        self._delivery_thread = threading.Thread(target=self._delivery_loop, daemon=True)
+        self._delivery_thread.start()
+
+    def submit(self, seq: int, context: Any, fn: Callable, *args) -> bool:
+        """Decode işini kuyruğa al - havuz kapandıysa False"""
+        return self._enqueue(seq, context, lambda: self._executor.submit(fn, *args))
+
+    def submit_ready(self, seq: int, context: Any) -> bool:
+        """Decode gerektirmeyen öğeyi sıraya ekle - havuz kapandıysa False"""
+        def ready() -> Future:
+            future = Future()
+            future.set_result(_READY)
+            return future
+        return self._enqueue(seq, context, ready)
+
+    def _enqueue(self, seq: int, context: Any, make_future: Callable[[], Future]) -> bool:
+        now = time.perf_counter()
+        if self._last_enqueue is not None:
+            self.frame_interval += 0.1 * ((now - self._last_enqueue) - self.frame_interval)
+        self._last_enqueue = now
+
+        while not self._slots.acquire(timeout=0.1):
+            if self._closed:
+                return False
+        if self._closed:
+            self._slots.release()
+            return False
+
+        future = make_future()
+        with self._cond:
+            self._pending.append((seq, context, future))
+            self.submitted += 1
+            self.peak_in_flight = max(self.peak_in_flight, len(self._pending))
+        future.add_done_callback(self._on_future_done)
+        return True
+
+    def _on_future_done(self, future: Future):
+        """Decode bitti - bitiş zamanını kaydet, teslim thread'ini uyandır"""
+        with self._cond:
+            if any(f is future for _, _, f in self._pending):
+                self._done_at[future] = time.perf_counter()
+            self._cond.notify_all()
+
+    def get_reorder_timeout(self) -> float:
+        """Hazır frame'in sıradaki için en fazla bekletileceği süre"""
+        if self.reorder_timeout is not None:
+            return self.reorder_timeout
+        return self.frame_interval * REORDER_FRACTION
+
+    def _next_ready(self) -> Optional[Tuple[int, Any, Future]]:
+        """
+        Teslim thread'i: sıradaki frame bitene kadar bekle ve onu döndür (kapandıysa None)
+        Geç kalan frame'ler sıradan çıkarılıp on_late'e verilir
+        """
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        return None
+                    if not self._pending:
+                        self._cond.wait()
+                        continue
+                    head = self._pending[0]
+                    if head[2].done():
+                        self._pending.popleft()
+                        self._done_at.pop(head[2], None)
+                        return head
+                    # Arkadaki en erken biten frame ne zamandır sırasını bekliyor
+                    ready_since = min((self._done_at[f] for _, _, f in self._pending if f in self._done_at),
+                                      default=None)
+                    if ready_since is None:
+                        self._cond.wait()
+                        continue
+                    remaining = ready_since + self.get_reorder_timeout() - time.perf_counter()
+                    if remaining > 0:
+                        self._cond.wait(remaining)
+                        continue
+                    # Sıradaki frame geç kaldı - arkadaki hazır frame daha fazla bekletilmez
+                    self._pending.popleft()
+                    self.late_drops += 1
+                    break
+
+            seq, context, future = head
+            # Başlamadıysa iptal edilir; çalışıyorsa slot decode bitince boşalır
+            future.cancel()
+            future.add_done_callback(lambda _future: self._slots.release())
+            if self.on_late:
+                self.on_late(seq, context)
+
+    def _delivery_loop(self):
+        """Sonuçları gönderim sırasıyla teslim et, geç kalanları at"""
+        while True:
+            head = self._next_ready()
+            if head is None:
+                return
+            seq, context, future = head
+            self._slots.release()
+
+            try:
+                frame = future.result()
+            except Exception as e:
+                print(f"[DECODE POOL] Decode hatası (seq {seq}): {e}")
+                frame = None
+
+            if frame is _READY:
+                frame = None
+                self.passed_through += 1
+            elif frame is None:
+                self.failures += 1
+            else:
+                self.delivered += 1
+            try:
+                self.on_result(seq, context, frame)
+            except Exception as e:
+                print(f"[DECODE POOL] Teslim hatası: {e}")
+
+    def close(self, timeout: float = 3.0) -> List[Any]:
+        """
+        Havuzu kapat - bekleyen işler iptal edilir
+        Teslim edilmeyen öğelerin context'leri döner (sahibi serbest bırakmalıdır)
+        """
+        with self._cond:
+            if self._closed:
+                return []
+            self._closed = True
+            discarded = [context for _, context, _ in self._pending]
+            self._pending.clear()
+            self._done_at.clear()
+            self._cond.notify_all()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._delivery_thread is not threading.current_thread():
+            self._delivery_thread.join(timeout=timeout)
+        return discarded
+
+    @property
+    def in_flight(self) -> int:
+        """Teslim bekleyen frame sayısı"""
+        return len(self._pending)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Havuz istatistikleri"""
+        return {
+            'mode': self.mode,
+            'workers': self.workers,
+            'submitted': self.submitted,
+            'delivered': self.delivered,
+            'late_drops': self.late_drops,
+            'reorder_timeout_ms': self.get_reorder_timeout() * 1000,
+            'failures': self.failures,
+            'passed_through': self.passed_through,
+            'in_flight': self.in_flight,
+            'peak_in_flight': self.peak_in_flight
+        }
@@ -0,0 +1,176 @@
+# gui/communication/frame.py
+"""
+Tembel (lazy) decode edilen kamera frame'i
+Frame sıkıştırılmış JPEG'i, kaynak ve aşama zaman damgalarını taşır;
+pikseller ilk erişimde bir kez decode edilir ve saklanır. Piksel isteyen
+kimse yoksa decode hiç yapılmaz. __slots__ sayesinde frame başına
+__dict__ ayrılmaz; varyant sözlüğü ve buffer listesi sadece gerekirse oluşur
+"""
+
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .buffer_pool import FrameBufferPool, PooledBuffer
+from .pixel_formats import convert_pixels, converted_shape
+
+# Tüketici frame'i decode etmeden (JPEG + tembel pikseller) almak istiyorsa
+FRAME_FORMAT = 'FRAME'
+
+
+class Frame:
+    """
+    Sıkıştırılmış JPEG + ilk erişimde decode edilen pikseller
+    decode fonksiyonu (frame) -> (piksel array'i veya None, native format) döndürür
+
+    Zaman damgaları time.time() cinsindendir:
+    capture_ts (Pi'nin X-Timestamp'i, yoksa None), receive_ts, decode_ts
+
+    Referans sayımı: oluşturan 1 referansa sahiptir. Frame'i callback
+    dışında saklayan tüketici retain() çağırmalı, işi bitince release()
+    etmelidir; son referans bırakılınca dönüşüm buffer'ları havuza döner
+    """
+
+    __slots__ = ('seq', 'jpeg', 'source', 'capture_ts', 'receive_ts', 'decode_ts',
+                 '_decode', '_pixels', '_native_format', '_decoded', '_variants',
+                 '_lock', '_buffer_pool', '_pooled', '_refs')
+
+    def __init__(self, seq: int, jpeg: bytes,
+                 decode: Optional[Callable[['Frame'], Tuple[Optional[np.ndarray], str]]] = None,
+                 pixels: Optional[np.ndarray] = None, pixel_format: str = 'RGB',
+                 buffer_pool: Optional[FrameBufferPool] = None,
+                 source: Optional[str] = None,
+                 capture_ts: Optional[float] = None,
+                 receive_ts: Optional[float] = None):
+        self.seq = seq
+        self.jpeg = jpeg
+        self.source = source
+        self.capture_ts = capture_ts
+        self.receive_ts = receive_ts
+        self.decode_ts: Optional[float] = None
+
+        self._decode = decode
+        self._pixels = pixels
+        self._native_format = pixel_format
+        self._decoded = pixels is not None or decode is None
+        self._variants: Optional[Dict[Tuple[str, Optional[Tuple[int, int]]], np.ndarray]] = None
+        self._lock = threading.Lock()
+
+        # Havuzdan alınan dönüşüm buffer'ları ve referans sayacı
+        self._buffer_pool = buffer_pool
+        self._pooled: Optional[List[PooledBuffer]] = None
+        self._refs = 1
+
+    def __repr__(self) -> str:
+        return f"Frame(seq={self.seq}, jpeg={len(self.jpeg)}B, decoded={self._decoded}, shape={self.shape})"
+
+    @property
+    def decoded(self) -> bool:
+        """Pikseller decode edildi mi (başarısız decode da sayılır)"""
+        return self._decoded
+
+    @property
+    def native_format(self) -> str:
+        """Decoder'ın ürettiği piksel sırası (decode edilmemişse varsayılan)"""
+        return self._native_format
+
+    @property
+    def shape(self) -> Optional[Tuple[int, ...]]:
+        """Decode edilmişse piksel boyutu - decode tetiklemez"""
+        return self._pixels.shape if self._pixels is not None else None
+
+    def set_pixels(self, pixels: Optional[np.ndarray], pixel_format: str):
+        """Başka yerde (ör. decode havuzu) decode edilmiş pikselleri ata"""
+        with self._lock:
+            self._pixels = pixels
+            self._native_format = pixel_format
+            self._decode = None
+            self._decoded = True
+
+    def pixels(self, pixel_format: Optional[str] = None,
+               size: Optional[Tuple[int, int]] = None) -> Optional[np.ndarray]:
+        """
+        Pikselleri döndür - ilk çağrıda decode edilir, sonrakiler saklanan sonucu kullanır
+        pixel_format / size (genişlik, yükseklik) verilirse her varyant bir kez üretilir
+        """
+        if not self._decoded:
+            with self._lock:
+                if not self._decoded:
+                    self._pixels, self._native_format = self._decode(self)
+                    self._decode = None
+                    self._decoded = True
+
+        pixels = self._pixels
+        if pixels is None:
+            return None
+        pixel_format = pixel_format or self._native_format
+        if size is not None and (size[0], size[1]) == (pixels.shape[1], pixels.shape[0]):
+            size = None
+        if pixel_format == self._native_format and size is None:
+            return pixels
+
+        key = (pixel_format, size)
+        variants = self._variants
+        variant = variants.get(key) if variants is not None else None
+        if variant is None:
+            with self._lock:
+                if self._variants is None:
+                    self._variants = {}
+                variant = self._variants.get(key)
+                if variant is None:
+                    variant = self._make_variant(pixels, pixel_format, size)
+                    self._variants[key] = variant
+        return variant
+
+    def _make_variant(self, pixels: np.ndarray, pixel_format: str,
+                      size: Optional[Tuple[int, int]]) -> np.ndarray:
+        """Format dönüşümü + boyutlandırma (lock altında çağrılır)"""
+        if size is None:
+            return self._convert(pixels, pixel_format)
+
+        # Önce küçült, sonra çevir: dönüşüm daha az piksel üzerinde yapılır
+        resized = self._variants.get((self._native_format, size))
+        if resized is None:
+            width, height = size
+            shape = (height, width) + tuple(pixels.shape[2:])
+            out = self._acquire(shape, pixels.dtype)
+            resized = cv2.resize(pixels, (width, height), dst=out, interpolation=cv2.INTER_AREA)
+            self._variants[(self._native_format, size)] = resized
+        if pixel_format == self._native_format:
+            return resized
+        return self._convert(resized, pixel_format)
+
+    def _acquire(self, shape: Tuple[int, ...], dtype) -> Optional[np.ndarray]:
+        """Havuzdan buffer al (havuz yoksa veya frame bırakıldıysa None - yeni array ayrılır)"""
+        if self._buffer_pool is None or self._refs <= 0:
+            return None
+        buffer = self._buffer_pool.acquire(shape, dtype)
+        if self._pooled is None:
+            self._pooled = []
+        self._pooled.append(buffer)
+        return buffer.array
+
+    def _convert(self, pixels: np.ndarray, pixel_format: str) -> np.ndarray:
+        """Format dönüşümünü havuzdan alınan buffer'a yap"""
+        out = self._acquire(converted_shape(pixels.shape, pixel_format), pixels.dtype)
+        return convert_pixels(pixels, self._native_format, pixel_format, out=out)
+
+    def retain(self) -> 'Frame':
+        """Frame'i callback sonrasında da kullanmak için referans al"""
+        with self._lock:
+            self._refs += 1
+        return self
+
+    def release(self):
+        """Referansı bırak - sonuncusuysa dönüşüm buffer'ları havuza döner"""
+        with self._lock:
+            self._refs -= 1
+            if self._refs > 0 or self._pooled is None:
+                return
+            pooled, self._pooled = self._pooled, None
+            self._variants = None
+
+        for buffer in pooled:
+            buffer.release()
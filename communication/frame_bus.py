@@ -0,0 +1,157 @@
+# gui/communication/frame_bus.py
+"""
+Çok aboneli frame dağıtımı
+Her abone hedef boyutunu, piksel formatını ve en yüksek hızını bildirir.
+Aynı (format, boyut) varyantı frame başına bir kez üretilir ve o varyantı
+isteyen tüm abonelerle paylaşılır; her abonenin kendi teslim/kayıp sayaçları vardır
+"""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from .frame import FRAME_FORMAT, Frame
+from .pixel_formats import validate_pixel_format
+
+# Zamanlama sapmasında (jitter) hız sınırı yüzünden gereksiz frame atılmasın
+_RATE_TOLERANCE = 0.9
+
+
+class FrameSubscription:
+    """Tek bir abonenin ayarları ve sayaçları"""
+
+    def __init__(self, name: str, callback: Callable, pixel_format: str = 'RGB',
+                 size: Optional[Tuple[int, int]] = None, max_rate: Optional[float] = None,
+                 passive: bool = False):
+        self.name = name
+        self.callback = callback
+        self.pixel_format = pixel_format
+        self.size = (int(size[0]), int(size[1])) if size else None
+        self.max_rate = max_rate
+        self.passive = passive  # Decode çözünürlüğünü etkilemez
+        self._min_interval = _RATE_TOLERANCE / max_rate if max_rate and max_rate > 0 else 0.0
+        self._last_delivery = 0.0
+
+        # Sayaçlar
+        self.delivered = 0
+        self.dropped_rate = 0    # Hız sınırı yüzünden atlanan
+        self.dropped_failed = 0  # Decode edilemediği için verilemeyen
+        self.errors = 0          # Callback hata fırlattı
+
+    @property
+    def wants_pixels(self) -> bool:
+        """Abone decode edilmiş piksel mi istiyor (FRAME değil)"""
+        return self.pixel_format != FRAME_FORMAT
+
+    def get_stats(self) -> Dict[str, object]:
+        """Abone sayaçları"""
+        return {
+            'format': self.pixel_format,
+            'size': self.size,
+            'max_rate': self.max_rate,
+            'passive': self.passive,
+            'delivered': self.delivered,
+            'dropped_rate': self.dropped_rate,
+            'dropped_failed': self.dropped_failed,
+            'errors': self.errors
+        }
+
+
+class FrameBus:
+    """
+    Abone listesi + frame başına varyant paylaşımı
+    Varyantlar Frame içinde saklanır (Frame.pixels(format, size)), böylece
+    aynı varyantı isteyen aboneler aynı array'i alır ve buffer'lar frame
+    bırakılınca havuza döner
+    """
+
+    def __init__(self):
+        self._subscriptions: List[FrameSubscription] = []
+        self._lock = threading.Lock()
+        self.frames_published = 0
+
+    def subscribe(self, callback: Callable, name: Optional[str] = None,
+                  pixel_format: str = 'RGB', size: Optional[Tuple[int, int]] = None,
+                  max_rate: Optional[float] = None, passive: bool = False) -> FrameSubscription:
+        """
+        Abone ekle - aynı callback tekrar eklenirse ayarları güncellenir
+        pixel_format: 'RGB', 'BGR', 'GRAY' veya 'FRAME' (decode edilmemiş Frame)
+        size: (genişlik, yükseklik) - None ise decode boyutu
+        max_rate: saniyede en fazla kaç frame (None: sınırsız)
+        passive: abone decode çözünürlüğü talebinde bulunmaz
+        """
+        if pixel_format.upper() == FRAME_FORMAT:
+            pixel_format = FRAME_FORMAT
+            size = None
+        else:
+            pixel_format = validate_pixel_format(pixel_format)
+
+        with self._lock:
+            subscriptions = [s for s in self._subscriptions if s.callback != callback]
+
+            # İsimler istatistiklerde anahtar olarak kullanılır - tekil olmalı
+            base = name or getattr(callback, '__name__', 'subscriber')
+            taken = {s.name for s in subscriptions}
+            unique, index = base, 2
+            while unique in taken:
+                unique, index = f"{base}#{index}", index + 1
+
+            subscription = FrameSubscription(unique, callback, pixel_format, size, max_rate, passive)
+            subscriptions.append(subscription)
+            self._subscriptions = subscriptions
+        return subscription
+
+    def unsubscribe(self, target: Union[FrameSubscription, Callable]) -> Optional[FrameSubscription]:
+        """Aboneliği (veya callback'in aboneliğini) kaldır"""
+        with self._lock:
+            removed = None
+            remaining = []
+            for subscription in self._subscriptions:
+                if subscription is target or subscription.callback == target:
+                    removed = subscription
+                else:
+                    remaining.append(subscription)
+            self._subscriptions = remaining
+        return removed
+
+    @property
+    def subscriptions(self) -> List[FrameSubscription]:
+        return self._subscriptions
+
+    def wants_pixels(self) -> bool:
+        """Decode edilmiş piksel isteyen abone var mı"""
+        return any(s.wants_pixels for s in self._subscriptions)
+
+    def publish(self, frame: Frame) -> int:
+        """Frame'i hızı uygun tüm abonelere ver - teslim sayısını döndürür"""
+        self.frames_published += 1
+        now = time.perf_counter()
+        delivered = 0
+
+        for subscription in self._subscriptions:
+            if subscription._min_interval and now - subscription._last_delivery < subscription._min_interval:
+                subscription.dropped_rate += 1
+                continue
+
+            if subscription.wants_pixels:
+                output = frame.pixels(subscription.pixel_format, subscription.size)
+                if output is None:
+                    subscription.dropped_failed += 1
+                    continue
+            else:
+                output = frame
+
+            subscription._last_delivery = now
+            try:
+                subscription.callback(output)
+                subscription.delivered += 1
+                delivered += 1
+            except Exception as e:
+                subscription.errors += 1
+                print(f"[FRAME BUS] '{subscription.name}' callback hatası: {e}")
+
+        return delivered
+
+    def get_stats(self) -> Dict[str, Dict[str, object]]:
+        """Abone başına sayaçlar"""
+        return {s.name: s.get_stats() for s in self._subscriptions}
@@ -0,0 +1,68 @@
+# gui/communication/frame_mailbox.py
+"""
+Alım ve decode thread'leri arasında tek slotlu, "en yeni kazanır" teslim kutusu
+Decode yetişemezse eski frame kuyrukta beklemez, yenisi üzerine yazılır
+"""
+
+import threading
+from typing import Any, Optional
+
+
+class LatestFrameMailbox:
+    """
+    Tek slotlu posta kutusu
+    - put(): slotta okunmamış öğe varsa üzerine yazar (stale drop) ve onu döndürür;
+      öğe referans sayımlıysa serbest bırakmak çağırana aittir
+    - get(): öğe gelene kadar bekler, kutu kapanınca None döner
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._item: Any = None
+        self._has_item = False
+        self._closed = False
+
+        # İstatistikler
+        self.put_count = 0
+        self.dropped = 0
+
+    def put(self, item: Any) -> Any:
+        """Öğeyi bırak - üzerine yazılan okunmamış öğeyi döndürür (yoksa None)"""
+        with self._cond:
+            evicted = self._item if self._has_item else None
+            if self._has_item:
+                self.dropped += 1
+            self._item = item
+            self._has_item = True
+            self.put_count += 1
+            self._cond.notify()
+        return evicted
+
+    def get(self, timeout: Optional[float] = None) -> Any:
+        """En yeni öğeyi al (timeout dolarsa veya kutu kapandıysa None)"""
+        with self._cond:
+            if not self._has_item and not self._closed:
+                self._cond.wait(timeout)
+            if not self._has_item:
+                return None
+            item = self._item
+            self._item = None
+            self._has_item = False
+            return item
+
+    def close(self) -> Any:
+        """
+        Kutuyu kapat - bekleyen get() çağrıları uyandırılır
+        Okunmamış öğe döndürülür (yoksa None); serbest bırakmak çağırana aittir
+        """
+        with self._cond:
+            self._closed = True
+            leftover = self._item if self._has_item else None
+            self._item = None
+            self._has_item = False
+            self._cond.notify_all()
+        return leftover
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
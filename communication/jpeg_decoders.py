@@ -0,0 +1,160 @@
+# gui/communication/jpeg_decoders.py
+"""
+Değiştirilebilir JPEG decoder backend'leri
+- OpenCV (cv2.imdecode, IMREAD_REDUCED_* ile ölçekli)
+- Pillow (draft modu ile ölçekli)
+- libjpeg-turbo (PyTurboJPEG yüklüyse)
+'auto' modda ilk frame OpenCV ile decode edilir; gerçek bir frame üzerinde
+arka planda kısa bir self-benchmark yapılıp en hızlısına geçilir
+"""
+
+import io
+import time
+from typing import Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+from PIL import Image
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+    _TURBOJPEG_AVAILABLE = True
+except ImportError:  # Opsiyonel bağımlılık
+    TurboJPEG = None
+    _TURBOJPEG_AVAILABLE = False
+
+
+class JPEGDecoder:
+    """
+    Decoder arayüzü
+    decode() frame'i native_format piksel sırasıyla (BGR/RGB) döndürür,
+    scale 1/2/4/8 ise DCT aşamasında küçültülmüş decode yapılır
+    """
+
+    name = "base"
+    native_format = "BGR"
+
+    def decode(self, jpeg_data: bytes, scale: int = 1) -> Optional[np.ndarray]:
+        raise NotImplementedError
+
+
+class OpenCVDecoder(JPEGDecoder):
+    """cv2.imdecode - BGR çıktı"""
+
+    name = "opencv"
+    native_format = "BGR"
+
+    FLAGS = {
+        1: cv2.IMREAD_COLOR,
+        2: cv2.IMREAD_REDUCED_COLOR_2,
+        4: cv2.IMREAD_REDUCED_COLOR_4,
+        8: cv2.IMREAD_REDUCED_COLOR_8,
+    }
+
+    def decode(self, jpeg_data: bytes, scale: int = 1) -> Optional[np.ndarray]:
+        nparr = np.frombuffer(jpeg_data, np.uint8)
+        return cv2.imdecode(nparr, self.FLAGS.get(scale, cv2.IMREAD_COLOR))
+
+
+class PillowDecoder(JPEGDecoder):
+    """Pillow - RGB çıktı, draft modu ile ölçekli decode"""
+
+    name = "pillow"
+    native_format = "RGB"
+
+    def decode(self, jpeg_data: bytes, scale: int = 1) -> Optional[np.ndarray]:
+        img = Image.open(io.BytesIO(jpeg_data))
+        if scale > 1:
+            img.draft('RGB', (img.width // scale, img.height // scale))
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        return np.asarray(img)
+
+
+class TurboJPEGDecoder(JPEGDecoder):
+    """PyTurboJPEG (libjpeg-turbo) - BGR çıktı"""
+
+    name = "turbojpeg"
+    native_format = "BGR"
+
+    def __init__(self):
+        self._jpeg = TurboJPEG()
+
+    def decode(self, jpeg_data: bytes, scale: int = 1) -> Optional[np.ndarray]:
+        return self._jpeg.decode(jpeg_data, pixel_format=TJPF_BGR, scaling_factor=(1, scale))
+
+
+_DECODER_CLASSES = {
+    OpenCVDecoder.name: OpenCVDecoder,
+    PillowDecoder.name: PillowDecoder,
+    TurboJPEGDecoder.name: TurboJPEGDecoder,
+}
+
+
+def _build_decoder(name: str) -> Optional[JPEGDecoder]:
+    """Tek bir backend'i oluştur - bu makinede kullanılamıyorsa None"""
+    if name == TurboJPEGDecoder.name and not _TURBOJPEG_AVAILABLE:
+        return None
+    try:
+        return _DECODER_CLASSES[name]()
+    except Exception as e:
+        # Ör. Python paketi var ama libturbojpeg bulunamadı
+        print(f"[JPEG DECODER] {name} yüklenemedi: {e}")
+        return None
+
+
+def available_decoders() -> Dict[str, JPEGDecoder]:
+    """Bu makinede kullanılabilen backend'ler (hepsi oluşturulur - benchmark için)"""
+    decoders: Dict[str, JPEGDecoder] = {}
+    for name in _DECODER_CLASSES:
+        decoder = _build_decoder(name)
+        if decoder is not None:
+            decoders[name] = decoder
+    return decoders
+
+
+def create_decoder(name: str) -> JPEGDecoder:
+    """Sadece ismi verilen backend'i oluştur (bilinmiyor veya kullanılamıyorsa ValueError)"""
+    if name not in _DECODER_CLASSES:
+        raise ValueError(f"JPEG decoder bulunamadı: {name} (bilinen: {', '.join(_DECODER_CLASSES)})")
+    decoder = _build_decoder(name)
+    if decoder is None:
+        raise ValueError(f"JPEG decoder kullanılamıyor: {name}")
+    return decoder
+
+
+def benchmark_decoders(jpeg_data: bytes, scale: int = 1, repeat: int = 5,
+                       decoders: Optional[List[JPEGDecoder]] = None) -> Dict[str, float]:
+    """Her backend için ortalama decode süresi (ms) - hata verenler atlanır"""
+    if decoders is None:
+        decoders = list(available_decoders().values())
+
+    results: Dict[str, float] = {}
+    for decoder in decoders:
+        try:
+            if decoder.decode(jpeg_data, scale) is None:  # ısınma + doğrulama
+                continue
+            t0 = time.perf_counter()
+            for _ in range(repeat):
+                decoder.decode(jpeg_data, scale)
+            results[decoder.name] = (time.perf_counter() - t0) / repeat * 1000
+        except Exception as e:
+            print(f"[JPEG DECODER] {decoder.name} benchmark hatası: {e}")
+    return results
+
+
+def select_fastest_decoder(jpeg_data: bytes, scale: int = 1,
+                           repeat: int = 5) -> Tuple[JPEGDecoder, Dict[str, float]]:
+    """
+    Örnek frame üzerinde self-benchmark yap
+    (en hızlı backend, backend başına ms) döndürür
+    """
+    decoders = available_decoders()
+    results = benchmark_decoders(jpeg_data, scale, repeat, list(decoders.values()))
+    if not results:
+        return decoders[OpenCVDecoder.name], results
+
+    summary = ", ".join(f"{name}: {ms:.2f} ms" for name, ms in sorted(results.items(), key=lambda r: r[1]))
+    best = min(results, key=results.get)
+    print(f"[JPEG DECODER] Self-benchmark ({summary}) -> {best}")
+    return decoders[best], results
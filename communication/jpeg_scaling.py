@@ -0,0 +1,69 @@
+# gui/communication/jpeg_scaling.py
+"""
+Görüntüleme boyutuna göre küçültülmüş JPEG decode yardımcıları
+libjpeg DCT aşamasında 1/2, 1/4, 1/8 ölçekleme yapabilir; tüketicinin
+göstereceğinden fazla piksel decode etmemek için ölçek buradan seçilir
+"""
+
+from typing import Optional, Tuple
+
+REDUCTION_FACTORS = (8, 4, 2)
+
+# SOF (Start Of Frame) marker'ları - DHT/JPG/DAC (C4, C8, CC) hariç
+_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+# Uzunluk alanı olmayan marker'lar
+_STANDALONE_MARKERS = frozenset([0x01, 0xD8] + list(range(0xD0, 0xD8)))
+
+
+def jpeg_dimensions(data) -> Optional[Tuple[int, int]]:
+    """
+    JPEG başlığından (genişlik, yükseklik) oku - piksel decode edilmez
+    Segment uzunlukları ile atlanır, sadece başlık kısmı taranır
+    """
+    n = len(data)
+    if n < 4 or data[0] != 0xFF or data[1] != 0xD8:
+        return None
+
+    i = 2
+    while i + 3 < n:
+        if data[i] != 0xFF:
+            return None
+        marker = data[i + 1]
+        if marker == 0xFF:
+            # Dolgu baytı
+            i += 1
+            continue
+        if marker in _STANDALONE_MARKERS:
+            i += 2
+            continue
+        if marker == 0xDA:
+            # Scan başladı, SOF bulunamadı
+            return None
+
+        length = (data[i + 2] << 8) | data[i + 3]
+        if marker in _SOF_MARKERS:
+            if i + 9 > n:
+                return None
+            height = (data[i + 5] << 8) | data[i + 6]
+            width = (data[i + 7] << 8) | data[i + 8]
+            return width, height
+        i += 2 + length
+
+    return None
+
+
+def pick_reduction(source_size: Tuple[int, int],
+                   target_size: Optional[Tuple[int, int]]) -> int:
+    """
+    Hedef boyuttan küçük olmayan en düşük çözünürlüğü veren ölçeği seç
+    1: tam çözünürlük, 2/4/8: DCT ölçekli decode
+    """
+    if target_size is None:
+        return 1
+
+    src_w, src_h = source_size
+    dst_w, dst_h = target_size
+    for factor in REDUCTION_FACTORS:
+        if src_w // factor >= dst_w and src_h // factor >= dst_h:
+            return factor
+    return 1
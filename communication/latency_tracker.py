@@ -0,0 +1,118 @@
+# gui/communication/latency_tracker.py
+"""
+Frame başına aşama zaman damgaları ve kayan pencere gecikme yüzdelikleri
+Aşamalar: capture (Pi) -> receive -> decode -> display
+Tüm zamanlar time.time() (duvar saati) ile tutulur ki Pi'nin
+X-Timestamp değeriyle karşılaştırılabilsin
+"""
+
+import threading
+from collections import deque
+from typing import Dict, Optional
+
+
+def parse_capture_timestamp(value: Optional[str]) -> Optional[float]:
+    """
+    X-Timestamp başlığını saniyeye çevir
+    Saniye, milisaniye ve mikrosaniye cinsinden epoch değerleri kabul edilir
+    """
+    if not value:
+        return None
+    try:
+        ts = float(value)
+    except ValueError:
+        return None
+
+    if ts > 1e14:      # mikrosaniye
+        ts /= 1e6
+    elif ts > 1e11:    # milisaniye
+        ts /= 1e3
+    return ts
+
+
+class LatencyWindow:
+    """Son N örnek üzerinde p50/p95/p99"""
+
+    def __init__(self, size: int = 300):
+        self._samples = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def add(self, value: float):
+        with self._lock:
+            self._samples.append(value)
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        """Yüzdelikleri milisaniye cinsinden döndür"""
+        with self._lock:
+            samples = sorted(self._samples)
+            last = self._samples[-1] if self._samples else None
+
+        if not samples:
+            return {'count': 0, 'p50': None, 'p95': None, 'p99': None, 'last': None}
+
+        def pct(p: float) -> float:
+            idx = min(len(samples) - 1, int(round(p * (len(samples) - 1))))
+            return round(samples[idx] * 1000, 2)
+
+        return {
+            'count': len(samples),
+            'p50': pct(0.50),
+            'p95': pct(0.95),
+            'p99': pct(0.99),
+            'last': round(last * 1000, 2)
+        }
+
+
+class FrameLatencyTracker:
+    """
+    Frame'lerin aşama zamanlarını sıra numarasına göre tutar
+    Kayıtlar sabit boyutlu bir halkada saklanır (frame başına dict yok)
+    """
+
+    STAGES = ('capture_to_receive', 'receive_to_decode', 'decode_to_display',
+              'receive_to_display', 'glass_to_glass')
+
+    def __init__(self, window: int = 300, ring_size: int = 64):
+        self._ring_size = ring_size
+        # Her slot: [seq, capture, receive, decoded]
+        self._ring = [[-1, None, 0.0, None] for _ in range(ring_size)]
+        self.windows = {stage: LatencyWindow(window) for stage in self.STAGES}
+
+    def _slot(self, seq: int):
+        slot = self._ring[seq % self._ring_size]
+        return slot if slot[0] == seq else None
+
+    def on_received(self, seq: int, capture_ts: Optional[float], receive_ts: float):
+        """Alım thread'i: parça ayrıştırıldı"""
+        slot = self._ring[seq % self._ring_size]
+        slot[0] = seq
+        slot[1] = capture_ts
+        slot[2] = receive_ts
+        slot[3] = None
+        if capture_ts is not None:
+            self.windows['capture_to_receive'].add(receive_ts - capture_ts)
+
+    def on_decoded(self, seq: int, decoded_ts: float):
+        """Decode thread'i: frame decode edildi"""
+        slot = self._slot(seq)
+        if slot is None:
+            return
+        slot[3] = decoded_ts
+        self.windows['receive_to_decode'].add(decoded_ts - slot[2])
+
+    def on_displayed(self, seq: int, display_ts: float):
+        """GUI thread'i: frame ekrana basıldı"""
+        slot = self._slot(seq)
+        if slot is None or slot[3] is None:
+            return
+        seq_, capture_ts, receive_ts, decoded_ts = slot
+        self.windows['decode_to_display'].add(display_ts - decoded_ts)
+        self.windows['receive_to_display'].add(display_ts - receive_ts)
+        if capture_ts is not None:
+            self.windows['glass_to_glass'].add(display_ts - capture_ts)
+        # Aynı frame iki kez sayılmasın
+        slot[3] = None
+
+    def get_summary(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """Tüm aşamaların yüzdelikleri (ms)"""
+        return {stage: window.summary() for stage, window in self.windows.items()}
@@ -0,0 +1,324 @@
+# gui/communication/mjpeg_parser.py
+"""
+MJPEG (multipart/x-mixed-replace) akışı için artımlı ayrıştırıcı
+Gelen veri tek bir bytearray'e yazılır, tarama imleci sayesinde
+daha önce bakılmış baytlar tekrar taranmaz ve kopyalanmaz
+"""
+
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+# Ayrıştırıcı durumları
+_SEEK_BOUNDARY = 0
+_HEADERS = 1
+_BODY = 2
+
+_HEADER_END = b'\r\n\r\n'
+_CRLF = b'\r\n'
+
+
+class MJPEGPart(NamedTuple):
+    """Akıştan çıkarılmış tek bir multipart parçası"""
+    payload: bytes
+    headers: Dict[str, str]
+    via_length: bool  # True: Content-Length ile kesildi, False: boundary taraması
+
+
+def boundary_from_content_type(content_type: Optional[str]) -> Optional[bytes]:
+    """
+    Content-Type başlığından multipart boundary'sini çıkar
+    'multipart/x-mixed-replace; boundary=frame' -> b'--frame'
+    """
+    if not content_type:
+        return None
+
+    for param in content_type.split(';')[1:]:
+        key, sep, value = param.partition('=')
+        if sep and key.strip().lower() == 'boundary':
+            value = value.strip().strip('"')
+            if not value:
+                return None
+            # Bazı sunucular boundary'yi '--' ile birlikte bildiriyor
+            if not value.startswith('--'):
+                value = '--' + value
+            return value.encode('latin-1')
+
+    return None
+
+
+class MJPEGStreamParser:
+    """
+    Streaming multipart ayrıştırıcı
+    - Her bayt en fazla bir kez taranır (scan cursor)
+    - Content-Length varsa gövde taranmadan doğrudan kesilir
+    - Content-Length yoksa (yedek yol) bir sonraki boundary'ye kadar taranır
+    - Buffer sabit kapasitelidir: taşma veya bozulmada veri kopyalanmadan
+      bir sonraki boundary'ye senkronize olunur (resync)
+    """
+
+    def __init__(self, boundary: bytes = b'--frame',
+                 capacity: int = 2 * 1024 * 1024,
+                 max_part_size: Optional[int] = None,
+                 max_header_size: int = 8 * 1024,
+                 on_resync: Optional[Callable[[str, int], None]] = None):
+        self.boundary = boundary
+        self.capacity = capacity
+        self.max_part_size = max_part_size if max_part_size is not None else capacity - max_header_size
+        self.max_header_size = max_header_size
+        self.on_resync = on_resync  # (sebep, atılan bayt) ile çağrılır
+
+        # Sabit kapasiteli alım buffer'ı: [_start, _end) henüz tüketilmemiş veri
+        self._buf = bytearray(capacity)
+        self._start = 0
+        self._end = 0
+        self._scan = 0  # Arama bu offset'ten devam eder
+
+        # Parça durumu
+        self._state = _SEEK_BOUNDARY
+        self._headers: Dict[str, str] = {}
+        self._content_length: Optional[int] = None
+
+        # İstatistikler
+        self.bytes_fed = 0
+        self.parts_parsed = 0
+        self.parts_dropped = 0
+        self.length_parts = 0  # Content-Length hızlı yolu
+        self.scan_parts = 0    # Boundary taraması (yedek yol)
+        self.resync_reasons: Dict[str, int] = {}
+        self.bytes_discarded = 0
+        self.peak_buffered = 0
+
+    @property
+    def resync_count(self) -> int:
+        """Toplam resync sayısı"""
+        return self.parts_dropped
+
+    def reset(self):
+        """Ayrıştırıcıyı başlangıç durumuna döndür (yeni bağlantı için)"""
+        self._start = 0
+        self._end = 0
+        self._scan = 0
+        self._state = _SEEK_BOUNDARY
+        self._headers = {}
+        self._content_length = None
+
+    def set_boundary(self, boundary: bytes):
+        """Boundary'yi değiştir ve ayrıştırıcıyı sıfırla"""
+        self.boundary = boundary
+        self.reset()
+
+    @property
+    def buffered(self) -> int:
+        """Buffer'da bekleyen (tüketilmemiş) bayt sayısı"""
+        return self._end - self._start
+
+    def feed(self, data) -> List[MJPEGPart]:
+        """Yeni veriyi ekle ve tamamlanan parçaları döndür"""
+        parts: List[MJPEGPart] = []
+        with memoryview(data) as view:
+            offset = 0
+            total = len(view)
+            while offset < total:
+                free = self._make_room()
+                n = min(free, total - offset)
+                self._buf[self._end:self._end + n] = view[offset:offset + n]
+                offset += n
+                parts.extend(self.buffer_updated(n))
+        return parts
+
+    def get_buffer(self, size_hint: int = 64 * 1024) -> memoryview:
+        """
+        recv_into için buffer'ın boş kısmını döndür (en fazla size_hint bayt)
+        Dönen memoryview buffer_updated() çağrılmadan önce serbest bırakılmalı
+        """
+        free = self._make_room()
+        return memoryview(self._buf)[self._end:self._end + min(free, size_hint)]
+
+    def buffer_updated(self, nbytes: int) -> List[MJPEGPart]:
+        """get_buffer() alanına nbytes yazıldı - tamamlanan parçaları döndür"""
+        if nbytes <= 0:
+            return []
+        self._end += nbytes
+        self.bytes_fed += nbytes
+        if self._end - self._start > self.peak_buffered:
+            self.peak_buffered = self._end - self._start
+        return self._parse()
+
+    def _make_room(self) -> int:
+        """Buffer sonunda boş yer aç ve boş bayt sayısını döndür"""
+        if self._end < self.capacity:
+            return self.capacity - self._end
+
+        # Tüketilmiş kısmı at: sadece bekleyen parça başa taşınır
+        if self._start > 0:
+            pending = self._end - self._start
+            if pending:
+                with memoryview(self._buf) as view:
+                    view[:pending] = view[self._start:self._end]
+            self._scan -= self._start
+            self._end = pending
+            self._start = 0
+
+        if self._end >= self.capacity:
+            # Buffer dolu ve hâlâ tamamlanmamış parça var -> taşma
+            self._resync('overflow')
+            keep = self._end - self._start
+            if keep:
+                self._buf[:keep] = self._buf[self._start:self._end]
+            self._start = self._scan = 0
+            self._end = keep
+
+        return self.capacity - self._end
+
+    def _parse(self) -> List[MJPEGPart]:
+        """Buffer'daki tamamlanmış parçaları çıkar"""
+        parts: List[MJPEGPart] = []
+        buf = self._buf
+        boundary = self.boundary
+        blen = len(boundary)
+
+        while True:
+            if self._state == _SEEK_BOUNDARY:
+                idx = buf.find(boundary, self._scan, self._end)
+                if idx == -1:
+                    # Boundary'ye ait olabilecek son kısım dışında her şeyi at
+                    self._start = max(self._start, self._end - blen + 1)
+                    self._scan = self._start
+                    break
+                self._start = idx + blen
+                self._scan = self._start
+                self._headers = {}
+                self._content_length = None
+                self._state = _HEADERS
+
+            elif self._state == _HEADERS:
+                idx = buf.find(_HEADER_END, self._scan, self._end)
+                if idx == -1:
+                    if self._end - self._start > self.max_header_size:
+                        self._resync('header_too_large')
+                        continue
+                    self._scan = max(self._start, self._end - len(_HEADER_END) + 1)
+                    break
+                self._parse_headers(self._start, idx)
+                self._start = idx + len(_HEADER_END)
+                self._scan = self._start
+                self._state = _BODY
+
+            else:  # _BODY
+                length = self._content_length
+                if length is not None:
+                    if length > self.max_part_size:
+                        self._resync('part_too_large')
+                        continue
+                    if self._end - self._start < length:
+                        break
+                    if length >= 2 and buf[self._start] != 0xFF:
+                        # Content-Length ile gövde uyuşmuyor - gövdenin içinden resync
+                        self._resync('bad_payload')
+                        continue
+                    trailer = self._check_trailer(self._start + length)
+                    if trailer is None:
+                        break
+                    if not trailer:
+                        # Kesik parça veya fazla büyük Content-Length: kesim bir sonraki
+                        # parçaya taşmış - sadece bu parçayı at, gövdenin başından boundary ara
+                        self._resync('length_mismatch')
+                        continue
+                    payload = bytes(buf[self._start:self._start + length])
+                    self._start += length
+                    self._scan = self._start
+                    via_length = True
+                    self.length_parts += 1
+                else:
+                    idx = buf.find(boundary, self._scan, self._end)
+                    if idx == -1:
+                        if self._end - self._start > self.max_part_size:
+                            self._resync('part_too_large')
+                            continue
+                        self._scan = max(self._start, self._end - blen + 1)
+                        break
+                    end = idx
+                    if buf.startswith(_CRLF, end - 2, end):
+                        end -= 2
+                    payload = bytes(buf[self._start:end])
+                    self._start = idx
+                    self._scan = idx
+                    via_length = False
+                    self.scan_parts += 1
+
+                self.parts_parsed += 1
+                parts.append(MJPEGPart(payload, self._headers, via_length))
+                self._state = _SEEK_BOUNDARY
+
+        return parts
+
+    def _check_trailer(self, after: int) -> Optional[bool]:
+        """
+        Content-Length ile kesilen gövdeden sonra '\r\n--boundary' veya '--boundary' gelmeli
+        True: doğru, False: uyuşmuyor, None: karar için veri yetersiz (bekle)
+        Gövde JPEG EOI (FFD9) ile bitiyor ve gelen baytlar beklenen devamla tutarlıysa
+        beklenmez - sunucu sonraki boundary'yi ancak yeni frame ile gönderiyor olabilir
+        """
+        buf = self._buf
+        available = self._end - after
+        for trailer in (_CRLF + self.boundary, self.boundary):
+            if available >= len(trailer):
+                if buf.startswith(trailer, after):
+                    return True
+            elif buf[after:self._end] == trailer[:available]:
+                if buf[after - 2:after] == b'\xff\xd9':
+                    return True
+                return None
+        return False
+
+    def _parse_headers(self, start: int, end: int):
+        """Parça başlıklarını ayrıştır (anahtarlar küçük harf)"""
+        headers: Dict[str, str] = {}
+        raw = bytes(self._buf[start:end]).decode('latin-1')
+        for line in raw.split('\r\n'):
+            key, sep, value = line.partition(':')
+            if sep:
+                headers[key.strip().lower()] = value.strip()
+
+        self._headers = headers
+        self._content_length = None
+        length = headers.get('content-length')
+        if length is not None:
+            try:
+                self._content_length = int(length)
+            except ValueError:
+                self._content_length = None
+
+    def _resync(self, reason: str):
+        """
+        Mevcut parçayı at ve bir sonraki boundary'yi ara
+        Kopyalama yapılmaz: imleçler ilerletilir, boundary'nin parçası
+        olabilecek son birkaç bayt dışında bekleyen veri yok sayılır
+        """
+        self.parts_dropped += 1
+        self.resync_reasons[reason] = self.resync_reasons.get(reason, 0) + 1
+
+        discarded = 0
+        if reason in ('bad_payload', 'length_mismatch'):
+            # Gövde başka bir parçanın başlangıcını içeriyor olabilir
+            self._scan = self._start
+        else:
+            keep_from = max(self._start, self._end - len(self.boundary) + 1)
+            discarded = keep_from - self._start
+            self.bytes_discarded += discarded
+            self._start = self._scan = keep_from
+        self._state = _SEEK_BOUNDARY
+
+        if self.on_resync:
+            self.on_resync(reason, discarded)
+
+    def get_stats(self) -> Dict[str, object]:
+        """Ayrıştırıcı istatistikleri"""
+        return {
+            'capacity': self.capacity,
+            'buffered': self.buffered,
+            'peak_buffered': self.peak_buffered,
+            'parts_parsed': self.parts_parsed,
+            'resyncs': self.parts_dropped,
+            'resync_reasons': dict(self.resync_reasons),
+            'bytes_discarded': self.bytes_discarded
+        }
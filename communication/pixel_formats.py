@@ -0,0 +1,49 @@
+# gui/communication/pixel_formats.py
+"""
+Frame piksel formatları ve dönüşümleri
+Decoder frame'i kendi native formatında (BGR/RGB) üretir; tüketiciler
+istedikleri formatı bildirir ve dönüşüm frame + format başına bir kez,
+havuzdan alınan hedef buffer'a yapılır
+"""
+
+from typing import Optional
+
+import cv2
+import numpy as np
+
+PIXEL_FORMATS = ('RGB', 'BGR', 'GRAY')
+
+_CONVERSION_CODES = {
+    ('BGR', 'RGB'): cv2.COLOR_BGR2RGB,
+    ('RGB', 'BGR'): cv2.COLOR_RGB2BGR,
+    ('BGR', 'GRAY'): cv2.COLOR_BGR2GRAY,
+    ('RGB', 'GRAY'): cv2.COLOR_RGB2GRAY,
+}
+
+
+def validate_pixel_format(pixel_format: str) -> str:
+    """Format adını normalize et (bilinmiyorsa ValueError)"""
+    fmt = pixel_format.upper()
+    if fmt not in PIXEL_FORMATS:
+        raise ValueError(f"Desteklenmeyen piksel formatı: {pixel_format} (desteklenen: {', '.join(PIXEL_FORMATS)})")
+    return fmt
+
+
+def converted_shape(shape, dst_format: str):
+    """Dönüşüm sonrası array boyutu"""
+    return tuple(shape[:2]) if dst_format == 'GRAY' else tuple(shape[:2]) + (3,)
+
+
+def convert_pixels(frame: np.ndarray, src_format: str, dst_format: str,
+                   out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    frame'i dst_format'a çevir (format aynıysa frame'in kendisi döner)
+    out verilirse sonuç yeni array ayrılmadan bu buffer'a yazılır
+    """
+    if src_format == dst_format:
+        return frame
+    code = _CONVERSION_CODES[(src_format, dst_format)]
+    if out is None:
+        return cv2.cvtColor(frame, code)
+    cv2.cvtColor(frame, code, dst=out)
+    return out
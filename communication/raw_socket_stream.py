@@ -0,0 +1,136 @@
+# gui/communication/raw_socket_stream.py
+"""
+requests'e alternatif MJPEG taşıma katmanı
+HTTP/1.1 GET doğrudan socket üzerinden yapılır, gövde recv_into ile
+MJPEGStreamParser'ın önceden ayrılmış buffer'ına okunur
+(chunk başına Python iterasyonu ve bytes nesnesi oluşmaz)
+"""
+
+import socket
+from typing import Dict, List, Optional, Tuple, Union
+
+from .mjpeg_parser import MJPEGStreamParser, MJPEGPart
+
+_MAX_HEAD_SIZE = 16 * 1024
+
+
+def build_get_request(host: str, port: int, path: str = "/") -> bytes:
+    """MJPEG stream için HTTP/1.1 GET isteği"""
+    return (
+        f"GET {path} HTTP/1.1\r\n"
+        f"Host: {host}:{port}\r\n"
+        "Accept: multipart/x-mixed-replace\r\n"
+        "Connection: close\r\n"
+        "\r\n"
+    ).encode("ascii")
+
+
+def parse_response_head(head: bytes) -> Tuple[int, Dict[str, str]]:
+    """
+    HTTP yanıt başlığını (son boş satır hariç) ayrıştır
+    (durum kodu, küçük harf anahtarlı başlıklar) döndürür
+    """
+    lines = head.decode("latin-1").split("\r\n")
+    status = lines[0].split(" ", 2)
+    if len(status) < 2 or not status[0].startswith("HTTP/"):
+        raise ConnectionError(f"Geçersiz HTTP yanıtı: {lines[0]!r}")
+
+    headers: Dict[str, str] = {}
+    for line in lines[1:]:
+        key, sep, value = line.partition(":")
+        if sep:
+            headers[key.strip().lower()] = value.strip()
+
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        raise ConnectionError("Chunked transfer encoding desteklenmiyor (requests taşımasını kullanın)")
+
+    return int(status[1]), headers
+
+
+class RawSocketStreamConnection:
+    """
+    Tek bir MJPEG HTTP bağlantısı
+    requests.Response ile aynı temel alanları sunar: status_code, headers, close()
+    """
+
+    def __init__(self, host: str, port: int, path: str = "/",
+                 timeout: Union[float, Tuple[float, float]] = (5, 10),
+                 recv_size: int = 64 * 1024):
+        self.host = host
+        self.port = port
+        self.path = path
+        self.timeout = timeout
+        self.recv_size = recv_size
+
+        self.sock: Optional[socket.socket] = None
+        self.status_code: Optional[int] = None
+        self.headers: Dict[str, str] = {}
+
+        # Yanıt başlığı ile aynı recv'de gelen gövde baytları
+        self._leftover = b""
+
+    def open(self) -> "RawSocketStreamConnection":
+        """Bağlan, GET isteğini gönder ve yanıt başlığını oku"""
+        if isinstance(self.timeout, tuple):
+            connect_timeout, read_timeout = self.timeout
+        else:
+            connect_timeout = read_timeout = self.timeout
+
+        self.sock = socket.create_connection((self.host, self.port), timeout=connect_timeout)
+        self.sock.settimeout(read_timeout)
+        try:
+            # Yüksek çözünürlükte kernel buffer'ı taşmasın
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1024 * 1024)
+        except OSError:
+            pass
+
+        try:
+            self.sock.sendall(build_get_request(self.host, self.port, self.path))
+            self._read_response_head()
+        except Exception:
+            self.close()
+            raise
+
+        return self
+
+    def _read_response_head(self):
+        """Durum satırını ve HTTP başlıklarını oku"""
+        head = bytearray()
+        while True:
+            idx = head.find(b"\r\n\r\n")
+            if idx != -1:
+                break
+            if len(head) > _MAX_HEAD_SIZE:
+                raise ConnectionError("HTTP yanıt başlığı çok büyük")
+            chunk = self.sock.recv(4096)
+            if not chunk:
+                raise ConnectionError("Sunucu yanıt vermeden bağlantıyı kapattı")
+            head += chunk
+
+        self.status_code, self.headers = parse_response_head(bytes(head[:idx]))
+        self._leftover = bytes(head[idx + 4:])
+
+    def read_parts(self, parser: MJPEGStreamParser) -> Optional[List[MJPEGPart]]:
+        """
+        Socket'ten bir kez oku ve tamamlanan parçaları döndür
+        Bağlantı kapandıysa None döner
+        """
+        if self._leftover:
+            data, self._leftover = self._leftover, b""
+            return parser.feed(data)
+
+        with parser.get_buffer(self.recv_size) as view:
+            nbytes = self.sock.recv_into(view)
+
+        if nbytes == 0:
+            return None
+        return parser.buffer_updated(nbytes)
+
+    def close(self):
+        """Socket'i kapat"""
+        if self.sock is not None:
+            try:
+                self.sock.close()
+            except OSError:
+                pass
+            self.sock = None
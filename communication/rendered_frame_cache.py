@@ -0,0 +1,92 @@
+# gui/communication/rendered_frame_cache.py
+"""
+Render edilmiş frame önbelleği
+Aynı frame'i aynı boyut ve formatta isteyen widget'lar (ör. periyodik
+get_current_frame_for_gui çağrıları) her seferinde fromarray + resize +
+PhotoImage yapmasın diye sonuç (seq, genişlik, yükseklik, format) anahtarıyla saklanır.
+Yeni frame gelince eski seq'e ait girdiler geçersiz olur
+"""
+
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+_Key = Tuple[Optional[int], Optional[int], str]
+
+
+class RenderedFrameCache:
+    """
+    Tek frame'lik render önbelleği
+    on_new_frame() decode thread'inden çağrılır ve sadece en yeni seq'i işaretler;
+    eski girdiler bir sonraki get/put'ta (Tk thread'inde) bırakılır. Böylece
+    PhotoImage'lar Tk thread'i dışında silinmez
+    """
+
+    def __init__(self, max_entries: int = 8):
+        self.max_entries = max_entries
+        self.latest_seq: Optional[int] = None
+        self._seq: Optional[int] = None
+        self._entries: Dict[_Key, Any] = {}
+        self._lock = threading.Lock()
+
+        # İstatistikler
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def on_new_frame(self, seq: int):
+        """Yeni frame geldi - önceki frame'in girdileri artık eski"""
+        self.latest_seq = seq
+
+    def _evict_stale(self, seq: int):
+        """Önbellek başka bir frame'e aitse boşalt (lock altında çağrılır)"""
+        if self._seq != seq:
+            if self._entries:
+                self.evictions += len(self._entries)
+                self._entries = {}
+            self._seq = seq
+
+    def get(self, seq: int, width: Optional[int], height: Optional[int],
+            pixel_format: str) -> Optional[Any]:
+        """Bu frame için aynı boyut/formatta render edilmiş görüntü varsa döndür"""
+        with self._lock:
+            self._evict_stale(seq)
+            image = self._entries.get((width, height, pixel_format))
+            if image is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return image
+
+    def put(self, seq: int, width: Optional[int], height: Optional[int],
+            pixel_format: str, image: Any):
+        """Render edilen görüntüyü sakla (bu arada yeni frame geldiyse saklanmaz)"""
+        with self._lock:
+            if self.latest_seq is not None and seq != self.latest_seq:
+                return
+            self._evict_stale(seq)
+            if len(self._entries) >= self.max_entries:
+                self._entries.pop(next(iter(self._entries)))
+                self.evictions += 1
+            self._entries[(width, height, pixel_format)] = image
+
+    def clear(self):
+        """Tüm girdileri bırak (Tk thread'inden çağrılmalı)"""
+        with self._lock:
+            self._entries = {}
+            self._seq = None
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get_stats(self) -> Dict[str, object]:
+        """Önbellek istatistikleri"""
+        return {
+            'seq': self._seq,
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hit_rate, 3),
+            'evictions': self.evictions
+        }
@@ -0,0 +1,244 @@
+# gui/communication/shared_frame_ring.py
+"""
+Paylaşımlı bellek (multiprocessing.shared_memory) frame halkası
+Kayıt, analiz, ikinci ekran gibi ağır tüketiciler ayrı süreçlerde çalışıp
+frame'leri kopyasız okuyabilsin diye decode edilmiş frame'ler sabit
+slotlu bir halkaya yazılır (Tk thread'i ile GIL için yarışmazlar)
+
+Bellek düzeni:
+    [global başlık][slot 0 başlığı][slot 0 pikselleri] ... [slot N-1 ...]
+    Global başlık: magic, versiyon, slot sayısı, slot kapasitesi, son seq
+    Slot başlığı : generation, seq, timestamp, yükseklik, genişlik, kanal,
+                   bayt sayısı, piksel formatı
+    Yazıcı slotu güncellerken generation tek sayıdır (seqlock): okuyucu
+    generation'ı okumadan önce ve sonra karşılaştırarak yırtık frame'i fark eder
+
+Okuyucu API'si (ayrı süreçte):
+    reader = SharedFrameRingReader('skyshield_camera')
+    frame = reader.wait_for_frame(after_seq=-1, timeout=1.0)
+    if frame is not None:
+        process(frame.pixels)          # shared memory'ye bakan view, kopya yok
+        if not reader.is_valid(frame): # işlem sırasında slot üzerine yazıldı mı
+            ...                        # sonucu at veya reader.copy_latest() kullan
+    reader.close()
+
+Halka yazıcının hızında döner: okuyucu yavaşsa frame atlar, yazıcıyı bekletmez
+"""
+
+import struct
+import time
+from multiprocessing import shared_memory
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+_MAGIC = b'SKYFRAME'
+_VERSION = 1
+
+# magic, versiyon, slot sayısı, slot kapasitesi, son seq
+_GLOBAL_HEADER = struct.Struct('<8sIIIq')
+# generation, seq, timestamp, yükseklik, genişlik, kanal, bayt, format
+_SLOT_HEADER = struct.Struct('<qqdIIIII')
+_LATEST_SEQ_OFFSET = 8 + 4 + 4 + 4
+
+_FORMAT_CODES = {'RGB': 0, 'BGR': 1, 'GRAY': 2}
+_FORMAT_NAMES = {code: name for name, code in _FORMAT_CODES.items()}
+
+DEFAULT_RING_NAME = 'skyshield_camera'
+
+
+class SharedFrame(NamedTuple):
+    """Halkadan okunan frame - pixels shared memory'ye bakan bir view"""
+    seq: int
+    timestamp: float
+    pixel_format: str
+    pixels: np.ndarray
+    slot: int
+    generation: int
+
+
+def _slot_stride(slot_capacity: int) -> int:
+    return _SLOT_HEADER.size + slot_capacity
+
+
+class SharedFrameRingWriter:
+    """
+    Halkayı oluşturan ve frame yazan taraf (kamera client'ı)
+    Tek yazıcı varsayılır; okuyucular kilit kullanmaz
+    """
+
+    def __init__(self, name: str = DEFAULT_RING_NAME, slots: int = 4,
+                 slot_capacity: int = 1920 * 1080 * 3):
+        self.name = name
+        self.slots = slots
+        self.slot_capacity = slot_capacity
+
+        size = _GLOBAL_HEADER.size + slots * _slot_stride(slot_capacity)
+        try:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            # Önceki çalıştırmadan kalmış halka - kaldırıp yeniden oluştur
+            stale = shared_memory.SharedMemory(name=name)
+            stale.close()
+            stale.unlink()
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+
+        self._buf = self._shm.buf
+        _GLOBAL_HEADER.pack_into(self._buf, 0, _MAGIC, _VERSION, slots, slot_capacity, -1)
+        for slot in range(slots):
+            _SLOT_HEADER.pack_into(self._buf, self._slot_offset(slot), 0, -1, 0.0, 0, 0, 0, 0, 0)
+        self._generations = [0] * slots
+
+        # İstatistikler
+        self.frames_written = 0
+        self.frames_too_large = 0
+
+        print(f"[FRAME RING] Oluşturuldu: {name} ({slots} slot x {slot_capacity / 1024 / 1024:.1f} MB)")
+
+    def _slot_offset(self, slot: int) -> int:
+        return _GLOBAL_HEADER.size + slot * _slot_stride(self.slot_capacity)
+
+    def write(self, seq: int, pixels: np.ndarray, pixel_format: str = 'BGR',
+              timestamp: Optional[float] = None) -> bool:
+        """Frame'i seq % slots slotuna yaz - slot kapasitesini aşarsa False"""
+        if self._buf is None:
+            return False
+        nbytes = pixels.nbytes
+        if nbytes > self.slot_capacity or pixels.dtype != np.uint8:
+            self.frames_too_large += 1
+            return False
+
+        height, width = pixels.shape[:2]
+        channels = pixels.shape[2] if pixels.ndim == 3 else 1
+        slot = seq % self.slots
+        offset = self._slot_offset(slot)
+        generation = self._generations[slot] + 1  # tek: yazılıyor
+
+        struct.pack_into('<q', self._buf, offset, generation)
+        data_offset = offset + _SLOT_HEADER.size
+        target = np.ndarray(pixels.shape, dtype=np.uint8, buffer=self._buf, offset=data_offset)
+        target[...] = pixels
+        _SLOT_HEADER.pack_into(
+            self._buf, offset, generation + 1, seq,
+            timestamp if timestamp is not None else time.time(),
+            height, width, channels, nbytes, _FORMAT_CODES.get(pixel_format, 0)
+        )
+        self._generations[slot] = generation + 1
+        struct.pack_into('<q', self._buf, _LATEST_SEQ_OFFSET, seq)
+        self.frames_written += 1
+        return True
+
+    def close(self, unlink: bool = True):
+        """Halkayı kapat - unlink=True ise shared memory silinir"""
+        if self._buf is None:
+            return
+        self._buf = None
+        self._shm.close()
+        if unlink:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+        print(f"[FRAME RING] Kapatıldı: {self.name}")
+
+    def get_stats(self) -> dict:
+        """Yazıcı istatistikleri"""
+        return {
+            'name': self.name,
+            'slots': self.slots,
+            'slot_capacity': self.slot_capacity,
+            'frames_written': self.frames_written,
+            'frames_too_large': self.frames_too_large
+        }
+
+
+class SharedFrameRingReader:
+    """Başka bir süreçten halkaya bağlanan okuyucu - kopyasız view'lar döndürür"""
+
+    def __init__(self, name: str = DEFAULT_RING_NAME):
+        self.name = name
+        try:
+            # Python 3.13+: okuyucu resource tracker'a kaydolmasın (halkayı silmesin)
+            self._shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # Eski sürümler: bağlanırken kaydı atla (unregister, fork edilmiş
+            # süreçlerde yazıcının kaydını da silip uyarıya yol açıyor)
+            from multiprocessing import resource_tracker
+            register = resource_tracker.register
+            resource_tracker.register = lambda *args, **kwargs: None
+            try:
+                self._shm = shared_memory.SharedMemory(name=name)
+            finally:
+                resource_tracker.register = register
+
+        self._buf = self._shm.buf
+        magic, version, self.slots, self.slot_capacity, _ = _GLOBAL_HEADER.unpack_from(self._buf, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise ValueError(f"Geçersiz frame halkası: {name}")
+
+    def _slot_offset(self, slot: int) -> int:
+        return _GLOBAL_HEADER.size + slot * _slot_stride(self.slot_capacity)
+
+    @property
+    def latest_seq(self) -> int:
+        """Son yazılan frame'in sıra numarası (-1: henüz yok)"""
+        return struct.unpack_from('<q', self._buf, _LATEST_SEQ_OFFSET)[0]
+
+    def read(self, seq: int) -> Optional[SharedFrame]:
+        """Verilen seq halkada duruyorsa kopyasız view döndür"""
+        slot = seq % self.slots
+        offset = self._slot_offset(slot)
+        generation, slot_seq, timestamp, height, width, channels, nbytes, fmt = \
+            _SLOT_HEADER.unpack_from(self._buf, offset)
+        if generation % 2 or slot_seq != seq:
+            return None
+
+        shape = (height, width, channels) if channels > 1 else (height, width)
+        pixels = np.ndarray(shape, dtype=np.uint8, buffer=self._buf, offset=offset + _SLOT_HEADER.size)
+        frame = SharedFrame(seq, timestamp, _FORMAT_NAMES.get(fmt, 'RGB'), pixels, slot, generation)
+        return frame if self.is_valid(frame) else None
+
+    def latest(self) -> Optional[SharedFrame]:
+        """En son frame (kopyasız)"""
+        seq = self.latest_seq
+        return self.read(seq) if seq >= 0 else None
+
+    def is_valid(self, frame: SharedFrame) -> bool:
+        """View alındığından beri slot üzerine yazılmadıysa True"""
+        return struct.unpack_from('<q', self._buf, self._slot_offset(frame.slot))[0] == frame.generation
+
+    def copy_latest(self, retries: int = 3) -> Optional[SharedFrame]:
+        """En son frame'in tutarlı bir kopyası (yırtılmışsa tekrar dener)"""
+        for _ in range(retries):
+            frame = self.latest()
+            if frame is None:
+                return None
+            pixels = frame.pixels.copy()
+            if self.is_valid(frame):
+                return frame._replace(pixels=pixels)
+        return None
+
+    def wait_for_frame(self, after_seq: int = -1, timeout: float = 1.0,
+                       poll_interval: float = 0.002) -> Optional[SharedFrame]:
+        """after_seq'ten yeni bir frame gelene kadar bekle (timeout'ta None)"""
+        deadline = time.monotonic() + timeout
+        while True:
+            if self.latest_seq > after_seq:
+                frame = self.latest()
+                if frame is not None:
+                    return frame
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(poll_interval)
+
+    def close(self):
+        """Bağlantıyı kapat (halka yazıcıya aittir, silinmez)"""
+        if self._buf is None:
+            return
+        self._buf = None
+        try:
+            self._shm.close()
+        except BufferError:
+            # Dışarıda hâlâ SharedFrame.pixels view'ı tutuluyor
+            print(f"[FRAME RING] ⚠️ {self.name}: açık view'lar var, bellek süreç bitince bırakılacak")
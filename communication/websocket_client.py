@@ -110,10 +110,20 @@ class WebSocketCommunicationClient:
         finally:
             try:
                 if self.loop and not self.loop.is_closed():
+                    self._cancel_pending_tasks()
                     self.loop.close()
             except:
                 pass
     
+    def _cancel_pending_tasks(self):
+        """Loop'u paylaşan task'ları (ör. kamera stream'i) iptal et ve finally bloklarını çalıştır"""
+        pending = [task for task in asyncio.all_tasks(self.loop) if not task.done()]
+        if not pending:
+            return
+        for task in pending:
+            task.cancel()
+        self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+    
     async def _websocket_handler(self):
         """Ana WebSocket işleyicisi - FIXED"""
         reconnect_delay = 1
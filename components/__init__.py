@@ -7,10 +7,21 @@ Sky Shield Hava Savunma Sistemi GUI bileşenleri
 from .base_component import BaseGUIComponent, ComponentManager
 from .control_panel import ControlPanel
 from .status_display import StatusDisplay
+from .frame_renderer import FrameRenderWorker, RenderedFrame
+from .photo_surface import TkPhotoSurface
+from .display_scheduler import DisplayScheduler
+from .camera_canvas import CameraCanvasView
+from .hud_compositor import HUDCompositor
 
 __all__ = [
     'BaseGUIComponent',
     'ComponentManager',
     'ControlPanel',
-    'StatusDisplay'
+    'StatusDisplay',
+    'FrameRenderWorker',
+    'RenderedFrame',
+    'TkPhotoSurface',
+    'DisplayScheduler',
+    'CameraCanvasView',
+    'HUDCompositor'
 ]
\ No newline at end of file
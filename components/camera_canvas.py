@@ -0,0 +1,201 @@
+# gui/components/camera_canvas.py
+"""
+Canvas tabanlı kamera görünümü
+Frame tek bir image item'ında gösterilir; nişangah, hedef işareti, kilit
+çerçevesi, LOCKED yazısı ve pan/tilt göstergesi kalıcı vektör item'larıdır.
+Telemetri güncellemelerinde item'lar silinip yeniden oluşturulmaz, sadece
+coords() ile taşınır ve itemconfigure() ile değiştirilir
+(Tk thread'inden kullanılmalıdır)
+"""
+
+import tkinter as tk
+from typing import Dict, Optional, Tuple
+
+CROSSHAIR_COLOR = "#00ff88"
+TARGET_COLOR = "#ff0000"
+READOUT_COLOR = "#ffff00"
+MESSAGE_COLOR = "#ff0000"
+
+_CROSSHAIR_GAP = 6
+_CROSSHAIR_ARM = 18
+_TARGET_RADIUS = 10
+_LOCK_HALF = 30
+
+
+class CameraCanvasView:
+    """
+    Kamera görüntüsü + kalıcı overlay item'ları
+    Hedef koordinatları kaynak (tespit) çözünürlüğünde verilir ve
+    canvas boyutuna ölçeklenir
+    """
+
+    def __init__(self, parent, width: int, height: int,
+                 source_size: Tuple[int, int] = (640, 480), bg: str = "#000000"):
+        self.width = width
+        self.height = height
+        self.source_size = source_size
+
+        self.canvas = tk.Canvas(parent, width=width, height=height, bg=bg,
+                                highlightthickness=0, borderwidth=0)
+
+        # Frame - en altta
+        self._image = self.canvas.create_image(0, 0, anchor="nw", tags=("frame",))
+        self._photo = None
+
+        # Merkez nişangahı (4 kol + merkez halkası)
+        self._crosshair = [
+            self.canvas.create_line(0, 0, 0, 0, fill=CROSSHAIR_COLOR, width=1, tags=("overlay", "crosshair"))
+            for _ in range(4)
+        ]
+        self._crosshair_ring = self.canvas.create_oval(0, 0, 0, 0, outline=CROSSHAIR_COLOR, width=1,
+                                                       tags=("overlay", "crosshair"))
+
+        # Hedef işareti, kilit çerçevesi ve LOCKED yazısı
+        self._target = self.canvas.create_oval(0, 0, 0, 0, outline=TARGET_COLOR, width=2,
+                                               state="hidden", tags=("overlay", "target"))
+        self._lock_rect = self.canvas.create_rectangle(0, 0, 0, 0, outline=TARGET_COLOR, width=2,
+                                                       state="hidden", tags=("overlay", "target"))
+        self._lock_text = self.canvas.create_text(0, 0, text="LOCKED", fill=TARGET_COLOR,
+                                                  font=("Arial", 10, "bold"), state="hidden",
+                                                  tags=("overlay", "target"))
+
+        # Pan/tilt göstergesi (sol üst)
+        self._readout = self.canvas.create_text(8, 8, anchor="nw", text="PAN --  TILT --",
+                                                fill=READOUT_COLOR, font=("Consolas", 11, "bold"),
+                                                tags=("overlay", "readout"))
+
+        # Ortadaki durum mesajı (ör. KAMERA DURDURULDU)
+        self._message = self.canvas.create_text(0, 0, text="", fill=MESSAGE_COLOR,
+                                                font=("Arial", 20, "bold"), state="hidden",
+                                                tags=("overlay", "message"))
+
+        # Son uygulanan değerler - değişmeyen item'a dokunulmaz
+        self._target_state: Optional[Tuple[int, int, bool]] = None
+        self._target_source: Optional[Tuple[float, float, bool]] = None
+        self._readout_text = None
+        self._message_text = None
+
+        # İstatistikler
+        self.image_swaps = 0
+        self.overlay_updates = 0
+        self.item_changes = 0
+
+        self._layout()
+
+    def pack(self, **kwargs):
+        self.canvas.pack(**kwargs)
+
+    def winfo_exists(self) -> bool:
+        return bool(self.canvas.winfo_exists())
+
+    def winfo_viewable(self) -> bool:
+        return bool(self.canvas.winfo_viewable())
+
+    def resize(self, width: int, height: int):
+        """Canvas ve sabit item'ları yeni boyuta göre yerleştir"""
+        self.width = width
+        self.height = height
+        self.canvas.configure(width=width, height=height)
+        self._layout()
+        # Hedef işareti yeni ölçekle yeniden konumlanmalı
+        if self._target_state is not None and self._target_source is not None:
+            self._target_state = None
+            self._place_target(*self._scale_target(*self._target_source))
+
+    def _layout(self):
+        """Nişangah ve mesaj konumları (sadece boyut değişince)"""
+        cx, cy = self.width // 2, self.height // 2
+        gap, arm = _CROSSHAIR_GAP, _CROSSHAIR_ARM
+        left, right, up, down = self._crosshair
+        self.canvas.coords(left, cx - gap - arm, cy, cx - gap, cy)
+        self.canvas.coords(right, cx + gap, cy, cx + gap + arm, cy)
+        self.canvas.coords(up, cx, cy - gap - arm, cx, cy - gap)
+        self.canvas.coords(down, cx, cy + gap, cx, cy + gap + arm)
+        self.canvas.coords(self._crosshair_ring, cx - gap, cy - gap, cx + gap, cy + gap)
+        self.canvas.coords(self._message, cx, cy)
+
+    def set_image(self, photo) -> bool:
+        """Image item'ını verilen PhotoImage'a bağla (aynıysa dokunulmaz)"""
+        if photo is self._photo:
+            return False
+        self.canvas.itemconfigure(self._image, image=photo)
+        self._photo = photo
+        self.image_swaps += 1
+        return True
+
+    @property
+    def photo(self):
+        return self._photo
+
+    def update_target(self, x: Optional[float], y: Optional[float], locked: bool):
+        """Hedef işaretini taşı - x/y kaynak çözünürlüğünde, None ise gizle"""
+        self.overlay_updates += 1
+        if x is None or y is None:
+            if self._target_state is not None:
+                for item in (self._target, self._lock_rect, self._lock_text):
+                    self.canvas.itemconfigure(item, state="hidden")
+                self._target_state = None
+                self.item_changes += 1
+            return
+
+        self._target_source = (x, y, bool(locked))
+        self._place_target(*self._scale_target(*self._target_source))
+
+    def _scale_target(self, x: float, y: float, locked: bool) -> Tuple[int, int, bool]:
+        """Kaynak çözünürlüğündeki koordinatı canvas koordinatına çevir"""
+        src_w, src_h = self.source_size
+        return int(round(x * self.width / src_w)), int(round(y * self.height / src_h)), locked
+
+    def _place_target(self, px: int, py: int, locked: bool):
+        """Canvas koordinatlarında hedef item'larını güncelle"""
+        previous = self._target_state
+        if previous == (px, py, locked):
+            return
+
+        if previous is None or previous[:2] != (px, py):
+            r, h = _TARGET_RADIUS, _LOCK_HALF
+            self.canvas.coords(self._target, px - r, py - r, px + r, py + r)
+            self.canvas.coords(self._lock_rect, px - h, py - h, px + h, py + h)
+            self.canvas.coords(self._lock_text, px, py - h - 10)
+            self.item_changes += 1
+
+        if previous is None:
+            self.canvas.itemconfigure(self._target, state="normal")
+        if previous is None or previous[2] != locked:
+            lock_state = "normal" if locked else "hidden"
+            self.canvas.itemconfigure(self._lock_rect, state=lock_state)
+            self.canvas.itemconfigure(self._lock_text, state=lock_state)
+            self.item_changes += 1
+
+        self._target_state = (px, py, locked)
+
+    def update_readout(self, pan: Optional[float], tilt: Optional[float]):
+        """Pan/tilt göstergesini güncelle (metin değişmediyse dokunulmaz)"""
+        pan_text = f"{pan:+7.1f}°" if pan is not None else "--"
+        tilt_text = f"{tilt:+6.1f}°" if tilt is not None else "--"
+        text = f"PAN {pan_text}  TILT {tilt_text}"
+        if text != self._readout_text:
+            self.canvas.itemconfigure(self._readout, text=text)
+            self._readout_text = text
+            self.item_changes += 1
+
+    def show_message(self, text: Optional[str]):
+        """Ortada durum mesajı göster (None: gizle)"""
+        if text == self._message_text:
+            return
+        if text:
+            self.canvas.itemconfigure(self._message, text=text, state="normal")
+        else:
+            self.canvas.itemconfigure(self._message, state="hidden")
+        self._message_text = text
+
+    def get_stats(self) -> Dict[str, object]:
+        """Görünüm istatistikleri"""
+        return {
+            'size': (self.width, self.height),
+            'source_size': self.source_size,
+            'image_swaps': self.image_swaps,
+            'overlay_updates': self.overlay_updates,
+            'item_changes': self.item_changes,
+            'items': len(self.canvas.find_all())
+        }
@@ -0,0 +1,143 @@
+# gui/components/display_scheduler.py
+"""
+Birleştirilmiş (coalesced) ekran güncelleme zamanlayıcısı
+Frame başına after(0, ...) kuyruğa eklemek yerine en fazla bir bekleyen
+redraw tutulur: Tk yetişemezse aradaki frame'ler atlanır, her zaman en yeni
+frame çizilir ve çizim hızı max_hz ile sınırlanır. Böylece Tk olay kuyruğu
+eski redraw closure'larıyla dolmaz ve kullanıcı girdisi gecikmez
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+class DisplayScheduler:
+    """
+    submit() herhangi bir thread'den çağrılabilir; draw(item) Tk thread'inde çalışır
+    - Bekleyen redraw varken gelen öğe öncekinin yerini alır (atlanan öğe on_drop'a verilir)
+    - Olay döngüsü gecikmesi: redraw'ın planlanan zamanı ile gerçekten çalıştığı an arasındaki fark
+    """
+
+    def __init__(self, widget, draw: Callable[[Any], None], max_hz: float = 30.0,
+                 on_drop: Optional[Callable[[Any], None]] = None):
+        self.widget = widget
+        self.draw = draw
+        self.on_drop = on_drop
+        self.max_hz = max_hz
+        self._min_interval = 1.0 / max_hz if max_hz and max_hz > 0 else 0.0
+
+        self._lock = threading.Lock()
+        self._pending: Any = None
+        self._has_pending = False
+        self._scheduled = False
+        self._due = 0.0
+        self._last_draw = 0.0
+        self._closed = False
+
+        # İstatistikler
+        self.submitted = 0
+        self.drawn = 0
+        self.skipped = 0          # Çizilmeden yerine yenisi gelen
+        self.draw_errors = 0
+        self.last_lag_ms = 0.0
+        self.max_lag_ms = 0.0
+        self._total_lag_ms = 0.0
+        self.last_draw_ms = 0.0
+        self._total_draw_ms = 0.0
+
+    def set_max_hz(self, max_hz: float):
+        """Çizim hızı sınırını değiştir (0 veya None: sınırsız)"""
+        self.max_hz = max_hz
+        self._min_interval = 1.0 / max_hz if max_hz and max_hz > 0 else 0.0
+
+    def submit(self, item: Any):
+        """Yeni öğeyi çizim için bırak - gerekirse tek bir redraw planlanır"""
+        schedule = False
+        with self._lock:
+            if self._closed:
+                dropped, item = item, None
+            else:
+                dropped = self._pending if self._has_pending else None
+                if self._has_pending:
+                    self.skipped += 1
+                self._pending = item
+                self._has_pending = True
+                self.submitted += 1
+
+                schedule = not self._scheduled
+                if schedule:
+                    now = time.perf_counter()
+                    self._due = max(now, self._last_draw + self._min_interval)
+                    delay_ms = int((self._due - now) * 1000)
+                    self._scheduled = True
+
+        if dropped is not None and self.on_drop is not None:
+            self.on_drop(dropped)
+        if not schedule:
+            return
+
+        try:
+            self.widget.after(delay_ms, self._run)
+        except Exception:
+            # Widget yok edilmiş
+            with self._lock:
+                self._scheduled = False
+                item, self._pending, self._has_pending = self._pending, None, False
+            if item is not None and self.on_drop is not None:
+                self.on_drop(item)
+
+    def _run(self):
+        """Tk thread'i: bekleyen en yeni öğeyi çiz"""
+        start = time.perf_counter()
+        with self._lock:
+            lag_ms = max(0.0, (start - self._due) * 1000)
+            has_item = self._has_pending
+            item, self._pending, self._has_pending = self._pending, None, False
+            self._scheduled = False
+            self._last_draw = start
+        if not has_item:
+            return
+
+        self.last_lag_ms = lag_ms
+        self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+        self._total_lag_ms += lag_ms
+
+        try:
+            self.draw(item)
+            self.drawn += 1
+        except Exception as e:
+            self.draw_errors += 1
+            print(f"[DISPLAY SCHEDULER] Çizim hatası: {e}")
+
+        draw_ms = (time.perf_counter() - start) * 1000
+        self.last_draw_ms = draw_ms
+        self._total_draw_ms += draw_ms
+
+    def close(self):
+        """Yeni öğe kabul etme, bekleyeni bırak"""
+        with self._lock:
+            self._closed = True
+            item = self._pending if self._has_pending else None
+            self._pending, self._has_pending = None, False
+        if item is not None and self.on_drop is not None:
+            self.on_drop(item)
+
+    def get_stats(self) -> Dict[str, object]:
+        """Zamanlayıcı istatistikleri (süreler ms)"""
+        runs = self.drawn + self.draw_errors
+        return {
+            'max_hz': self.max_hz,
+            'submitted': self.submitted,
+            'drawn': self.drawn,
+            'skipped': self.skipped,
+            'errors': self.draw_errors,
+            'pending': self._has_pending,
+            'tk_lag_ms': {
+                'last': round(self.last_lag_ms, 2),
+                'avg': round(self._total_lag_ms / runs, 2) if runs else 0.0,
+                'max': round(self.max_lag_ms, 2)
+            },
+            'last_draw_ms': round(self.last_draw_ms, 2),
+            'avg_draw_ms': round(self._total_draw_ms / runs, 2) if runs else 0.0
+        }
@@ -0,0 +1,227 @@
+# gui/components/frame_renderer.py
+"""
+Kamera görüntüsü render worker'ı
+Frame'in decode'u, ekran boyutuna ölçeklenmesi ve RGB'ye çevrilmesi stream
+ve Tk thread'lerinden alınıp ayrı bir thread'de yapılır. Sonuç doğrudan
+PhotoImage'a basılabilecek (H, W, 3) uint8 RGB buffer'dır
+
+Kalite seviyeleri:
+    'nearest'  - en hızlı, pikselli
+    'bilinear' - hızlı, canlı görüntü için yeterli
+    'area'     - küçültmede en temiz hızlı seçenek (varsayılan)
+    'lanczos'  - en yavaş, en keskin
+Snapshot'lar tam çözünürlükte kaydedildiği için ölçeklenmez (bkz. save_current_frame)
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from communication.buffer_pool import FrameBufferPool, PooledBuffer
+from communication.frame import Frame
+
+RENDER_QUALITIES: Dict[str, int] = {
+    'nearest': cv2.INTER_NEAREST,
+    'bilinear': cv2.INTER_LINEAR,
+    'area': cv2.INTER_AREA,
+    'lanczos': cv2.INTER_LANCZOS4,
+}
+LIVE_QUALITY = 'area'
+
+_TO_RGB = {
+    'BGR': cv2.COLOR_BGR2RGB,
+    'GRAY': cv2.COLOR_GRAY2RGB,
+}
+
+
+def validate_render_quality(quality: str) -> str:
+    """Kalite adını normalize et (bilinmiyorsa ValueError)"""
+    name = quality.lower()
+    if name not in RENDER_QUALITIES:
+        raise ValueError(f"Desteklenmeyen render kalitesi: {quality} (desteklenen: {', '.join(RENDER_QUALITIES)})")
+    return name
+
+
+def render_rgb(pixels: np.ndarray, pixel_format: str, size: Tuple[int, int],
+               quality: str = LIVE_QUALITY, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    pixels'i size (genişlik, yükseklik) boyutunda RGB'ye çevir
+    out verilirse sonuç (H, W, 3) uint8 buffer'a yazılır
+    Önce ölçeklenir, sonra renk çevrilir: dönüşüm ekran boyutundaki piksellerde yapılır
+    """
+    width, height = size
+    if out is None:
+        out = np.empty((height, width, 3), dtype=np.uint8)
+
+    same_size = pixels.shape[1] == width and pixels.shape[0] == height
+    if pixel_format == 'GRAY':
+        small = pixels if same_size else cv2.resize(pixels, (width, height),
+                                                    interpolation=RENDER_QUALITIES[quality])
+        cv2.cvtColor(small, _TO_RGB['GRAY'], dst=out)
+        return out
+
+    if same_size:
+        out[...] = pixels
+    else:
+        cv2.resize(pixels, (width, height), dst=out, interpolation=RENDER_QUALITIES[quality])
+    if pixel_format == 'BGR':
+        cv2.cvtColor(out, _TO_RGB['BGR'], dst=out)
+    return out
+
+
+class RenderedFrame:
+    """
+    Render edilmiş frame - pixels ekrana basılmaya hazır RGB buffer
+    Buffer havuzdan gelir: tüketici işi bitince release() çağırmalıdır
+    """
+
+    __slots__ = ('seq', 'pixels', 'quality', 'render_ms', 'receive_ts', '_buffer')
+
+    def __init__(self, seq: int, buffer: PooledBuffer, quality: str, render_ms: float,
+                 receive_ts: Optional[float] = None):
+        self.seq = seq
+        self.pixels = buffer.array
+        self.quality = quality
+        self.render_ms = render_ms
+        self.receive_ts = receive_ts
+        self._buffer = buffer
+
+    def release(self):
+        """Buffer'ı havuza geri ver"""
+        buffer, self._buffer = self._buffer, None
+        if buffer is not None:
+            buffer.release()
+            self.pixels = None
+
+
+class FrameRenderWorker:
+    """
+    Tek slotlu (en yeni kazanır) render thread'i
+    - submit(): frame'i retain edip sıraya koyar; bekleyen eski frame atlanır
+    - on_rendered(RenderedFrame): worker thread'inden çağrılır, Tk'ye aktarmak
+      (after) ve release() etmek tüketiciye aittir
+    """
+
+    def __init__(self, on_rendered: Callable[[RenderedFrame], None], size: Tuple[int, int],
+                 quality: str = LIVE_QUALITY, buffer_pool: Optional[FrameBufferPool] = None):
+        self.on_rendered = on_rendered
+        self.size = (int(size[0]), int(size[1]))
+        self.quality = validate_render_quality(quality)
+        self.buffer_pool = buffer_pool or FrameBufferPool()
+
+        self._cond = threading.Condition()
+        self._pending: Optional[Frame] = None
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        # İstatistikler
+        self.frames_rendered = 0
+        self.frames_skipped = 0   # Render sırası gelmeden yenisi gelen
+        self.render_errors = 0
+        self.last_render_ms = 0.0
+        self.max_render_ms = 0.0
+        self._total_render_ms = 0.0
+
+    def start(self):
+        """Render thread'ini başlat"""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="FrameRenderWorker", daemon=True)
+        self._thread.start()
+        print(f"[FRAME RENDER] Başlatıldı: {self.size[0]}x{self.size[1]}, kalite: {self.quality}")
+
+    def stop(self, timeout: float = 1.0):
+        """Thread'i durdur ve bekleyen frame'i bırak"""
+        with self._cond:
+            self._running = False
+            pending, self._pending = self._pending, None
+            self._cond.notify_all()
+        if pending is not None:
+            pending.release()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def set_size(self, size: Tuple[int, int]):
+        """Hedef boyutu değiştir (sonraki frame'den itibaren)"""
+        self.size = (int(size[0]), int(size[1]))
+
+    def set_quality(self, quality: str):
+        """Canlı görüntü kalite seviyesini değiştir"""
+        self.quality = validate_render_quality(quality)
+
+    def submit(self, frame: Frame) -> bool:
+        """Frame'i render sırasına koy - bekleyen eski frame atlandıysa False"""
+        with self._cond:
+            if not self._running:
+                # Durdurulmuş worker frame'i tutmaz
+                return False
+            frame.retain()
+            replaced, self._pending = self._pending, frame
+            self._cond.notify()
+        if replaced is not None:
+            self.frames_skipped += 1
+            replaced.release()
+        return replaced is None
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._running and self._pending is None:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                frame, self._pending = self._pending, None
+
+            try:
+                rendered = self._render(frame)
+            except Exception as e:
+                rendered = None
+                self.render_errors += 1
+                print(f"[FRAME RENDER] Render hatası: {e}")
+            finally:
+                frame.release()
+
+            if rendered is not None:
+                try:
+                    self.on_rendered(rendered)
+                except Exception as e:
+                    rendered.release()
+                    print(f"[FRAME RENDER] Callback hatası: {e}")
+
+    def _render(self, frame: Frame) -> Optional[RenderedFrame]:
+        """Decode (gerekirse) + ölçekleme + RGB dönüşümü"""
+        start = time.perf_counter()
+        pixels = frame.pixels()
+        if pixels is None:
+            return None
+
+        width, height = size = self.size
+        quality = self.quality
+        buffer = self.buffer_pool.acquire((height, width, 3), np.uint8)
+        render_rgb(pixels, frame.native_format, size, quality, out=buffer.array)
+
+        render_ms = (time.perf_counter() - start) * 1000
+        self.frames_rendered += 1
+        self.last_render_ms = render_ms
+        self.max_render_ms = max(self.max_render_ms, render_ms)
+        self._total_render_ms += render_ms
+        return RenderedFrame(frame.seq, buffer, quality, render_ms, frame.receive_ts)
+
+    def get_stats(self) -> Dict[str, object]:
+        """Render istatistikleri (süreler ms)"""
+        return {
+            'size': self.size,
+            'quality': self.quality,
+            'rendered': self.frames_rendered,
+            'skipped': self.frames_skipped,
+            'errors': self.render_errors,
+            'last_render_ms': round(self.last_render_ms, 2),
+            'avg_render_ms': round(self._total_render_ms / self.frames_rendered, 2) if self.frames_rendered else 0.0,
+            'max_render_ms': round(self.max_render_ms, 2),
+            'buffer_pool': self.buffer_pool.get_stats()
+        }
@@ -0,0 +1,193 @@
+# gui/components/hud_compositor.py
+"""
+Kayıt ve snapshot'lar için HUD birleştirici
+HUD'u her frame'de PIL ile çizmek yavaş olduğu için katmanlar bir kez
+premultiplied RGBA (renk * alfa) array'lerine render edilip saklanır:
+    - Statik katmanlar (nişangah, ızgara, aşama bandı) frame boyutu başına bir kez
+    - Dinamik metinler (pan/tilt, saat, ...) sadece değerleri değişince
+Birleştirme her katmanın sadece kendi bölgesi (ROI) üzerinde, numpy ile
+vektörize alfa karışımıdır: out = renk_premul + frame * (255 - alfa) / 255
+"""
+
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+RETICLE_COLOR = (0, 255, 136, 220)
+GRID_COLOR = (255, 255, 255, 60)
+BANNER_COLOR = (0, 0, 0, 150)
+BANNER_TEXT_COLOR = (255, 255, 0, 255)
+TEXT_COLOR = (255, 255, 0, 255)
+TEXT_SHADOW = (0, 0, 0, 180)
+
+
+def load_hud_font(size: int):
+    """HUD yazı tipi (arial yoksa PIL varsayılanı)"""
+    try:
+        return ImageFont.truetype("arial.ttf", size)
+    except Exception:
+        return ImageFont.load_default()
+
+
+class HUDLayer:
+    """
+    Bölgesine kırpılmış premultiplied katman
+    color: (h, w, 3) uint16 renk * alfa / 255, inv_alpha: (h, w, 1) uint16 255 - alfa
+    """
+
+    __slots__ = ('x', 'y', 'color', 'inv_alpha')
+
+    def __init__(self, x: int, y: int, color: np.ndarray, inv_alpha: np.ndarray):
+        self.x = x
+        self.y = y
+        self.color = color
+        self.inv_alpha = inv_alpha
+
+    @classmethod
+    def from_rgba(cls, rgba: Image.Image, x: int = 0, y: int = 0) -> Optional['HUDLayer']:
+        """PIL RGBA görüntüsünden katman oluştur - tamamen saydam kenarlar kırpılır"""
+        bbox = rgba.getchannel('A').getbbox()
+        if bbox is None:
+            return None
+        array = np.asarray(rgba.crop(bbox), dtype=np.uint16)
+        alpha = array[:, :, 3:4]
+        color = (array[:, :, :3] * alpha + 127) // 255
+        return cls(x + bbox[0], y + bbox[1], color, 255 - alpha)
+
+    def blend(self, frame: np.ndarray):
+        """Katmanı frame üzerine (yerinde) karıştır - sadece kendi bölgesinde"""
+        height, width = self.color.shape[:2]
+        x0, y0 = max(self.x, 0), max(self.y, 0)
+        x1 = min(self.x + width, frame.shape[1])
+        y1 = min(self.y + height, frame.shape[0])
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        roi = frame[y0:y1, x0:x1]
+        lx, ly = x0 - self.x, y0 - self.y
+        color = self.color[ly:ly + y1 - y0, lx:lx + x1 - x0]
+        inv_alpha = self.inv_alpha[ly:ly + y1 - y0, lx:lx + x1 - x0]
+        roi[...] = color + (roi * inv_alpha + 127) // 255
+
+
+class HUDCompositor:
+    """
+    HUD katmanlarını önbelleğe alıp RGB frame'lere basan birleştirici
+    set_text() ile verilen dinamik metinler değer değişmedikçe yeniden çizilmez
+    """
+
+    def __init__(self, phase_name: str = "", show_grid: bool = True, font_size: int = 16):
+        self.phase_name = phase_name
+        self.show_grid = show_grid
+        self.font_size = font_size
+        self._font = load_hud_font(font_size)
+
+        self._static_size: Optional[Tuple[int, int]] = None
+        self._static_layers: List[HUDLayer] = []
+        # ad -> (metin, konum, katman)
+        self._texts: Dict[str, Tuple[str, Tuple[int, int], Optional[HUDLayer]]] = {}
+
+        # İstatistikler
+        self.static_renders = 0
+        self.text_renders = 0
+        self.composites = 0
+        self.last_composite_ms = 0.0
+
+    def set_phase_name(self, phase_name: str):
+        """Aşama bandı metnini değiştir (statik katmanlar yeniden çizilir)"""
+        if phase_name != self.phase_name:
+            self.phase_name = phase_name
+            self._static_size = None
+
+    def set_text(self, name: str, text: str, position: Tuple[int, int]):
+        """Dinamik metin alanını güncelle - metin ve konum aynıysa render edilmez"""
+        current = self._texts.get(name)
+        if current is not None and current[0] == text and current[1] == position:
+            return
+        self._texts[name] = (text, position, self._render_text(text, position))
+        self.text_renders += 1
+
+    def remove_text(self, name: str):
+        self._texts.pop(name, None)
+
+    def _render_text(self, text: str, position: Tuple[int, int]) -> Optional[HUDLayer]:
+        """Gölgeli metni sadece kendi kutusu kadar RGBA'ya çiz"""
+        if not text:
+            return None
+        left, top, right, bottom = self._font.getbbox(text)
+        image = Image.new('RGBA', (right - left + 2, bottom - top + 2), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+        draw.text((1 - left, 1 - top), text, font=self._font, fill=TEXT_SHADOW)
+        draw.text((-left, -top), text, font=self._font, fill=TEXT_COLOR)
+        return HUDLayer.from_rgba(image, position[0], position[1])
+
+    def _build_static_layers(self, width: int, height: int):
+        """Nişangah, ızgara ve aşama bandı - frame boyutu başına bir kez"""
+        layers: List[Optional[HUDLayer]] = []
+        cx, cy = width // 2, height // 2
+
+        # Nişangah: sadece merkez çevresindeki kutu kadar
+        arm = max(12, min(width, height) // 20)
+        gap = max(4, arm // 3)
+        reticle = Image.new('RGBA', (2 * arm + 3, 2 * arm + 3), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(reticle)
+        c = arm + 1
+        draw.line((c - arm, c, c - gap, c), fill=RETICLE_COLOR, width=2)
+        draw.line((c + gap, c, c + arm, c), fill=RETICLE_COLOR, width=2)
+        draw.line((c, c - arm, c, c - gap), fill=RETICLE_COLOR, width=2)
+        draw.line((c, c + gap, c, c + arm), fill=RETICLE_COLOR, width=2)
+        draw.ellipse((c - gap, c - gap, c + gap, c + gap), outline=RETICLE_COLOR, width=1)
+        layers.append(HUDLayer.from_rgba(reticle, cx - c, cy - c))
+
+        # Üçte bir ızgarası: her çizgi ayrı ince katman (tam frame katmanı yerine)
+        if self.show_grid:
+            for i in (1, 2):
+                vertical = Image.new('RGBA', (1, height), GRID_COLOR)
+                layers.append(HUDLayer.from_rgba(vertical, width * i // 3, 0))
+                horizontal = Image.new('RGBA', (width, 1), GRID_COLOR)
+                layers.append(HUDLayer.from_rgba(horizontal, 0, height * i // 3))
+
+        # Aşama bandı (üst)
+        if self.phase_name:
+            left, top, right, bottom = self._font.getbbox(self.phase_name)
+            banner_height = bottom - top + 10
+            banner = Image.new('RGBA', (width, banner_height), BANNER_COLOR)
+            draw = ImageDraw.Draw(banner)
+            draw.text(((width - (right - left)) // 2 - left, 5 - top), self.phase_name,
+                      font=self._font, fill=BANNER_TEXT_COLOR)
+            layers.append(HUDLayer.from_rgba(banner, 0, 0))
+
+        self._static_layers = [layer for layer in layers if layer is not None]
+        self._static_size = (width, height)
+        self.static_renders += 1
+
+    def composite(self, frame: np.ndarray) -> np.ndarray:
+        """HUD'u (H, W, 3) uint8 RGB frame'e yerinde bas ve frame'i döndür"""
+        start = time.perf_counter()
+        height, width = frame.shape[:2]
+        if self._static_size != (width, height):
+            self._build_static_layers(width, height)
+
+        for layer in self._static_layers:
+            layer.blend(frame)
+        for _, _, layer in self._texts.values():
+            if layer is not None:
+                layer.blend(frame)
+
+        self.composites += 1
+        self.last_composite_ms = (time.perf_counter() - start) * 1000
+        return frame
+
+    def get_stats(self) -> Dict[str, object]:
+        """Birleştirici istatistikleri"""
+        return {
+            'static_size': self._static_size,
+            'static_layers': len(self._static_layers),
+            'text_fields': len(self._texts),
+            'static_renders': self.static_renders,
+            'text_renders': self.text_renders,
+            'composites': self.composites,
+            'last_composite_ms': round(self.last_composite_ms, 2)
+        }
@@ -0,0 +1,94 @@
+# gui/components/photo_surface.py
+"""
+Kalıcı Tk görüntü yüzeyi
+Her frame'de yeni ImageTk.PhotoImage oluşturmak yerine görüntü boyutu başına
+tek bir PhotoImage tutulur ve pikseller paste() ile yerinde güncellenir.
+Label'a sadece yeni PhotoImage oluştuğunda configure edilir; böylece Tk
+görüntüsü ayrılmaz, label yeniden yerleşim yapmaz ve çöp oluşmaz
+(Tk thread'inden kullanılmalıdır)
+"""
+
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from PIL import Image, ImageTk
+
+
+class TkPhotoSurface:
+    """
+    (genişlik, yükseklik) başına bir PIL Image + PhotoImage çifti
+    update(rgb) pikselleri önce kalıcı PIL Image'a (frombytes, ayırma yok),
+    sonra toplu olarak PhotoImage'a (paste) kopyalar
+    Yer açılırken en uzun süredir kullanılmayan boyut atılır; son döndürülen
+    (o an görüntüye bağlı) PhotoImage hiçbir zaman atılmaz
+    """
+
+    def __init__(self, max_sizes: int = 2):
+        # Bağlı yüzey + yeni boyut için en az iki yer
+        self.max_sizes = max(2, max_sizes)
+        self._surfaces: 'OrderedDict[Tuple[int, int], Tuple[Image.Image, ImageTk.PhotoImage]]' = OrderedDict()
+        self._bound_size: Optional[Tuple[int, int]] = None
+
+        # İstatistikler
+        self.pastes = 0
+        self.created = 0
+        self.evicted = 0
+        self.last_paste_ms = 0.0
+        self._total_paste_ms = 0.0
+
+    def update(self, pixels: np.ndarray) -> Tuple[ImageTk.PhotoImage, bool]:
+        """
+        (H, W, 3) uint8 RGB pikselleri ilgili boyuttaki PhotoImage'a bas
+        (PhotoImage, yeni_oluşturuldu_mu) döner - yeni ise label'a configure edilmeli
+        """
+        start = time.perf_counter()
+        height, width = pixels.shape[:2]
+        size = (width, height)
+        surface = self._surfaces.get(size)
+        created = surface is None
+
+        if created:
+            self._evict()
+            image = Image.new('RGB', size)
+            surface = (image, ImageTk.PhotoImage(image))
+            self._surfaces[size] = surface
+            self.created += 1
+        else:
+            self._surfaces.move_to_end(size)
+        self._bound_size = size
+
+        image, photo = surface
+        image.frombytes(np.ascontiguousarray(pixels))
+        photo.paste(image)
+
+        paste_ms = (time.perf_counter() - start) * 1000
+        self.pastes += 1
+        self.last_paste_ms = paste_ms
+        self._total_paste_ms += paste_ms
+        return photo, created
+
+    def _evict(self):
+        """Yeni boyuta yer aç - bağlı yüzeye dokunmadan en eskisini at"""
+        while len(self._surfaces) >= self.max_sizes:
+            oldest = next(size for size in self._surfaces if size != self._bound_size)
+            del self._surfaces[oldest]
+            self.evicted += 1
+
+    def clear(self):
+        """Tüm yüzeyleri bırak (ör. pencere kapanırken)"""
+        self._surfaces.clear()
+        self._bound_size = None
+
+    def get_stats(self) -> Dict[str, object]:
+        """Yüzey istatistikleri (süreler ms)"""
+        return {
+            'sizes': list(self._surfaces),
+            'bound_size': self._bound_size,
+            'created': self.created,
+            'evicted': self.evicted,
+            'pastes': self.pastes,
+            'last_paste_ms': round(self.last_paste_ms, 2),
+            'avg_paste_ms': round(self._total_paste_ms / self.pastes, 2) if self.pastes else 0.0
+        }
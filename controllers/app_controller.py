@@ -4,7 +4,7 @@ import threading
 import time
 from datetime import datetime, timedelta
 import traceback
-from typing import Dict, Any, Callable, Optional, List
+from typing import Dict, Any, Callable, Optional, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import sys
@@ -13,6 +13,7 @@ sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 # Communication Manager'ı import et
 from communication.communication_manager import CommunicationManager
+from communication.frame import FRAME_FORMAT, Frame
 
 class SystemMode(Enum):
     """Sistem modları"""
@@ -148,7 +149,10 @@ class AppController:
     def _setup_communication_callbacks(self):
         """Communication Manager callback'lerini kur"""
         self.comm_manager.register_data_callback(self._on_raspberry_data_received)
-        self.comm_manager.register_frame_callback(self._on_raspberry_frame_received)
+        # Frame'ler decode edilmeden gelir - GUI piksele eriştiğinde decode edilir
+        # GUI'ye aktarım: görüntü modülü kendi boyutunu set_camera_consumer_size ile bildirir
+        self.comm_manager.register_frame_callback(self._on_raspberry_frame_received, FRAME_FORMAT,
+                                                  name='app_controller', passive=True)
         self.comm_manager.register_connection_callback(self._on_raspberry_connection_changed)
         self.comm_manager.register_error_callback(self._on_raspberry_error)
     
@@ -440,11 +444,15 @@ class AppController:
         except Exception as e:
             self.add_log(f"Frame işleme hatası: {e}", "ERROR")
     
-    def _on_raspberry_frame_received(self, frame):
-        """Raspberry Pi'den frame alındığında"""
+    def _on_raspberry_frame_received(self, frame: Frame):
+        """Raspberry Pi'den frame alındığında (seq, JPEG, zaman damgaları ve tembel pikseller)"""
         try:
             self.stats['frames_received'] += 1
             
+            # Emergency modda görüntü işlenmez - frame decode da edilmez
+            if self.emergency_mode:
+                return
+            
             # Frame'i GUI'ye aktar
             self.trigger_event("frame_received", frame)
             
@@ -757,9 +765,52 @@ class AppController:
         """GUI için mevcut kamera frame'ini al"""
         return self.comm_manager.get_current_frame_for_gui(width, height)
     
-    def save_current_frame(self, filename: str) -> bool:
-        """Mevcut frame'i kaydet"""
-        return self.comm_manager.save_current_frame(filename)
+    def subscribe_frames(self, callback: Callable, pixel_format: str = 'RGB',
+                         size: Optional[Tuple[int, int]] = None,
+                         max_rate: Optional[float] = None,
+                         name: Optional[str] = None, passive: bool = False):
+        """
+        Kamera frame'lerine ayrı bir abone olarak bağlan (kayıt, analiz, ikinci ekran...)
+        Her abone kendi formatını, boyutunu ve hızını seçer; emergency modda frame iletilmez
+        size verilmezse abone tam çözünürlük ister; passive abone decode boyutunu etkilemez
+        Dönen abonelik unsubscribe_frames ile kaldırılır
+        """
+        def deliver(frame):
+            if not self.emergency_mode:
+                callback(frame)
+        
+        return self.comm_manager.register_frame_callback(
+            deliver, pixel_format, size, max_rate,
+            name or getattr(callback, '__name__', None), passive
+        )
+    
+    def unsubscribe_frames(self, subscription):
+        """subscribe_frames ile eklenen aboneliği kaldır"""
+        self.comm_manager.unregister_frame_callback(subscription)
+    
+    def get_frame_subscriber_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Abone başına teslim/kayıp sayaçları"""
+        return self.comm_manager.camera_client.frame_bus.get_stats()
+    
+    def set_camera_consumer_size(self, name: str, width: int, height: int):
+        """Kamera görüntüsünün gösterileceği boyutu bildir - decode buna göre küçültülür"""
+        self.comm_manager.set_camera_consumer_size(name, (width, height))
+    
+    def remove_camera_consumer_size(self, name: str):
+        """Görüntü tüketicisi kapandı - decode boyutu hesabından çıkar"""
+        self.comm_manager.remove_camera_consumer_size(name)
+    
+    def get_current_frame_seq(self) -> Optional[int]:
+        """Son kamera frame'inin sıra numarası"""
+        return self.comm_manager.get_current_frame_seq()
+    
+    def report_frame_displayed(self, seq: Optional[int] = None):
+        """Kamera frame'i ekrana basıldı (uçtan uca gecikme ölçümü için)"""
+        self.comm_manager.report_frame_displayed(seq)
+    
+    def save_current_frame(self, filename: str, overlay: Optional[Callable] = None) -> bool:
+        """Mevcut frame'i kaydet (overlay: kaydetmeden önce RGB array'e uygulanır, ör. HUD)"""
+        return self.comm_manager.save_current_frame(filename, overlay)
 
     def get_state_dict(self) -> Dict[str, Any]:
         """CONDITIONAL LOGGING: target_side kesinlikle dönecek"""
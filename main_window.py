@@ -3,8 +3,15 @@ import customtkinter as ctk
 import tkinter as tk
 import threading  # YENİ: Threading fix için
 import time
+from typing import Optional
 
 from controllers.app_controller import AppController 
+from communication.frame import Frame
+from components.frame_renderer import FrameRenderWorker, RenderedFrame, LIVE_QUALITY, validate_render_quality
+from components.photo_surface import TkPhotoSurface
+from components.display_scheduler import DisplayScheduler
+from components.camera_canvas import CameraCanvasView
+from components.hud_compositor import HUDCompositor
 import numpy as np  
 
 from PIL import Image, ImageTk
@@ -835,13 +842,16 @@ class UpdatedCameraModule:
         self.target_locked = False
         self.recording = False
         
-        # Hedef pozisyonu
+        # Hedef pozisyonu (Pi'nin tespit çözünürlüğünde)
         self.target_x = 320
         self.target_y = 240
+        self.target_source_size = (640, 480)
+        self.pan_angle: Optional[float] = None
+        self.tilt_angle: Optional[float] = None
         
         # UI referansları
         self.camera_container = None
-        self.camera_label = None
+        self.camera_view: Optional[CameraCanvasView] = None
         self.status_text = None
         self.status_icon = None
         self.record_button = None
@@ -853,6 +863,31 @@ class UpdatedCameraModule:
         self.default_frame_created = False
         self._frame_counter = 0
         
+        # Ölçekleme ve RGB dönüşümü ayrı render thread'inde yapılır
+        self.render_quality = LIVE_QUALITY
+        self.render_worker: Optional[FrameRenderWorker] = None
+        
+        # Display boyutu başına tek PhotoImage - frame'ler paste() ile basılır
+        self.photo_surface = TkPhotoSurface()
+        
+        # Tek bekleyen redraw: her zaman en yeni frame, en fazla display_max_hz
+        self.display_max_hz = 30.0
+        self.display_scheduler = DisplayScheduler(
+            parent, self._draw_rendered_frame, self.display_max_hz, on_drop=RenderedFrame.release
+        )
+        
+        # Telemetri (hedef, pan/tilt) overlay'e en yeni değerle, en fazla ekran hızında uygulanır
+        self.telemetry_scheduler = DisplayScheduler(parent, self._apply_telemetry, self.display_max_hz)
+        
+        # Snapshot/kayıt görüntülerine basılan HUD (katmanlar önbellekte)
+        self.hud = HUDCompositor(f"SKYSHIELD - AŞAMA {phase}")
+        
+        self._destroyed = False
+        
+        # Görüntü ekranda değilken (pencere simge durumunda/gizli) frame decode/render edilmez
+        self._view_visible = True
+        self._visibility_bindings = []
+        
         # Boyutlar belirlendi mi?
         self.dimensions_set = False
         self.display_width = None
@@ -874,16 +909,22 @@ class UpdatedCameraModule:
             border_color="#ffff00"
         )
         self.camera_container.pack(fill="both", expand=True, padx=5, pady=5)
-        
-        # Kamera görüntü alanı - direkt container'a yapış
-        self.camera_label = ctk.CTkLabel(
-            self.camera_container,
-            text="",
-            fg_color="#000000",
-            corner_radius=0
+        # Pencere kapanınca (veya menüye dönünce) render thread'i ve zamanlayıcılar kapatılır
+        self.camera_container.bind("<Destroy>", lambda _event: self.destroy(), add="+")
+        
+        # Simge durumuna küçültme sadece toplevel'a Unmap gönderir; toplevel bindtag'i
+        # alt widget'ların Map/Unmap olaylarını da kapsar
+        toplevel = self.camera_container.winfo_toplevel()
+        for sequence in ("<Unmap>", "<Map>"):
+            funcid = toplevel.bind(sequence, self._on_view_visibility_changed, add="+")
+            self._visibility_bindings.append((toplevel, sequence, funcid))
+        
+        # Kamera görüntü alanı - frame image item'ı + kalıcı overlay item'ları
+        # Boyut display boyutları hesaplanınca ayarlanır
+        self.camera_view = CameraCanvasView(
+            self.camera_container, 1, 1, source_size=self.target_source_size
         )
-        # İlk boyut ayarı - sonra pack
-        self.camera_label.pack(fill="both", expand=True, padx=2, pady=2)
+        self.camera_view.pack(fill="both", expand=True, padx=2, pady=2)
         
         # Alt durum çubuğu
         self._create_status_bar()
@@ -899,7 +940,7 @@ class UpdatedCameraModule:
 
     def _calculate_display_dimensions(self):
         """Görüntü boyutlarını hesapla"""
-        if self.dimensions_set:
+        if self.dimensions_set or self._destroyed:
             return
             
         # Container'ın gerçek boyutlarını al
@@ -924,6 +965,19 @@ class UpdatedCameraModule:
         self.dimensions_set = True
         print(f"[CAMERA MODULE] Display boyutları: {self.display_width}x{self.display_height}")
         
+        # Canvas ve overlay'leri display boyutuna yerleştir
+        self.camera_view.resize(self.display_width, self.display_height)
+        self._draw_target_indicator()
+        
+        # Stream client gösterilenden fazla piksel decode etmesin
+        self.app.set_camera_consumer_size("camera_view", self.display_width, self.display_height)
+        
+        # Render worker'ı display boyutunda başlat
+        self.render_worker = FrameRenderWorker(
+            self._on_frame_rendered, (self.display_width, self.display_height), self.render_quality
+        )
+        self.render_worker.start()
+        
         # Default frame'i bu boyutlarda oluştur
         self._create_default_frame()
 
@@ -990,8 +1044,7 @@ class UpdatedCameraModule:
             
             # PhotoImage oluştur ve göster
             self.current_frame = ImageTk.PhotoImage(img)
-            self.camera_label.configure(image=self.current_frame)
-            self.camera_label.image = self.current_frame
+            self.camera_view.set_image(self.current_frame)
             
             self.default_frame_created = True
             
@@ -1001,34 +1054,12 @@ class UpdatedCameraModule:
 
 
     def _draw_target_indicator(self):
-        """Hedef göstergesini çiz"""
-        if not hasattr(self, 'targeting_canvas'):
+        """Hedef göstergesini ve pan/tilt okumasını overlay item'larına uygula"""
+        if not self.camera_view or not self.dimensions_set:
             return
-            
-        canvas = self.targeting_canvas
-        
-        # Önceki hedef göstergelerini temizle
-        canvas.delete("target")
-        
-        # Hedef noktası
-        canvas.create_oval(
-            self.target_x - 10, self.target_y - 10,
-            self.target_x + 10, self.target_y + 10,
-            outline="#ff0000", width=2, tags="target"
-        )
         
-        # Hedef kilidi çerçevesi
-        if self.target_locked:
-            canvas.create_rectangle(
-                self.target_x - 30, self.target_y - 30,
-                self.target_x + 30, self.target_y + 30,
-                outline="#ff0000", width=2, tags="target"
-            )
-            canvas.create_text(
-                self.target_x, self.target_y - 40,
-                text="LOCKED", fill="#ff0000", 
-                font=("Arial", 10, "bold"), tags="target"
-            )
+        self.camera_view.update_target(self.target_x, self.target_y, self.target_locked)
+        self.camera_view.update_readout(self.pan_angle, self.tilt_angle)
     
     # UpdatedCameraModule için basit tam ekran çözümü
 
@@ -1039,49 +1070,95 @@ class UpdatedCameraModule:
             if not self.dimensions_set or not self.display_width or not self.display_height:
                 return
                 
-            if not hasattr(self, 'camera_label') or not self.camera_label:
+            if not self.camera_view:
                 return
-                
-            if isinstance(frame_data, np.ndarray):
-                # NumPy array'i PIL Image'a çevir
-                pil_image = Image.fromarray(frame_data)
-                
-                # Tam olarak display boyutlarına sığdır
-                pil_image = pil_image.resize(
-                    (self.display_width, self.display_height), 
-                    Image.Resampling.LANCZOS
-                )
-                
-                # Tkinter PhotoImage'a çevir
-                photo_image = ImageTk.PhotoImage(pil_image)
-                
-                # Label'ı güncelle (thread-safe)
-                def update_label():
-                    try:
-                        if self.camera_label and self.camera_label.winfo_exists():
-                            self.camera_label.configure(image=photo_image)
-                            self.camera_label.image = photo_image
-                            self.current_frame = photo_image
-                    except:
-                        pass
-                
-                # Main thread'de güncelle
-                if self.parent.winfo_exists():
-                    self.parent.after(0, update_label)
-                
-                # Frame sayacı
-                self._frame_counter += 1
+            
+            # Kamera durdurulduysa frame decode edilmeden bırakılır
+            if not self.camera_active:
+                return
+            
+            if self.render_worker is None:
+                return
+            
+            # Görüntü ekranda değil - decode/ölçekleme yapılmaz
+            if not self._view_visible:
+                return
+            
+            # Decode + ölçekleme render thread'inde - stream thread'i beklemez
+            if isinstance(frame_data, Frame):
+                self.render_worker.submit(frame_data)
                 
         except Exception as e:
             if self._frame_counter % 100 == 0:  # Her 100 frame'de bir hata logla
                 print(f"[CAMERA MODULE] Frame işleme hatası: {e}")
+    
+    def _on_view_visibility_changed(self, _event=None):
+        """Tk thread'i: pencere/görüntü Map-Unmap - görünür değilken render aboneliği durur"""
+        if self._destroyed or not self.camera_view or not self.camera_view.winfo_exists():
+            return
+        visible = bool(self.camera_view.winfo_viewable())
+        if visible == self._view_visible:
+            return
+        self._view_visible = visible
+        if visible:
+            print("[CAMERA MODULE] Görüntü tekrar görünür - render devam ediyor")
+        else:
+            print("[CAMERA MODULE] Görüntü gizlendi - render duraklatıldı")
+    
+    def _unbind_visibility(self):
+        """Toplevel'a eklenen Map/Unmap binding'lerini (diğer binding'lere dokunmadan) kaldır"""
+        bindings, self._visibility_bindings = self._visibility_bindings, []
+        for widget, sequence, funcid in bindings:
+            try:
+                script = widget.bind(sequence)
+                kept = [line for line in script.split("\n") if funcid not in line]
+                widget.bind(sequence, "\n".join(kept))
+                widget.deletecommand(funcid)
+            except tk.TclError:
+                # Toplevel zaten yok edildi
+                pass
+    
+    def _on_frame_rendered(self, rendered: RenderedFrame):
+        """Render thread'i: ekran boyutunda RGB buffer hazır"""
+        # Main thread'de güncelle - bekleyen redraw varsa sadece frame değişir
+        self.display_scheduler.submit(rendered)
+        
+        # Frame sayacı
+        self._frame_counter += 1
+    
+    def _draw_rendered_frame(self, rendered: RenderedFrame):
+        """Tk thread'i: en yeni render edilmiş frame'i label'a bas"""
+        try:
+            if not self.camera_active:
+                return
+            if self.camera_view and self.camera_view.winfo_exists():
+                photo_image, _ = self.photo_surface.update(rendered.pixels)
+                # Image item'ı sadece görüntü nesnesi değiştiyse (ilk frame, boyut, default frame) ayarlanır
+                if self.current_frame is not photo_image:
+                    self.camera_view.set_image(photo_image)
+                    self.current_frame = photo_image
+                self.app.report_frame_displayed(rendered.seq)
+        finally:
+            rendered.release()
+    
+    def set_display_rate(self, max_hz: float):
+        """Ekran güncelleme hız sınırı (ör. 30 / 60 Hz)"""
+        self.display_max_hz = max_hz
+        self.display_scheduler.set_max_hz(max_hz)
+        self.telemetry_scheduler.set_max_hz(max_hz)
+    
+    def set_render_quality(self, quality: str):
+        """Canlı görüntü ölçekleme kalitesi: 'nearest', 'bilinear', 'area' veya 'lanczos'"""
+        self.render_quality = validate_render_quality(quality)
+        if self.render_worker is not None:
+            self.render_worker.set_quality(quality)
 
     def _update_frame_safe(self, photo_image):
         """Thread-safe frame güncelleme"""
         try:
-            if hasattr(self, 'camera_label') and self.camera_label:
-                self.camera_label.configure(image=photo_image)
-                self.camera_label.image = photo_image
+            if self.camera_view:
+                self.camera_view.set_image(photo_image)
+                self.current_frame = photo_image
         except:
             pass
     
@@ -1111,15 +1188,29 @@ class UpdatedCameraModule:
             print(f"[CAMERA MODULE] Bağlantı durumu güncelleme hatası: {e}")
     
     def _on_data_updated(self, data):
-        """Veri güncellendiğinde GUI modüllerini güncelle"""
+        """Veri güncellendiğinde overlay'i güncelle (Tk thread'ine tek bekleyen güncelleme olarak)"""
         try:
-            # Threading hatalarını önlemek için kontrol
-            pass
+            if data:
+                self.telemetry_scheduler.submit(data)
             
         except Exception as e:
             # Threading hatalarını bastır
             pass
     
+    def _apply_telemetry(self, data):
+        """Tk thread'i: en yeni telemetriyi overlay item'larına uygula"""
+        if 'target_x' in data and data['target_x'] is not None:
+            self.target_x = data['target_x']
+        if 'target_y' in data and data['target_y'] is not None:
+            self.target_y = data['target_y']
+        if 'target_locked' in data:
+            self.target_locked = bool(data['target_locked'])
+        if data.get('pan_angle') is not None:
+            self.pan_angle = float(data['pan_angle'])
+        if data.get('tilt_angle') is not None:
+            self.tilt_angle = float(data['tilt_angle'])
+        self._draw_target_indicator()
+    
     def _create_status_bar(self):
         """Alt durum çubuğu"""
         status_frame = ctk.CTkFrame(
@@ -1269,7 +1360,7 @@ class UpdatedCameraModule:
             timestamp = time.strftime("%Y%m%d_%H%M%S")
             filename = f"screenshots/skyshield_snapshot_{timestamp}.png"
             
-            success = self.app.save_current_frame(filename)
+            success = self.app.save_current_frame(filename, overlay=self.burn_hud)
             
             if success:
                 # AppController'a log ekle
@@ -1296,6 +1387,16 @@ class UpdatedCameraModule:
             if hasattr(self.app, 'add_log'):
                 self.app.add_log(f"❌ Snapshot hatası: {e}", "ERROR")
     
+    def burn_hud(self, pixels: np.ndarray) -> np.ndarray:
+        """HUD'u (nişangah, ızgara, aşama bandı, telemetri) RGB frame'e yerinde bas"""
+        height, width = pixels.shape[:2]
+        pan = f"{self.pan_angle:+.1f}°" if self.pan_angle is not None else "--"
+        tilt = f"{self.tilt_angle:+.1f}°" if self.tilt_angle is not None else "--"
+        self.hud.set_text('telemetry', f"PAN {pan}  TILT {tilt}", (10, height - 28))
+        self.hud.set_text('lock', "LOCKED" if self.target_locked else "", (10, height - 52))
+        self.hud.set_text('time', time.strftime("%Y-%m-%d %H:%M:%S"), (width - 190, height - 28))
+        return self.hud.composite(pixels)
+    
     def _toggle_target_lock(self):
         """Hedef kilidi aç/kapat"""
         # AppController'a komut gönder
@@ -1312,11 +1413,9 @@ class UpdatedCameraModule:
         """Kamera modülünü durdur"""
         self.camera_active = False
         
-        # Targeting canvas'ını temizle
-        if hasattr(self, 'targeting_canvas'):
-            self.targeting_canvas.delete("all")
-            self.targeting_canvas.create_text(250, 175, text="KAMERA DURDURULDU", 
-                                            fill="#ff0000", font=("Arial", 20, "bold"))
+        # Görüntünün üzerine durum mesajı
+        if self.camera_view:
+            self.camera_view.show_message("KAMERA DURDURULDU")
         
         # Durum güncelle
         self.status_text.configure(text="SİSTEM DURUMU: Durduruldu")
@@ -1327,6 +1426,8 @@ class UpdatedCameraModule:
     def restart_camera(self):
         """Kamera modülünü yeniden başlat"""
         self.camera_active = True
+        if self.camera_view:
+            self.camera_view.show_message(None)
            
         # Durum güncelle
         self.status_text.configure(text="SİSTEM DURUMU: Hazır")
@@ -1334,6 +1435,27 @@ class UpdatedCameraModule:
         
         print("[CAMERA MODULE] Kamera yeniden başlatıldı")
     
+    def destroy(self):
+        """Modülü kapat - render thread'i durur, bekleyen redraw'lar bırakılır"""
+        if self._destroyed:
+            return
+        self._destroyed = True
+        self.camera_active = False
+        
+        worker, self.render_worker = self.render_worker, None
+        if worker is not None:
+            worker.stop()
+        self.display_scheduler.close()
+        self.telemetry_scheduler.close()
+        self._unbind_visibility()
+        self.photo_surface.clear()
+        self.current_frame = None
+        
+        # Görüntü artık gösterilmiyor - decode boyutunu sınırlamasın
+        self.app.remove_camera_consumer_size("camera_view")
+        
+        print("[CAMERA MODULE] Kapatıldı")
+    
     def get_module_info(self) -> dict:
         """Modül bilgilerini döndür"""
         return {
@@ -1342,7 +1464,13 @@ class UpdatedCameraModule:
             'target_locked': self.target_locked,
             'target_position': {'x': self.target_x, 'y': self.target_y},
             'phase': self.phase,
-            'has_current_frame': self.current_frame is not None
+            'has_current_frame': self.current_frame is not None,
+            'view_visible': self._view_visible,
+            'render': self.render_worker.get_stats() if self.render_worker else None,
+            'photo_surface': self.photo_surface.get_stats(),
+            'display': self.display_scheduler.get_stats(),
+            'view': self.camera_view.get_stats() if self.camera_view else None,
+            'hud': self.hud.get_stats()
         }
 
 class LogModule(BaseModule):